@@ -0,0 +1,177 @@
+"""
+Monthly columnar archives of daily pollen API responses.
+
+scripts/compact_s3_data.py folds a month of {date}_{period}.jsonl[.gz] files
+into one {period}/YYYY/MM/{YYYYMM}_{period}.npz archive. Each forecast period
+of each location of each day is a row; locations, period types and triggers
+are stored once in lookup tables and referenced by integer codes, so a month
+is a handful of NumPy arrays instead of ~30 objects of repeated JSON.
+
+unpack_records turns an archive back into the API-shaped records of each day,
+so analysis.utils reads compacted and loose days the same way.
+"""
+
+import io
+import json
+
+import numpy as np
+
+ARCHIVE_VERSION = 1
+
+
+def _codes(values, table):
+    """Integer code of each value, adding unseen values to `table`."""
+    index = {value: i for i, value in enumerate(table)}
+    codes = []
+    for value in values:
+        if value not in index:
+            index[value] = len(table)
+            table.append(value)
+        codes.append(index[value])
+    return codes
+
+
+def pack_records(period, days):
+    """Serialize one month of `period` responses as a compressed .npz.
+
+    Args:
+        period: forecast period the records were fetched for
+        days: iterable of (YYYYMMDD, list of API records), one per day
+
+    Returns:
+        bytes of the archive
+    """
+    locations, types, triggers = [], [], []
+    record_cols = {"day": [], "location": [], "forecast_date": [], "source": []}
+    period_cols = {"period": [], "type": [], "index": []}
+    trigger_offsets, trigger_codes, has_triggers = [0], [], []
+    period_offsets = [0]
+    day_list = []
+
+    for day, records in days:
+        day_list.append(day)
+        for record in records:
+            location = record["Location"]
+            key = (
+                location["ZIP"],
+                location["City"],
+                location["State"],
+                location.get("DisplayLocation", ""),
+            )
+            record_cols["day"].append(day)
+            record_cols["location"].extend(_codes([key], locations))
+            record_cols["forecast_date"].append(record.get("ForecastDate", ""))
+            record_cols["source"].append(record.get("Source", ""))
+
+            for p in location["periods"]:
+                period_cols["period"].append(p["Period"])
+                period_cols["type"].extend(
+                    _codes([p["Type"]], types) if "Type" in p else [-1]
+                )
+                index = p["Index"]
+                period_cols["index"].append(np.nan if index is None else index)
+                has_triggers.append("Triggers" in p)
+                keys = [
+                    (t["LGID"], t["Name"], t["Genus"], t["PlantType"])
+                    for t in p.get("Triggers") or []
+                ]
+                trigger_codes.extend(_codes(keys, triggers))
+                trigger_offsets.append(len(trigger_codes))
+            period_offsets.append(len(period_cols["period"]))
+
+    arrays = {
+        "version": np.array(ARCHIVE_VERSION),
+        "period_name": np.array(period),
+        "days": np.array(day_list, dtype="U8"),
+        "record_day": np.array(record_cols["day"], dtype="U8"),
+        "record_location": np.array(record_cols["location"], dtype=np.int32),
+        "record_forecast_date": np.array(record_cols["forecast_date"], dtype=str),
+        "record_source": np.array(record_cols["source"], dtype=str),
+        "period_offsets": np.array(period_offsets, dtype=np.int64),
+        "period": np.array(period_cols["period"], dtype=str),
+        "type": np.array(period_cols["type"], dtype=np.int16),
+        "index": np.array(period_cols["index"], dtype=np.float64),
+        "has_triggers": np.array(has_triggers, dtype=bool),
+        "trigger_offsets": np.array(trigger_offsets, dtype=np.int64),
+        "trigger": np.array(trigger_codes, dtype=np.int32),
+        "types": np.array(types, dtype=str),
+        "locations": np.array(locations, dtype=str).reshape(-1, 4),
+        "trigger_lgid": np.array([t[0] for t in triggers], dtype=np.int64),
+        "triggers": np.array([t[1:] for t in triggers], dtype=str).reshape(-1, 3),
+    }
+    buffer = io.BytesIO()
+    np.savez_compressed(buffer, **arrays)
+    return buffer.getvalue()
+
+
+def load_archive(data):
+    """Arrays of an archive from its bytes."""
+    with np.load(io.BytesIO(data), allow_pickle=False) as archive:
+        arrays = {name: archive[name] for name in archive.files}
+    if int(arrays["version"]) != ARCHIVE_VERSION:
+        raise ValueError(f"Unsupported archive version: {arrays['version']}")
+    return arrays
+
+
+def unpack_records(arrays, days=None, triggers=True):
+    """Yield (YYYYMMDD, records) for each archived day, optionally only `days`.
+
+    Periods' Triggers are left out unless `triggers`.
+    """
+    locations = arrays["locations"].tolist()
+    types = arrays["types"].tolist()
+    trigger_table = [
+        {"LGID": lgid, "Name": name, "Genus": genus, "PlantType": plant_type}
+        for lgid, (name, genus, plant_type) in zip(
+            arrays["trigger_lgid"].tolist(), arrays["triggers"].tolist()
+        )
+    ]
+    record_day = arrays["record_day"]
+    record_location = arrays["record_location"].tolist()
+    period_offsets = arrays["period_offsets"]
+    trigger_offsets = arrays["trigger_offsets"]
+    period = arrays["period"].tolist()
+    type_codes = arrays["type"].tolist()
+    index = arrays["index"].tolist()
+    has_triggers = arrays["has_triggers"].tolist()
+    trigger_codes = arrays["trigger"].tolist()
+
+    for day in arrays["days"].tolist():
+        if days is not None and day not in days:
+            continue
+        records = []
+        for r in np.flatnonzero(record_day == day).tolist():
+            zip_code, city, state, display = locations[record_location[r]]
+            periods = []
+            for p in range(period_offsets[r], period_offsets[r + 1]):
+                entry = {}
+                if triggers and has_triggers[p]:
+                    codes = trigger_codes[trigger_offsets[p] : trigger_offsets[p + 1]]
+                    entry["Triggers"] = [dict(trigger_table[t]) for t in codes]
+                entry["Period"] = period[p]
+                if type_codes[p] >= 0:
+                    entry["Type"] = types[type_codes[p]]
+                entry["Index"] = None if index[p] != index[p] else index[p]
+                periods.append(entry)
+
+            location = {
+                "ZIP": zip_code,
+                "City": city,
+                "State": state,
+                "periods": periods,
+            }
+            if display:
+                location["DisplayLocation"] = display
+            record = {"Type": "pollen"}
+            if arrays["record_forecast_date"][r]:
+                record["ForecastDate"] = str(arrays["record_forecast_date"][r])
+            record["Location"] = location
+            if arrays["record_source"][r]:
+                record["Source"] = str(arrays["record_source"][r])
+            records.append(record)
+        yield day, records
+
+
+def records_match(a, b):
+    """Whether two lists of records are equal once serialized."""
+    return json.dumps(a, sort_keys=True) == json.dumps(b, sort_keys=True)
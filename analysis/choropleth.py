@@ -8,17 +8,16 @@ import geopandas as gpd
 import matplotlib.animation as animation
 import matplotlib.pyplot as plt
 import numpy as np
-import pandas as pd
 from shapely.geometry import Point
 from tqdm import tqdm
 
+from analysis.locations import get_registry
 from analysis.utils import (
+    PollenCube,
     create_interpolation_grid,
-    get_coordinates_dict,
     interpolate_spatial_values,
     interpolate_timeseries,
-    load_data,
-    smooth_timeseries,
+    load_cube,
 )
 
 
@@ -28,7 +27,7 @@ def parse_args():
         "--data_directory",
         type=str,
         default="s3_data",
-        help="Directory with current pollen forecasts over the date range",
+        help="Directory or s3://bucket URL with pollen forecasts over the date range",
     )
     parser.add_argument(
         "--output_directory",
@@ -100,38 +99,26 @@ def smooth_pollen_data(pollen_df, smooth_method):
     # Create a copy of the input DataFrame to avoid modifying the original
     result_df = pollen_df.copy()
 
-    # Initialize new column for smoothed values
-    result_df["smoothed_index"] = float("nan")
+    # Each location's series is one row of the cube, smoothed all at once
+    cube = PollenCube.from_frame(pollen_df).smooth(smooth_method)
 
-    # Get unique locations
-    locations = pollen_df["location"].unique()
-
-    # Process each location separately
-    for loc in locations:
-        # Get data for this location
-        loc_data = pollen_df[pollen_df["location"] == loc]
-
-        # Get the smoothed values for this location's time series
-        smoothed_values = smooth_timeseries(loc_data["index"], smooth_method)
-
-        # Update the smoothed values in the result DataFrame at the correct indices
-        result_df.loc[loc_data.index, "smoothed_index"] = smoothed_values
+    # Look up each row's smoothed value by its (location, date) cell
+    result_df["smoothed_index"] = cube.values[cube.cells(pollen_df)]
     result_df["index"] = result_df["smoothed_index"]
 
     return result_df
 
 
-def process_data(pollen_data, coords_dict):
+def process_data(pollen_data, registry):
     """Process data file and return a dict of date -> pollen values for all locations."""
     date_data = defaultdict(list)
 
-    for _, row in pollen_data.iterrows():
-        city_state = row["location"]
-        value = row["index"]
-
-        if city_state in coords_dict and not pd.isna(value):
-            lat, lon = coords_dict[city_state]
-            date_data[row["date"]].append((lat, lon, value))
+    lat, lon = registry.coordinates(registry.ids(pollen_data["location"]))
+    keep = ~np.isnan(lat) & pollen_data["index"].notna().to_numpy()
+    for date, *values in zip(
+        pollen_data["date"][keep], lat[keep], lon[keep], pollen_data["index"][keep]
+    ):
+        date_data[date].append(tuple(values))
 
     return date_data
 
@@ -284,8 +271,9 @@ def create_animation(
 
 def main(args):
     # Load data
-    coords_dict = get_coordinates_dict()
-    pollen_data = load_data(args.data_directory)
+    registry = get_registry()
+    cube = load_cube(args.data_directory, args.start_date, args.end_date)
+    pollen_data = cube.to_frame()
 
     # Apply temporal interpolation to fill gaps
     pollen_data = interpolate_timeseries(
@@ -297,7 +285,7 @@ def main(args):
         pollen_data = smooth_pollen_data(pollen_data, args.smooth_method)
 
     # Process data for visualization
-    date_data = process_data(pollen_data, coords_dict)
+    date_data = process_data(pollen_data, registry)
 
     create_animation(
         date_data,
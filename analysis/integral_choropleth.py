@@ -1,6 +1,5 @@
 import argparse
 import os
-from collections import defaultdict
 
 import cartopy.crs as ccrs
 import cartopy.feature as cfeature
@@ -9,12 +8,13 @@ import matplotlib.pyplot as plt
 import numpy as np
 from shapely.geometry import Point
 
+from analysis.locations import get_registry
 from analysis.utils import (
     create_interpolation_grid,
-    get_coordinates_dict,
     interpolate_spatial_values,
-    interpolate_timeseries,
-    load_data,
+    iter_records,
+    load_cube,
+    running_integral,
 )
 
 
@@ -24,7 +24,7 @@ def parse_args():
         "--data_directory",
         type=str,
         default="s3_data",
-        help="Directory with current pollen forecasts over the date range",
+        help="Directory or s3://bucket URL with pollen forecasts over the date range",
     )
     parser.add_argument(
         "--output_directory",
@@ -50,6 +50,12 @@ def parse_args():
         default="nn",
         help="Interpolation method: nn (nearest neighbor), linear, rbf, or cloughtocher",
     )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Sum current forecasts batch by batch in bounded memory instead of "
+        "loading the whole location x date cube (no historic backfill)",
+    )
     parser.add_argument(
         "--format",
         choices=["jpeg", "png"],
@@ -74,27 +80,11 @@ def create_masked_plot(lon_mesh, lat_mesh, z_mesh, usa_geom):
     return z_mesh * mask
 
 
-def process_data(pollen_data, coords_dict):
-    """Process data file and return summed pollen values for all locations."""
-    location_sums = defaultdict(float)
-    location_coords = {}
-
-    for _, row in pollen_data.iterrows():
-        city_state = row["location"]
-        value = row["index"]
-
-        if city_state in coords_dict:
-            lat, lon = coords_dict[city_state]
-            location_coords[city_state] = (lat, lon)
-            location_sums[city_state] += value
-
-    # Convert to list of (lat, lon, sum_value) tuples
-    summed_data = []
-    for loc, coords in location_coords.items():
-        lat, lon = coords
-        summed_data.append((lat, lon, location_sums[loc]))
-
-    return summed_data
+def process_data(locations, totals, registry):
+    """Return (lat, lon, total) for each of `locations` with known coordinates."""
+    lat, lon = registry.coordinates(registry.ids(locations))
+    located = ~np.isnan(lat)
+    return list(zip(lat[located], lon[located], np.asarray(totals)[located]))
 
 
 def create_map(
@@ -178,11 +168,20 @@ def create_map(
 
 
 def main(args):
-    coords_dict = get_coordinates_dict()
-    pollen_data = load_data(args.data_directory)
-    pollen_data = interpolate_timeseries(pollen_data, method="linear")
-
-    summed_data = process_data(pollen_data, coords_dict)
+    registry = get_registry()
+    if args.stream:
+        batches = iter_records(
+            args.data_directory,
+            "current",
+            args.start_date,
+            args.end_date,
+            triggers=False,
+        )
+        totals = running_integral(batches)
+        summed_data = process_data(totals.index, totals.to_numpy(), registry)
+    else:
+        cube = load_cube(args.data_directory, args.start_date, args.end_date)
+        summed_data = process_data(cube.locations, cube.integral(), registry)
 
     create_map(
         summed_data,
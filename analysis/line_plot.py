@@ -1,22 +1,22 @@
 import matplotlib.pyplot as plt
 import pandas as pd
 
-from analysis.utils import load_data, smooth_timeseries
+from analysis.utils import load_cube, smooth_timeseries
 
 
-def plot_pollen_trends(df, location=None, smooth_method=None, smooth_params=None):
-    """Create a line plot of pollen trends by location."""
+def plot_pollen_trends(cube, location=None, smooth_method=None, smooth_params=None):
+    """Create a line plot of pollen trends by location from a PollenCube."""
     plt.figure(figsize=(12, 6))
 
     if location is not None:
         locations = [location]
     else:
-        locations = sorted(df["location"].unique())
+        locations = cube.locations
 
     for location in locations:
-        location_data = df[df["location"] == location]
-        dates = pd.to_datetime(location_data["date"])
-        indices = location_data["index"]
+        dates, values = cube.observed(location)
+        dates = pd.to_datetime(dates)
+        indices = pd.Series(values, dtype=float)
 
         # Plot raw data
         plt.plot(
@@ -38,7 +38,7 @@ def plot_pollen_trends(df, location=None, smooth_method=None, smooth_params=None
                 label=f"{location} ({smooth_method})",
             )
 
-    print(len(location_data))
+    print(len(indices))
 
     plt.xlabel("Date")
     plt.ylabel("Pollen Index")
@@ -69,7 +69,8 @@ def main():
     # smooth_params = {'window': 5}
 
     # Load data
-    df = load_data(data_directory)
+    cube = load_cube(data_directory)
+    df = cube.to_frame()
 
     # Print some basic statistics
     print("\nData Summary:")
@@ -78,7 +79,7 @@ def main():
     print("\nLocations:", sorted(df["location"].unique()))
 
     # Create visualization
-    plot_pollen_trends(df, location, smooth_method, smooth_params)
+    plot_pollen_trends(cube, location, smooth_method, smooth_params)
     plt.show()
 
     return df
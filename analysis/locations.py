@@ -0,0 +1,173 @@
+"""
+Pollen.com locations with stable integer IDs.
+
+Forecast records name a location "CITY, ST", the map API keys it by station
+code, collated.csv and data/station_coords.json label it "City State" and
+get_coordinates_dict holds its coordinates. LocationRegistry reads
+lambda_src/map_augmented.json once and keeps all of these as arrays indexed by
+location ID, so joining data to names or coordinates is array indexing:
+
+    registry = get_registry()
+    ids = registry.ids(df["location"])
+    lat, lon = registry.coordinates(ids)
+"""
+
+import json
+import os
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+MAP_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "lambda_src",
+    "map_augmented.json",
+)
+
+# State abbreviation to full name mapping
+STATE_NAMES = {
+    "AL": "Alabama",
+    "AK": "Alaska",
+    "AZ": "Arizona",
+    "AR": "Arkansas",
+    "CA": "California",
+    "CO": "Colorado",
+    "CT": "Connecticut",
+    "DE": "Delaware",
+    "FL": "Florida",
+    "GA": "Georgia",
+    "HI": "Hawaii",
+    "ID": "Idaho",
+    "IL": "Illinois",
+    "IN": "Indiana",
+    "IA": "Iowa",
+    "KS": "Kansas",
+    "KY": "Kentucky",
+    "LA": "Louisiana",
+    "ME": "Maine",
+    "MD": "Maryland",
+    "MA": "Massachusetts",
+    "MI": "Michigan",
+    "MN": "Minnesota",
+    "MS": "Mississippi",
+    "MO": "Missouri",
+    "MT": "Montana",
+    "NE": "Nebraska",
+    "NV": "Nevada",
+    "NH": "New Hampshire",
+    "NJ": "New Jersey",
+    "NM": "New Mexico",
+    "NY": "New York",
+    "NC": "North Carolina",
+    "ND": "North Dakota",
+    "OH": "Ohio",
+    "OK": "Oklahoma",
+    "OR": "Oregon",
+    "PA": "Pennsylvania",
+    "RI": "Rhode Island",
+    "SC": "South Carolina",
+    "SD": "South Dakota",
+    "TN": "Tennessee",
+    "TX": "Texas",
+    "UT": "Utah",
+    "VT": "Vermont",
+    "VA": "Virginia",
+    "WA": "Washington",
+    "WV": "West Virginia",
+    "WI": "Wisconsin",
+    "WY": "Wyoming",
+    "DC": "District of Columbia",
+}
+
+
+def location_label(name):
+    """Label of a "CITY, ST" name in collated.csv, e.g. "Aberdeen South Dakota"."""
+    city, state = name.split(",")
+    state = state.strip()
+
+    # Properly capitalize city (handle multi-word cities)
+    city = " ".join(word.capitalize() for word in city.lower().split())
+
+    return f"{city} {STATE_NAMES.get(state, state)}"
+
+
+class LocationRegistry:
+    """Every location as columns indexed by integer location ID.
+
+    IDs are positions in map_augmented.json, the order the Lambda fetches
+    locations in, so they stay the same while that file does. Columns:
+    keys (map station code), names ("CITY, ST" as in forecast records),
+    cities, states, state_names, zips, display_names, labels ("City State")
+    and lat/lon (NaN where no coordinates are known).
+    """
+
+    def __init__(self, locations, coordinates):
+        self.keys = np.array([loc["key"] for loc in locations], dtype=str)
+        self.cities = np.array([loc["ForecastCity"] for loc in locations], dtype=str)
+        self.states = np.array([loc["State"] for loc in locations], dtype=str)
+        self.names = np.char.add(np.char.add(self.cities, ", "), self.states)
+        self.state_names = np.array(
+            [STATE_NAMES.get(state, state) for state in self.states.tolist()], dtype=str
+        )
+        self.zips = np.array([loc["ZIP"] for loc in locations], dtype=str)
+        self.display_names = np.array(
+            [loc["ForecastDisplayLocation"] for loc in locations], dtype=str
+        )
+        self.labels = np.array(
+            [location_label(name) for name in self.names.tolist()], dtype=str
+        )
+
+        # Coordinates are keyed by forecast name, or by the map's own city name
+        self.lat = np.full(len(locations), np.nan)
+        self.lon = np.full(len(locations), np.nan)
+        for i, loc in enumerate(locations):
+            for name in [self.names[i], f"{loc['City'].upper()}, {loc['State']}"]:
+                if name in coordinates:
+                    self.lat[i], self.lon[i] = coordinates[name]
+                    break
+
+        self._names = pd.Index(self.names)
+        self._keys = pd.Index(self.keys)
+
+    @classmethod
+    def from_file(cls, path=MAP_PATH):
+        # Deferred so location_label works without analysis.utils' scipy stack
+        from analysis.utils import get_coordinates_dict
+
+        with open(path, "r") as f:
+            locations = list(json.load(f)["Locations"].values())
+        return cls(locations, get_coordinates_dict())
+
+    def __len__(self):
+        return len(self.keys)
+
+    def ids(self, names):
+        """IDs of "CITY, ST" names, -1 for names not in the registry."""
+        return self._names.get_indexer(pd.Index(np.asarray(names, dtype=str)))
+
+    def ids_of_keys(self, keys):
+        """IDs of map station codes, -1 for unknown codes."""
+        return self._keys.get_indexer(pd.Index(np.asarray(keys, dtype=str)))
+
+    def coordinates(self, ids):
+        """(lat, lon) arrays of location `ids`, NaN for -1 or unknown."""
+        ids = np.asarray(ids)
+        known = ids >= 0
+        lat = np.where(known, self.lat[np.where(known, ids, 0)], np.nan)
+        lon = np.where(known, self.lon[np.where(known, ids, 0)], np.nan)
+        return lat, lon
+
+    def labels_for(self, names):
+        """collated.csv labels of "CITY, ST" names, formatting unknown ones."""
+        ids = self.ids(names)
+        return [
+            self.labels[i] if i >= 0 else location_label(name)
+            for i, name in zip(ids.tolist(), names)
+        ]
+
+
+@lru_cache(maxsize=None)
+def get_registry(path=MAP_PATH):
+    """LocationRegistry of map_augmented.json, loaded once per process."""
+    return LocationRegistry.from_file(path)
@@ -0,0 +1,363 @@
+"""
+Where pollen data files are read from.
+
+Analysis reads daily {date}_{period}.jsonl[.gz] files either from a local
+directory (e.g. one synced by scripts/download_s3_data.py) or straight from the
+S3 bucket the Lambda writes to. Both backends list files by period and date
+range, find monthly archives written by scripts/compact_s3_data.py and open
+files as text or bytes; S3Storage fetches concurrently and keeps a
+read-through cache on disk so repeated runs only download changed objects.
+
+    storage = get_storage("s3://pollendatabucket")
+    storage = get_storage("s3_data")
+"""
+
+import gzip
+import hashlib
+import io
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+PERIODS = ["current", "extended", "historic", "historic_delta"]
+# Basename of a daily object in either the flat or the partitioned layout
+DATED_KEY = re.compile(r"^(\d{8})_(\w+?)\.jsonl(\.gz)?$")
+# Basename of a monthly archive of one period, see analysis/archive.py
+ARCHIVE_KEY = re.compile(r"^(\d{6})_(\w+?)\.npz$")
+
+
+def parse_key(key):
+    """(YYYYMMDD, period) of a daily object key, or None for other objects."""
+    match = DATED_KEY.match(os.path.basename(key))
+    return match.group(1, 2) if match else None
+
+
+def parse_archive_key(key):
+    """(YYYYMM, period) of a monthly archive key, or None for other objects."""
+    match = ARCHIVE_KEY.match(os.path.basename(key))
+    return match.group(1, 2) if match else None
+
+
+def archive_key(period, month):
+    """Key of the `period` archive for YYYYMM `month`."""
+    return f"{period}/{month[:4]}/{month[4:6]}/{month}_{period}.npz"
+
+
+def months(start, end):
+    """(YYYY, MM) strings for every month from YYYYMMDD `start` to `end`."""
+    year, month = int(start[:4]), int(start[4:6])
+    while f"{year:04d}{month:02d}" <= end[:6]:
+        yield f"{year:04d}", f"{month:02d}"
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def listing_prefixes(periods, start, end):
+    """S3 prefixes covering `periods` between `start` and `end`, in both layouts.
+
+    Flat keys are {date}_{period}.jsonl[.gz], so a month is the prefix YYYYMM;
+    partitioned keys live under {period}/YYYY/MM/. Without a start date the
+    whole bucket is listed.
+    """
+    if start is None:
+        return [""]
+
+    prefixes = []
+    for year, month in months(start, end):
+        prefixes.append(f"{year}{month}")
+        prefixes.extend(f"{period}/{year}/{month}/" for period in periods)
+    return prefixes
+
+
+def in_range(day, start=None, end=None):
+    """Whether YYYYMMDD `day` falls within the optional [start, end] bounds."""
+    return (start is None or start <= day) and (end is None or day <= end)
+
+
+def compact_date(value):
+    """YYYYMMDD from YYYY-MM-DD or YYYYMMDD; None passes through."""
+    return value.replace("-", "") if value else None
+
+
+def latest_by_day(keys):
+    """Keys sorted by date with one file per (date, period).
+
+    A day may exist both compressed and uncompressed, or in both layouts;
+    the first key seen wins.
+    """
+    files = {}
+    for key in keys:
+        files.setdefault(os.path.basename(key).split(".")[0], key)
+    return [files[name] for name in sorted(files)]
+
+
+def select_daily(keys, period, start=None, end=None):
+    """Date-sorted daily keys of `period` within [start, end]."""
+    selected = []
+    for key in keys:
+        parsed = parse_key(key)
+        if parsed and parsed[1] == period and in_range(parsed[0], start, end):
+            selected.append(key)
+    # Prefer an uncompressed copy of a day if both exist
+    return latest_by_day(sorted(selected, key=lambda k: k.endswith(".gz")))
+
+
+def select_archives(keys, period, start=None, end=None):
+    """Month-sorted archive keys of `period` overlapping [start, end]."""
+    selected = []
+    for key in keys:
+        parsed = parse_archive_key(key)
+        if parsed and parsed[1] == period:
+            month = parsed[0]
+            if in_range(month, start and start[:6], end and end[:6]):
+                selected.append(key)
+    return sorted(selected, key=os.path.basename)
+
+
+def open_jsonl(file_path):
+    """Open a .jsonl or gzip-compressed .jsonl.gz file for reading lines."""
+    if str(file_path).endswith(".gz"):
+        return gzip.open(file_path, "rt")
+    return open(file_path, "r")
+
+
+class LocalStorage:
+    """Daily files under a local directory, in either key layout."""
+
+    def __init__(self, root="s3_data", max_workers=4):
+        self.root = root
+        self.max_workers = max_workers
+        self._keys = None
+
+    def __getstate__(self):
+        # Worker processes never list, so don't ship the listing to them
+        return dict(self.__dict__, _keys=None)
+
+    def _list(self):
+        """Every file under the root, walked once and reused until a write."""
+        if self._keys is None:
+            self._keys = [
+                os.path.relpath(os.path.join(dirpath, name), self.root)
+                for dirpath, _, filenames in os.walk(self.root)
+                for name in filenames
+            ]
+        return self._keys
+
+    def find(self, period, start_date=None, end_date=None):
+        """Date-sorted keys of `period` files, relative to the root."""
+        start, end = compact_date(start_date), compact_date(end_date)
+        return select_daily(self._list(), period, start, end)
+
+    def find_archives(self, period, start_date=None, end_date=None):
+        """Month-sorted keys of `period` archives overlapping the date range."""
+        start, end = compact_date(start_date), compact_date(end_date)
+        return select_archives(self._list(), period, start, end)
+
+    def open(self, key):
+        return open_jsonl(os.path.join(self.root, key))
+
+    def read_bytes(self, key):
+        with open(os.path.join(self.root, key), "rb") as f:
+            return f.read()
+
+    def write_bytes(self, key, data):
+        path = os.path.join(self.root, key)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(f"{path}.tmp", "wb") as f:
+            f.write(data)
+        os.replace(f"{path}.tmp", path)
+        self._keys = None
+
+    def delete(self, key):
+        os.remove(os.path.join(self.root, key))
+        self._keys = None
+
+    def fingerprint(self, key):
+        """Cheap change marker for `key`: its size and modification time."""
+        stat = os.stat(os.path.join(self.root, key))
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+    def content_hash(self, key):
+        """SHA-1 of the file, to tell a touched file from a changed one."""
+        digest = hashlib.sha1()
+        with open(os.path.join(self.root, key), "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def local_cache_path(self, name):
+        """Where to keep derived data about this storage, e.g. parsed rows."""
+        return os.path.join(self.root, ".rows_cache", name)
+
+    def map(self, fn, keys):
+        """fn(key) for every key, in order."""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(fn, keys))
+
+
+class S3Storage:
+    """Daily objects read straight from S3, with an optional on-disk cache.
+
+    Cached copies are keyed by object ETag, so a rewritten object is fetched
+    again while unchanged ones are read locally. With cache_dir=None objects
+    are streamed and parsed without touching the disk.
+    """
+
+    def __init__(
+        self, bucket, prefix="", cache_dir="s3_cache", max_workers=16, s3_client=None
+    ):
+        self.bucket = bucket
+        self.prefix = prefix.strip("/") + "/" if prefix.strip("/") else ""
+        self.cache_dir = cache_dir
+        self.max_workers = max_workers
+        self._s3 = s3_client
+        self._etags = {}
+        self._listings = {}  # listing prefix -> keys
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # Picklable for worker processes, which create their own client
+        state = dict(self.__dict__, _s3=None, _listings={})
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state, _lock=threading.Lock())
+
+    @property
+    def s3(self):
+        if self._s3 is None:
+            import boto3
+
+            self._s3 = boto3.client("s3")
+        return self._s3
+
+    def _list(self, period, start, end):
+        """Keys under the listing prefixes of the range, each listed only once.
+
+        Once the whole bucket has been listed, that listing serves every range.
+        """
+        if "" in self._listings:
+            return self._listings[""]
+        if start is not None and end is None:
+            # Nothing is stored for future days; don't list months up to 9999
+            end = date.today().strftime("%Y%m%d")
+
+        keys = []
+        for prefix in listing_prefixes([period], start, end):
+            if prefix not in self._listings:
+                self._listings[prefix] = self._list_prefix(prefix)
+            keys.extend(self._listings[prefix])
+        return keys
+
+    def _list_prefix(self, prefix):
+        paginator = self.s3.get_paginator("list_objects_v2")
+        keys = []
+        pages = paginator.paginate(Bucket=self.bucket, Prefix=self.prefix + prefix)
+        for page in pages:
+            for obj in page.get("Contents", []):
+                key = obj["Key"][len(self.prefix) :]
+                with self._lock:
+                    self._etags[key] = obj["ETag"]
+                keys.append(key)
+        return keys
+
+    def find(self, period, start_date=None, end_date=None):
+        """Date-sorted keys of `period` objects, relative to the prefix."""
+        start, end = compact_date(start_date), compact_date(end_date)
+        return select_daily(self._list(period, start, end), period, start, end)
+
+    def find_archives(self, period, start_date=None, end_date=None):
+        """Month-sorted keys of `period` archives overlapping the date range."""
+        start, end = compact_date(start_date), compact_date(end_date)
+        return select_archives(self._list(period, start, end), period, start, end)
+
+    def _etag(self, key):
+        with self._lock:
+            if key in self._etags:
+                return self._etags[key]
+        head = self.s3.head_object(Bucket=self.bucket, Key=self.prefix + key)
+        etag = head["ETag"]
+        with self._lock:
+            self._etags[key] = etag
+        return etag
+
+    def _cached_path(self, key):
+        """Local copy of `key`, downloading it if missing or stale."""
+        path = os.path.join(self.cache_dir, key)
+        etag = self._etag(key)
+        try:
+            with open(f"{path}.etag", "r") as f:
+                if f.read() == etag:
+                    return path
+        except FileNotFoundError:
+            pass
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        self.s3.download_file(self.bucket, self.prefix + key, tmp)
+        os.replace(tmp, path)
+        with open(f"{path}.etag", "w") as f:
+            f.write(etag)
+        return path
+
+    def open(self, key):
+        if self.cache_dir is not None:
+            return open_jsonl(self._cached_path(key))
+
+        body = self.s3.get_object(Bucket=self.bucket, Key=self.prefix + key)["Body"]
+        if key.endswith(".gz"):
+            body = gzip.GzipFile(fileobj=body)
+        return io.TextIOWrapper(body, encoding="utf-8")
+
+    def read_bytes(self, key):
+        if self.cache_dir is not None:
+            with open(self._cached_path(key), "rb") as f:
+                return f.read()
+        return self.s3.get_object(Bucket=self.bucket, Key=self.prefix + key)[
+            "Body"
+        ].read()
+
+    def write_bytes(self, key, data):
+        response = self.s3.put_object(
+            Bucket=self.bucket, Key=self.prefix + key, Body=data
+        )
+        with self._lock:
+            self._etags[key] = response["ETag"]
+            self._listings.clear()
+
+    def delete(self, key):
+        self.s3.delete_object(Bucket=self.bucket, Key=self.prefix + key)
+        with self._lock:
+            self._etags.pop(key, None)
+            self._listings.clear()
+
+    def fingerprint(self, key):
+        """The object's ETag, which changes whenever it is rewritten."""
+        return self._etag(key)
+
+    def content_hash(self, key):
+        return self._etag(key)
+
+    def local_cache_path(self, name):
+        """Where to keep derived data about this bucket; None without a cache."""
+        if self.cache_dir is None:
+            return None
+        return os.path.join(self.cache_dir, ".rows_cache", self.prefix, name)
+
+    def map(self, fn, keys):
+        """fn(key) for every key, in order, fetching concurrently."""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(fn, keys))
+
+
+def get_storage(source="s3_data"):
+    """Storage for a local directory, an s3://bucket[/prefix] URL or a storage."""
+    if not isinstance(source, (str, os.PathLike)):
+        return source
+    source = str(source)
+    if source.startswith("s3://"):
+        bucket, _, prefix = source[len("s3://") :].partition("/")
+        return S3Storage(bucket, prefix)
+    return LocalStorage(source)
@@ -1,11 +1,14 @@
-import glob
+import hashlib
 import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
-from filterpy.kalman import KalmanFilter
 from scipy.interpolate import (
     CloughTocher2DInterpolator,
     LinearNDInterpolator,
@@ -15,113 +18,1086 @@ from scipy.interpolate import (
 from scipy.signal import savgol_filter
 from statsmodels.nonparametric.smoothers_lowess import lowess
 
+from analysis.archive import load_archive, unpack_records
+from analysis.storage import (
+    LocalStorage,
+    compact_date,
+    get_storage,
+    in_range,
+    open_jsonl,
+    parse_archive_key,
+    parse_key,
+)
+
 ### DATA MUNGING
 
 
-def read_historic_data_file(file_path):
-    """Read a single JSONL file and extract historical pollen data."""
-    data = []
+def find_data_files(data_dir, period):
+    """Date-sorted paths of all `period` files under data_dir.
+
+    Finds compressed and uncompressed files in both the flat
+    {date}_{period}.jsonl layout and the partitioned {period}/YYYY/MM/ one.
+    """
+    keys = LocalStorage(data_dir).find(period)
+    return [os.path.join(data_dir, key) for key in keys]
+
+
+# A period's list of trigger objects, which contain no nested lists
+TRIGGERS = re.compile(r'"Triggers":\s*\[[^\]]*\]\s*,?\s*')
+
+
+def decode_without_triggers(line):
+    """API record of one JSONL line, leaving out the periods' Triggers.
+
+    Trigger lists are most of the bytes of a current file, so they are cut out
+    of the text before it is parsed. Lines the cut leaves invalid, such as
+    ones with Triggers as a period's last key, are parsed whole instead.
+    """
+    if '"Triggers"' not in line:
+        return json.loads(line)
+    try:
+        return json.loads(TRIGGERS.sub("", line))
+    except json.JSONDecodeError:
+        record = json.loads(line)
+        for period in record.get("Location", {}).get("periods", []):
+            period.pop("Triggers", None)
+        return record
+
 
-    with open(file_path, "r") as f:
-        for line in f:
-            record = json.loads(line)
-            location = record["Location"]
-
-            # Process all periods in the location data
-            for period in location["periods"]:
-                period_date = period["Period"].split("T")[0]  # Extract date part
-
-                data.append(
-                    {
-                        "date": period_date,
-                        "location": f"{location['City']}, {location['State']}",
-                        "index": period["Index"],
-                    }
+def record_decoder(triggers=True):
+    """Function decoding one JSONL line into an API record."""
+    return json.loads if triggers else decode_without_triggers
+
+
+def read_records(storage, key, triggers=True):
+    """API records of one loose daily file (see record_decoder).
+
+    Only current files have Triggers; other periods are always decoded in
+    full, which is faster than looking for trigger lists that are not there.
+    """
+    decode = record_decoder(triggers or parse_key(key)[1] != "current")
+    with storage.open(key) as f:
+        return [decode(line) for line in f]
+
+
+def iter_daily_records(data_dir, period, start_date=None, end_date=None, triggers=True):
+    """Yield (YYYYMMDD, records) for each stored day of `period`, in date order.
+
+    Reads loose daily files and monthly archives from scripts/compact_s3_data.py
+    alike; a loose file wins over an archived copy of the same day. Loose files
+    are fetched concurrently, a batch at a time. Periods' Triggers are left
+    out unless `triggers`.
+    """
+    storage = get_storage(data_dir)
+    start, end = compact_date(start_date), compact_date(end_date)
+    loose = {parse_key(key)[0]: key for key in storage.find(period, start, end)}
+    archives = {
+        parse_archive_key(key)[0]: key
+        for key in storage.find_archives(period, start, end)
+    }
+
+    for month in sorted({day[:6] for day in loose} | set(archives)):
+        month_days = sorted(day for day in loose if day.startswith(month))
+        archived = {}
+        if month in archives:
+            arrays = load_archive(storage.read_bytes(archives[month]))
+            wanted = {
+                day
+                for day in arrays["days"].tolist()
+                if day not in loose and in_range(day, start, end)
+            }
+            archived = dict(unpack_records(arrays, wanted, triggers))
+
+        days = sorted(month_days + list(archived))
+        for i in range(0, len(days), storage.max_workers):
+            chunk = days[i : i + storage.max_workers]
+            keys = [loose[day] for day in chunk if day in loose]
+            fetched = dict(
+                zip(
+                    keys,
+                    storage.map(
+                        partial(read_records, storage, triggers=triggers), keys
+                    ),
                 )
+            )
+            for day in chunk:
+                yield day, fetched[loose[day]] if day in loose else archived[day]
+
+
+def historic_rows(records):
+    """Extract historical pollen data from historic API records."""
+    data = []
+
+    for record in records:
+        location = record["Location"]
+
+        # Process all periods in the location data
+        for period in location["periods"]:
+            period_date = period["Period"].split("T")[0]  # Extract date part
+
+            data.append(
+                {
+                    "date": period_date,
+                    "location": f"{location['City']}, {location['State']}",
+                    "index": period["Index"],
+                }
+            )
     return data
 
 
-def read_current_forecast_file(file_path):
-    """Read a single JSONL file and extract today's pollen data."""
+def read_historic_data_file(file_path, storage=None):
+    """Read a single JSONL file and extract historical pollen data.
+
+    `file_path` is a local path, or a key of `storage` when one is given.
+    """
+    with storage.open(file_path) if storage else open_jsonl(file_path) as f:
+        return historic_rows(json.loads(line) for line in f)
+
+
+def read_historic_manifest(data_dir="s3_data"):
+    """Manifest of historic delta snapshots written with HISTORIC_MODE=delta."""
+    with get_storage(data_dir).open("historic_manifest.json") as f:
+        return json.load(f)
+
+
+def rebuild_historic_snapshot(data_dir, date):
+    """Rebuild full historic records from delta snapshots.
+
+    Replays the deltas listed in the manifest up to `date` (YYYYMMDD), latest
+    value winning, and cuts each location back to its recorded window.
+    Returns records shaped like the historic API response of the latest
+    snapshot on or before `date`.
+    """
+    storage = get_storage(data_dir)
+    snapshots = read_historic_manifest(storage)["snapshots"]
+    known = {}  # ZIP -> {period date: period}
+    records = []
+
+    for snapshot_date in sorted(snapshots):
+        if snapshot_date > date:
+            break
+        with storage.open(snapshots[snapshot_date]["key"]) as f:
+            records = [json.loads(line) for line in f]
+        for record in records:
+            periods = known.setdefault(record["Location"]["ZIP"], {})
+            for period in record["Location"]["periods"]:
+                periods[period["Period"].split("T")[0]] = period
+
+    rebuilt = []
+    for record in records:
+        location = dict(record["Location"])
+        start = location.pop("WindowStart")
+        end = location.pop("WindowEnd")
+        periods = known[location["ZIP"]]
+        location["periods"] = [
+            {k: v for k, v in periods[d].items() if k != "PreviousIndex"}
+            for d in sorted(periods)
+            if start is not None and start <= d <= end
+        ]
+        rebuilt.append(dict(record, Location=location))
+    return rebuilt
+
+
+def load_historic_revisions(data_dir="s3_data"):
+    """Periods whose index changed between historic delta snapshots."""
+    storage = get_storage(data_dir)
+    snapshots = read_historic_manifest(storage)["snapshots"]
+    data = []
+
+    for snapshot_date in sorted(snapshots):
+        with storage.open(snapshots[snapshot_date]["key"]) as f:
+            for line in f:
+                location = json.loads(line)["Location"]
+                for period in location["periods"]:
+                    if "PreviousIndex" in period:
+                        data.append(
+                            {
+                                "snapshot": snapshot_date,
+                                "date": period["Period"].split("T")[0],
+                                "location": f"{location['City']}, {location['State']}",
+                                "previous_index": period["PreviousIndex"],
+                                "index": period["Index"],
+                            }
+                        )
+    return pd.DataFrame(data)
+
+
+def current_rows(records, date_str):
+    """Extract today's pollen data from the current API records of YYYYMMDD."""
     data = []
-    date_str = Path(file_path).stem.split("_")[0]
     file_date = datetime.strptime(date_str, "%Y%m%d").strftime("%Y-%m-%d")
 
-    with open(file_path, "r") as f:
-        for line in f:
-            record = json.loads(line)
-            location = record["Location"]
+    for record in records:
+        location = record["Location"]
 
-            # Find the "Today" period
-            today_data = next(
-                (p for p in location["periods"] if p["Type"] == "Today"), None
+        # Find the "Today" period
+        today_data = next(
+            (p for p in location["periods"] if p["Type"] == "Today"), None
+        )
+
+        if today_data:
+            data.append(
+                {
+                    "date": file_date,
+                    "location": f"{location['City']}, {location['State']}",
+                    "index": today_data["Index"],
+                }
             )
+    return data
+
+
+def read_current_forecast_file(file_path, storage=None):
+    """Read a single JSONL file and extract today's pollen data.
+
+    `file_path` is a local path, or a key of `storage` when one is given.
+    """
+    date_str = Path(file_path).stem.split("_")[0]
+    with storage.open(file_path) if storage else open_jsonl(file_path) as f:
+        records = (decode_without_triggers(line) for line in f)
+        return current_rows(records, date_str)
+
+
+# Date offset of the relative periods in current files, whose Period is 0001-01-01
+TYPE_OFFSETS = {"Yesterday": -1, "Today": 0, "Tomorrow": 1}
+
+
+def _empty_batch():
+    return {
+        name: []
+        for name in ["period", "day", "date", "offset", "location", "type", "index"]
+    } | {"trigger_offsets": [0], "trigger": []}
+
+
+def _add_records(batch, period, day, records):
+    """Append one row per forecast period of `records` to a batch of lists."""
+    file_day = f"{day[:4]}-{day[4:6]}-{day[6:]}"
+    for record in records:
+        location = record["Location"]
+        name = f"{location['City']}, {location['State']}"
+        for p in location["periods"]:
+            date = p["Period"].split("T")[0]
+            kind = p.get("Type", "")
+            relative = date.startswith("0001")
+            batch["period"].append(period)
+            batch["day"].append(file_day)
+            batch["date"].append(file_day if relative else date)
+            batch["offset"].append(TYPE_OFFSETS.get(kind, 0) if relative else 0)
+            batch["location"].append(name)
+            batch["type"].append(kind)
+            batch["index"].append(np.nan if p["Index"] is None else p["Index"])
+            batch["trigger"].extend(t["Name"] for t in p.get("Triggers") or [])
+            batch["trigger_offsets"].append(len(batch["trigger"]))
+
+
+def _batch_columns(batch):
+    return {
+        "period": np.array(batch["period"], dtype=str),
+        "day": np.array(batch["day"], dtype="datetime64[D]"),
+        "date": np.array(batch["date"], dtype="datetime64[D]")
+        + np.array(batch["offset"], dtype=np.int64),
+        "location": np.array(batch["location"], dtype=str),
+        "type": np.array(batch["type"], dtype=str),
+        "index": np.array(batch["index"], dtype=np.float64),
+        "trigger_offsets": np.array(batch["trigger_offsets"], dtype=np.int64),
+        "trigger": np.array(batch["trigger"], dtype=str),
+    }
+
+
+def iter_records(
+    data_dir="s3_data",
+    periods=("current",),
+    start_date=None,
+    end_date=None,
+    batch_rows=100_000,
+    triggers=True,
+):
+    """Yield stored forecasts of `periods` as batches of NumPy columns.
+
+    A batch is a dict of equal-length arrays with one row per forecast period
+    of a location in a file: period (of the file), day (the file's date),
+    date (the day the value is for), location ("CITY, ST"), type ("Today",
+    ... or "" for dated periods) and index (NaN if missing). Triggers are
+    stored CSR-style: row i's trigger names are
+    trigger[trigger_offsets[i] : trigger_offsets[i + 1]]; pass triggers=False
+    to skip decoding them.
+
+    Files are read a month at a time (see iter_daily_records) and a batch is
+    emitted every `batch_rows` rows, so memory use does not grow with the
+    amount of data stored.
+    """
+    storage = get_storage(data_dir)
+    periods = [periods] if isinstance(periods, str) else periods
+    batch = _empty_batch()
+    for period in periods:
+        days = iter_daily_records(storage, period, start_date, end_date, triggers)
+        for day, records in days:
+            _add_records(batch, period, day, records)
+            if len(batch["index"]) >= batch_rows:
+                yield _batch_columns(batch)
+                batch = _empty_batch()
+    if batch["index"]:
+        yield _batch_columns(batch)
+
+
+def count_triggers(batches, types=("Today",)):
+    """Times each trigger was named per location, over iter_records batches.
+
+    Only periods of the given `types` are counted, so each day counts once.
+    Returns a DataFrame with location, trigger and count columns.
+    """
+    counts = {}
+    for batch in batches:
+        lengths = np.diff(batch["trigger_offsets"])
+        rows = np.repeat(np.arange(len(lengths)), lengths)
+        keep = np.isin(batch["type"][rows], types)
+        pairs = pd.DataFrame(
+            {
+                "location": batch["location"][rows[keep]],
+                "trigger": batch["trigger"][keep],
+            }
+        )
+        for pair, count in pairs.value_counts().items():
+            counts[pair] = counts.get(pair, 0) + count
+
+    counts = pd.DataFrame(
+        [(*pair, count) for pair, count in counts.items()],
+        columns=["location", "trigger", "count"],
+    )
+    counts = counts.sort_values(
+        ["location", "count", "trigger"], ascending=[True, False, True]
+    )
+    return counts.reset_index(drop=True)
+
+
+def running_integral(batches):
+    """Total of each location's "Today" series over iter_records batches.
 
-            if today_data:
-                data.append(
-                    {
-                        "date": file_date,
-                        "location": f"{location['City']}, {location['State']}",
-                        "index": today_data["Index"],
-                    }
+    Matches PollenCube.integral of the same rows: gaps are filled linearly,
+    days after a location's last value up to the last day seen carry that
+    value, and days before its first are skipped. Batches must be in date
+    order, as iter_records yields them for one period; only a running total
+    and the last value of each location are kept. Returns a Series of totals
+    indexed by location, sorted.
+    """
+    last = {}  # location -> (day number, index)
+    totals = {}
+    end = None
+    for batch in batches:
+        keep = (batch["type"] == "Today") & ~np.isnan(batch["index"])
+        days = batch["date"][keep].astype("datetime64[D]").astype(np.int64)
+        for location, day, value in zip(
+            batch["location"][keep].tolist(),
+            days.tolist(),
+            batch["index"][keep].tolist(),
+        ):
+            if location not in last:
+                totals[location] = value
+            else:
+                previous_day, previous = last[location]
+                gap = day - previous_day
+                if gap < 0:
+                    continue
+                # Linear fill over previous_day+1 .. day; a repeated day replaces
+                totals[location] += gap * previous + (value - previous) * (
+                    (gap + 1) / 2 if gap else 1
                 )
-    return data
+            last[location] = (day, value)
+            end = day if end is None else max(end, day)
+
+    for location, (day, value) in last.items():
+        totals[location] += (end - day) * value
+    return pd.Series(totals, dtype=np.float64).sort_index()
+
+
+ROWS_CACHE_VERSION = 2
+ROW_COLUMNS = ["date", "location", "index"]
+
+
+def snapshot_rows(records, date_str):
+    """Extract the historic window of one historic snapshot (full or delta)."""
+    return historic_rows(records)
+
 
+def rows_to_columns(rows, date_str):
+    """Columns of the rows extracted from the YYYYMMDD file `date_str`.
 
-def load_current_forecast_data(data_dir="s3_data"):
-    """Load and combine data from all JSONL files."""
-    files = sorted(glob.glob(f"{data_dir}/*_current.jsonl"))
-    all_data = []
+    Dates are datetime64[D]; `day` records which file each row came from.
+    """
+    day = np.datetime64(f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:]}", "D")
+    return {
+        "date": np.array([row["date"] for row in rows], dtype="datetime64[D]"),
+        "day": np.full(len(rows), day),
+        "location": np.array([row["location"] for row in rows], dtype=str),
+        "index": np.array([row["index"] for row in rows], dtype=np.float64),
+    }
 
-    for file_path in files:
-        file_data = read_current_forecast_file(file_path)
-        all_data.extend(file_data)
 
-    return pd.DataFrame(all_data)
+def encode_locations(names, table):
+    """int32 codes of location `names` in `table`, adding unseen names to it."""
+    uniques, inverse = np.unique(names, return_inverse=True)
+    codes = np.array(_codes_in(uniques.tolist(), table), dtype=np.int32)
+    return codes[inverse]
 
 
-def load_data(data_dir="s3_data"):
-    """Load data including the earliest available records"""
-    file_path = sorted(glob.glob(f"{data_dir}/*_historic.jsonl"))[0]
-    early_data = pd.DataFrame(read_historic_data_file(file_path))
-    data = load_current_forecast_data(data_dir)
+def _codes_in(names, table):
+    index = {name: i for i, name in enumerate(table)}
+    for name in names:
+        if name not in index:
+            index[name] = len(table)
+            table.append(name)
+    return [index[name] for name in names]
+
+
+def read_rows_cache(path):
+    """Cached columns by source key, as written by write_rows_cache.
+
+    Locations are int32 codes into the cache's "locations" table.
+    """
+    cache = {"locations": [], "entries": {}}
+    if path is None or not os.path.exists(path):
+        return cache
+    with np.load(path, allow_pickle=False) as archive:
+        arrays = {name: archive[name] for name in archive.files}
+    if int(arrays["version"]) != ROWS_CACHE_VERSION:
+        return cache
+
+    cache["locations"] = arrays["locations"].tolist()
+    offsets = arrays["offsets"].tolist()
+    for i, (key, fingerprint, content_hash) in enumerate(
+        zip(
+            arrays["sources"].tolist(),
+            arrays["fingerprints"].tolist(),
+            arrays["hashes"].tolist(),
+        )
+    ):
+        rows = slice(offsets[i], offsets[i + 1])
+        cache["entries"][key] = {
+            "fingerprint": fingerprint,
+            "hash": content_hash,
+            **{
+                name: arrays[name][rows]
+                for name in ["date", "day", "location", "index"]
+            },
+        }
+    return cache
+
+
+def write_rows_cache(path, cache):
+    keys = sorted(cache["entries"])
+    entries = [cache["entries"][key] for key in keys]
+
+    def column(name, dtype):
+        return np.concatenate([e[name] for e in entries] or [np.array([], dtype)])
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(f"{path}.tmp", "wb") as f:
+        np.savez(
+            f,
+            version=np.array(ROWS_CACHE_VERSION),
+            sources=np.array(keys, dtype=str),
+            fingerprints=np.array([e["fingerprint"] for e in entries], dtype=str),
+            hashes=np.array([e["hash"] for e in entries], dtype=str),
+            offsets=np.cumsum([0] + [len(e["date"]) for e in entries]),
+            locations=np.array(cache["locations"], dtype=str),
+            date=column("date", "datetime64[D]"),
+            day=column("day", "datetime64[D]"),
+            location=column("location", np.int32),
+            index=column("index", np.float64),
+        )
+    os.replace(f"{path}.tmp", path)
+
+
+def parse_source(storage, extract, key):
+    """Rows of one daily file or monthly archive, as columns."""
+    parsed = parse_key(key)
+    if parsed is not None:
+        columns = rows_to_columns(
+            extract(read_records(storage, key, triggers=False), parsed[0]), parsed[0]
+        )
+    else:
+        days = [
+            rows_to_columns(extract(records, day), day)
+            for day, records in unpack_records(
+                load_archive(storage.read_bytes(key)), triggers=False
+            )
+        ]
+        columns = {
+            name: np.concatenate([d[name] for d in days])
+            for name in ["date", "day", "location", "index"]
+        }
+    columns["fingerprint"] = storage.fingerprint(key)
+    columns["hash"] = storage.content_hash(key)
+    return columns
+
+
+def parse_batch(storage, extract, keys):
+    """parse_source for each key; runs in a worker process."""
+    return [parse_source(storage, extract, key) for key in keys]
+
+
+def parse_sources(storage, extract, keys, processes=None):
+    """Columns of each source, parsed in batches across worker processes.
+
+    Workers return NumPy columns, which pickle compactly, rather than row
+    dicts. Small jobs, or processes=1, are parsed in this process. Workers
+    re-import the calling script unless the start method is fork, so scripts
+    using them keep their work under a __main__ guard.
+    """
+    processes = processes or os.cpu_count() or 1
+    if processes == 1 or len(keys) < 2 * processes:
+        return storage.map(partial(parse_source, storage, extract), keys)
+
+    # A few batches per worker keeps them busy when file sizes differ
+    size = -(-len(keys) // (4 * processes))
+    batches = [keys[i : i + size] for i in range(0, len(keys), size)]
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        parsed = executor.map(partial(parse_batch, storage, extract), batches)
+        return [columns for batch in parsed for columns in batch]
+
+
+def load_period_columns(
+    data_dir,
+    period,
+    extract,
+    start_date=None,
+    end_date=None,
+    cache=True,
+    processes=None,
+):
+    """Columns of extract(records, YYYYMMDD) rows for every stored day.
+
+    Returns (columns, locations): date and day (the file a row came from) as
+    datetime64[D], location as int32 codes into `locations`, and index, all
+    ordered by day.
+
+    Extracted rows are cached on disk per source file (see
+    storage.local_cache_path), keyed by the file's size and mtime or ETag, so
+    only new or changed files are parsed. A file whose mtime changed but whose
+    content hash did not, e.g. after a re-download, is not parsed again.
+    Files are parsed by up to `processes` worker processes (default: one per
+    CPU) and their columns concatenated once.
+    """
+    storage = get_storage(data_dir)
+    start, end = compact_date(start_date), compact_date(end_date)
+    loose = storage.find(period, start, end)
+    sources = loose + storage.find_archives(period, start, end)
+
+    path = storage.local_cache_path(f"{period}.npz") if cache else None
+    cache = read_rows_cache(path)
+    entries = cache["entries"]
+    changed = False
+    if start is None and end is None:
+        # Full listing: forget files that no longer exist
+        changed = bool(set(entries) - set(sources))
+        cache["entries"] = entries = {k: entries[k] for k in sources if k in entries}
+
+    stale = []
+    for key in sources:
+        entry = entries.get(key)
+        fingerprint = storage.fingerprint(key)
+        if entry is not None and entry["fingerprint"] != fingerprint:
+            if entry["hash"] == storage.content_hash(key):
+                entry["fingerprint"] = fingerprint
+                changed = True
+            else:
+                entry = None
+        if entry is None:
+            stale.append(key)
+
+    for key, columns in zip(stale, parse_sources(storage, extract, stale, processes)):
+        columns["location"] = encode_locations(columns["location"], cache["locations"])
+        entries[key] = columns
+        changed = True
+    if changed and path is not None:
+        write_rows_cache(path, cache)
+
+    # Archived days are dropped where a loose file exists, and clipped to range
+    names = ["date", "day", "location", "index"]
+    loose_days = np.array(
+        [f"{d[:4]}-{d[4:6]}-{d[6:]}" for d, _ in map(parse_key, loose)],
+        dtype="datetime64[D]",
+    )
+    low = np.datetime64(
+        f"{start[:4]}-{start[4:6]}-{start[6:]}" if start else "0001-01-01"
+    )
+    high = np.datetime64(f"{end[:4]}-{end[4:6]}-{end[6:]}" if end else "9999-12-31")
+    columns = [entries[key] for key in loose]
+    for key in sources[len(loose) :]:
+        days = entries[key]["day"]
+        keep = ~np.isin(days, loose_days) & (days >= low) & (days <= high)
+        columns.append({name: entries[key][name][keep] for name in names})
+
+    empty = {
+        "date": np.array([], "datetime64[D]"),
+        "day": np.array([], "datetime64[D]"),
+        "location": np.array([], np.int32),
+        "index": np.array([], np.float64),
+    }
+    merged = {
+        name: np.concatenate([c[name] for c in columns] or [empty[name]])
+        for name in names
+    }
+    if len(sources) > len(loose):
+        order = np.argsort(merged["day"], kind="stable")
+        merged = {name: values[order] for name, values in merged.items()}
+    return merged, cache["locations"]
+
+
+def load_period_rows(
+    data_dir,
+    period,
+    extract,
+    start_date=None,
+    end_date=None,
+    cache=True,
+    processes=None,
+):
+    """DataFrame of the date, location and index rows of load_period_columns."""
+    columns, locations = load_period_columns(
+        data_dir, period, extract, start_date, end_date, cache, processes
+    )
+    if not len(columns["date"]):
+        return pd.DataFrame()
+    # Few distinct dates, so format those rather than every row
+    dates, inverse = np.unique(columns["date"], return_inverse=True)
+    return pd.DataFrame(
+        {
+            "date": np.datetime_as_string(dates, unit="D")[inverse],
+            "location": np.asarray(locations, dtype=object)[columns["location"]],
+            "index": columns["index"],
+        }
+    )
+
+
+def load_current_forecast_data(
+    data_dir="s3_data", start_date=None, end_date=None, cache=True, processes=None
+):
+    """Load and combine data from all daily files and monthly archives.
+
+    `data_dir` is a local directory, an s3://bucket[/prefix] URL or a storage
+    from analysis.storage; dates (YYYY-MM-DD) limit which days are read. With
+    `cache`, rows parsed on earlier runs are reused; new files are parsed by
+    `processes` workers (see load_period_rows).
+    """
+    return load_period_rows(
+        data_dir, "current", current_rows, start_date, end_date, cache, processes
+    )
+
+
+def backfill_historic(
+    data,
+    data_dir="s3_data",
+    start_date=None,
+    end_date=None,
+    precedence="first",
+    cache=True,
+    processes=None,
+):
+    """Fill (date, location) gaps in `data` from every historic snapshot.
+
+    Each historic file repeats the previous ~30 days, so days the Lambda missed
+    or locations absent from a current file are usually in a later snapshot.
+    Rows of all full and delta snapshots come from the rows cache and are
+    resolved in one pass: with precedence="first" the earliest snapshot
+    reporting a date wins, with "latest" the most recent revision does. Only
+    cells missing from `data` are appended.
+    """
+    if precedence not in ("first", "latest"):
+        raise ValueError(f"Unknown precedence: {precedence}")
+
+    storage = get_storage(data_dir)
+    locations = []
+    parts = []
+    for period in ["historic", "historic_delta"]:
+        columns, table = load_period_columns(
+            storage, period, snapshot_rows, start_date, end_date, cache, processes
+        )
+        codes = np.array(_codes_in(table, locations), dtype=np.int32)
+        columns["location"] = codes[columns["location"]]
+        parts.append(columns)
+    rows = {name: np.concatenate([p[name] for p in parts]) for name in parts[0]}
+    rows = {name: values[~np.isnan(rows["index"])] for name, values in rows.items()}
+    if not len(rows["date"]):
+        return data
+
+    # One int64 key per (location, date); sort so the winning snapshot is first
+    order = np.argsort(rows["day"], kind="stable")
+    if precedence == "latest":
+        order = order[::-1]
+    origin = rows["date"].min()
+    if not data.empty:
+        origin = min(origin, np.datetime64(data["date"].min()))
+
+    def keys(codes, dates):
+        return (codes.astype(np.int64) << 32) + (dates - origin).astype(np.int64)
+
+    row_keys = keys(rows["location"], rows["date"])[order]
+    _, first = np.unique(row_keys, return_index=True)
+    chosen = order[first]
+
+    present = keys(
+        encode_locations(data["location"].to_numpy(dtype=str), locations),
+        data["date"].to_numpy(dtype="datetime64[D]"),
+    )
+    chosen = chosen[~np.isin(row_keys[first], present)]
+    if not len(chosen):
+        return data
+
+    chosen.sort()
+    filled = pd.DataFrame(
+        {
+            "date": np.datetime_as_string(rows["date"][chosen], unit="D"),
+            "location": np.asarray(locations, dtype=object)[rows["location"][chosen]],
+            "index": rows["index"][chosen],
+        }
+    )
+    return pd.concat([data, filled], ignore_index=True)
+
+
+def load_data(
+    data_dir="s3_data",
+    start_date=None,
+    end_date=None,
+    cache=True,
+    processes=None,
+    backfill="first",
+):
+    """Load data including the earliest available records
+
+    Gaps in the current forecasts are filled from historic snapshots (see
+    backfill_historic) unless `backfill` is None. Rows are sorted by date and
+    location and limited to dates within [start_date, end_date], although
+    historic files reach back ~30 days before their own date.
+    """
+    storage = get_storage(data_dir)
+    days = iter_daily_records(storage, "historic", start_date, end_date, triggers=False)
+    first = next(days, None)
+    days.close()
+    if first is not None:
+        early_data = pd.DataFrame(historic_rows(first[1]))
+    else:
+        # Historic data stored as deltas; the first snapshot holds a full window
+        deltas = storage.find("historic_delta", start_date, end_date)
+        early_data = pd.DataFrame(columns=["date", "location", "index"])
+        if deltas:
+            records = rebuild_historic_snapshot(storage, parse_key(deltas[0])[0])
+            early_data = pd.DataFrame(historic_rows(records))
+    data = load_current_forecast_data(storage, start_date, end_date, cache, processes)
 
     data = pd.concat([early_data, data], axis=0)
     data = data.drop_duplicates(subset=["date", "location"], keep="first")
     data = data.reset_index(drop=True)
+    if backfill:
+        data = backfill_historic(
+            data, storage, start_date, end_date, backfill, cache, processes
+        )
+    # Backfilled rows are appended after the current ones
+    data = data.sort_values(["date", "location"], kind="stable")
+    data = data.reset_index(drop=True)
+
+    start, end = compact_date(start_date), compact_date(end_date)
+    if start or end:
+        days = data["date"].str.replace("-", "")
+        in_window = (days >= start if start else True) & (days <= end if end else True)
+        data = data[in_window].reset_index(drop=True)
 
     return pd.DataFrame(data)
 
 
-### TIMESERIES SMOOTHING
+### POLLEN CUBE
+
+CUBE_MAGIC = b"POLLCUBE"
+CUBE_VERSION = 2
+
+
+class PollenCube:
+    """Pollen index as a dense location x date matrix.
 
+    Rows are integer location IDs (positions in `locations`, sorted by name)
+    and columns are consecutive days from `dates[0]`, so a location's series
+    or a day's snapshot is a single array view. `values` is float64 with NaN
+    where nothing was observed; `mask` is True where a value was.
+    """
 
-def setup_kalman():
-    """Initialize Kalman filter for pollen data smoothing."""
-    kf = KalmanFilter(dim_x=2, dim_z=1)  # state: [position, velocity]
-    dt = 1.0  # 1 day between measurements
+    def __init__(self, locations, dates, values, mask=None):
+        self.locations = list(locations)
+        self.dates = np.asarray(dates, dtype="datetime64[D]")
+        self.values = values
+        self.mask = ~np.isnan(values) if mask is None else mask
+        self.location_ids = {loc: i for i, loc in enumerate(self.locations)}
+
+    @classmethod
+    def from_frame(cls, df):
+        """Cube of a long-form DataFrame with date, location and index columns.
+
+        If a (date, location) pair appears more than once the last row wins.
+        """
+        days = pd.to_datetime(df["date"]).to_numpy().astype("datetime64[D]")
+        dates = np.arange(days.min(), days.max() + 1)
+        codes, locations = pd.factorize(df["location"], sort=True)
+        columns = (days - dates[0]).astype(np.int64)
+
+        values = np.full((len(locations), len(dates)), np.nan)
+        values[codes, columns] = df["index"].to_numpy(dtype=np.float64)
+        return cls(locations, dates, values)
+
+    def to_frame(self):
+        """Long-form DataFrame of the observed cells, by location then date."""
+        rows, columns = np.nonzero(self.mask)
+        return pd.DataFrame(
+            {
+                "date": np.datetime_as_string(self.dates[columns], unit="D"),
+                "location": np.asarray(self.locations, dtype=object)[rows],
+                "index": self.values[rows, columns],
+            }
+        )
 
-    kf.F = np.array([[1.0, dt], [0.0, 1.0]])
-    kf.H = np.array([[1.0, 0.0]])
-    kf.R = 5
-    kf.Q = np.array([[0.1, 0.0], [0.0, 0.1]])
+    def cells(self, df):
+        """(row, column) index arrays of each row of a long-form DataFrame."""
+        rows = df["location"].map(self.location_ids).to_numpy()
+        days = pd.to_datetime(df["date"]).to_numpy().astype("datetime64[D]")
+        return rows, (days - self.dates[0]).astype(np.int64)
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def date_column(self, date):
+        """Column of `date` (anything np.datetime64 accepts)."""
+        return int((np.datetime64(date, "D") - self.dates[0]).astype(np.int64))
+
+    def row(self, location):
+        """Values of one location for every day."""
+        return self.values[self.location_ids[location]]
+
+    def column(self, date):
+        """Values of every location on one day."""
+        return self.values[:, self.date_column(date)]
+
+    def observed(self, location):
+        """(dates, values) of the days `location` has data for."""
+        i = self.location_ids[location]
+        return self.dates[self.mask[i]], self.values[i, self.mask[i]]
+
+    def smooth(self, method="lowess", processes=None, **kwargs):
+        """Cube of each location's observed series smoothed (see smooth_matrix).
+
+        Values are float64 and cover the same cells as this cube.
+        """
+        values = smooth_matrix(self.values, self.mask, method, processes, **kwargs)
+        return PollenCube(self.locations, self.dates, values, self.mask)
+
+    def integral(self):
+        """Total of each location's series, with gaps filled linearly.
+
+        Equals summing interpolate_timeseries(..., method="linear"): days
+        after a location's last observation carry its last value and days
+        before its first are skipped.
+        """
+        totals = np.zeros(len(self.locations))
+        days = np.arange(self.shape[1])
+        for i in range(len(self.locations)):
+            seen = np.flatnonzero(self.mask[i])
+            if len(seen):
+                values = self.values[i, seen]
+                totals[i] = np.interp(days[seen[0] :], seen, values).sum()
+        return totals
+
+    def save(self, path, source=""):
+        """Write the cube to a versioned binary file that `open` memory-maps.
+
+        Layout: CUBE_MAGIC, a little-endian uint32 header length, a JSON
+        header (version, locations, first date, shape, `source`), then the
+        float64 values and the uint8 mask, each starting on a 64-byte boundary.
+        `source` identifies the data the cube was built from.
+        """
+        n_locations, n_dates = self.shape
+        header = {
+            "version": CUBE_VERSION,
+            "locations": self.locations,
+            "start": str(self.dates[0]) if n_dates else None,
+            "shape": [n_locations, n_dates],
+            "source": source,
+        }
+        encoded = json.dumps(header).encode("utf-8")
+        values_offset, mask_offset = _cube_offsets(len(encoded), self.shape)
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(f"{path}.tmp", "wb") as f:
+            f.write(CUBE_MAGIC)
+            f.write(len(encoded).to_bytes(4, "little"))
+            f.write(encoded)
+            f.write(b"\0" * (values_offset - f.tell()))
+            f.write(np.ascontiguousarray(self.values, dtype="<f8").tobytes())
+            f.write(b"\0" * (mask_offset - f.tell()))
+            f.write(np.ascontiguousarray(self.mask, dtype=np.uint8).tobytes())
+        os.replace(f"{path}.tmp", path)
+
+    @classmethod
+    def open(cls, path):
+        """Memory-map a cube written by `save`; arrays are read-only views.
+
+        Processes that open the same file share its pages.
+        """
+        header = read_cube_header(path)
+        if header is None:
+            raise ValueError(f"{path} is not a version {CUBE_VERSION} cube file")
+        shape = tuple(header["shape"])
+        start = np.datetime64(header["start"] or "1970-01-01", "D")
+        dates = start + np.arange(shape[1])
+        if 0 in shape:
+            values = np.empty(shape)
+            return cls(header["locations"], dates, values, np.zeros(shape, bool))
+        values_offset, mask_offset = _cube_offsets(header["length"], shape)
+        values = np.memmap(
+            path, dtype="<f8", mode="r", offset=values_offset, shape=shape
+        )
+        mask = np.memmap(
+            path, dtype=np.bool_, mode="r", offset=mask_offset, shape=shape
+        )
+        return cls(header["locations"], dates, values, mask)
+
+
+def _cube_offsets(header_length, shape):
+    """Byte offsets of the values and the mask, each 64-byte aligned."""
+
+    def align(offset):
+        return -(-offset // 64) * 64
+
+    values_offset = align(len(CUBE_MAGIC) + 4 + header_length)
+    return values_offset, align(values_offset + shape[0] * shape[1] * 8)
+
+
+def read_cube_header(path):
+    """JSON header of a cube file, or None if it is missing or another version."""
+    try:
+        with open(path, "rb") as f:
+            if f.read(len(CUBE_MAGIC)) != CUBE_MAGIC:
+                return None
+            length = int.from_bytes(f.read(4), "little")
+            header = json.loads(f.read(length))
+    except FileNotFoundError:
+        return None
+    if header.get("version") != CUBE_VERSION:
+        return None
+    return dict(header, length=length)
+
+
+def data_fingerprint(storage, start_date=None, end_date=None, backfill="first"):
+    """Digest of every source load_data reads, and its arguments."""
+    digest = hashlib.sha1(f"{start_date}:{end_date}:{backfill}".encode("utf-8"))
+    for period in ["current", "historic", "historic_delta"]:
+        sources = storage.find(period, start_date, end_date)
+        sources += storage.find_archives(period, start_date, end_date)
+        for key in sources:
+            digest.update(f"{key}:{storage.fingerprint(key)}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def load_cube(
+    data_dir="s3_data",
+    start_date=None,
+    end_date=None,
+    path=None,
+    backfill="first",
+    processes=None,
+):
+    """PollenCube of load_data(data_dir, start_date, end_date), kept on disk.
+
+    The cube is saved to `path` (default: cube.bin next to the parsed-row
+    cache) and memory-mapped by later calls while the source files and the
+    date range are unchanged, so scripts run one after another load it once.
+    `processes` is passed to load_data.
+    """
+    storage = get_storage(data_dir)
+    path = path or storage.local_cache_path("cube.bin")
+    source = data_fingerprint(storage, start_date, end_date, backfill)
+
+    header = read_cube_header(path) if path else None
+    if header is None or header["source"] != source:
+        data = load_data(
+            storage, start_date, end_date, processes=processes, backfill=backfill
+        )
+        cube = PollenCube.from_frame(data)
+        if path is None:
+            return cube
+        cube.save(path, source)
+    return PollenCube.open(path)
 
-    return kf
 
+### TIMESERIES SMOOTHING
 
-def smooth_kalman(data):
-    """Apply Kalman filter smoothing to time series."""
-    kf = setup_kalman()
-    kf.x = np.array([[data.iloc[0]], [0.0]])
-    kf.P *= 100
 
-    smoothed = []
-    for measurement in data:
-        kf.predict()
-        kf.update(measurement)
-        smoothed.append(kf.x[0, 0])
+def kalman_smooth(values, rts=False, r=5.0, q=0.1, p0=100.0):
+    """Constant-velocity Kalman filter over every row of a 2D array at once.
 
-    return np.array(smoothed)
+    Each row is one station and each column one step. The state is [level,
+    velocity] with measurement noise R=r, process noise Q=q*I and an
+    initial covariance P=p0*I. It starts at the row's first observation with
+    zero velocity, and the covariance is updated in Joseph form. NaN cells
+    are missing observations, through which the state is only predicted.
+    With `rts` a Rauch-Tung-Striebel backward pass turns the causal
+    estimates into ones that use the whole row.
+
+    Returns the level estimate of every cell from each row's first
+    observation on, NaN before it.
+    """
+    values = np.atleast_2d(np.asarray(values, dtype=np.float64))
+    n_rows, n_steps = values.shape
+    observed = ~np.isnan(values)
+    start = np.where(observed.any(axis=1), observed.argmax(axis=1), n_steps)
+
+    F = np.array([[1.0, 1.0], [0.0, 1.0]])
+    Q = q * np.eye(2)
+    x = np.zeros((n_rows, 2))
+    P = np.tile(p0 * np.eye(2), (n_rows, 1, 1))
+    xs = np.full((n_steps, n_rows, 2), np.nan)
+    Ps = np.zeros((n_steps, n_rows, 2, 2)) if rts else None
+
+    for t in range(n_steps):
+        first = start == t
+        x[first] = np.column_stack([values[first, t], np.zeros(first.sum())])
+        P[first] = p0 * np.eye(2)
+        active = start <= t
+
+        # Predict
+        x = np.where(active[:, None], x @ F.T, x)
+        P = np.where(active[:, None, None], F @ P @ F.T + Q, P)
+
+        # Update the rows observed at this step
+        seen = active & observed[:, t]
+        z = np.where(seen, values[:, t], 0.0)
+        PHT = P[:, :, 0]
+        K = PHT * (1.0 / (PHT[:, 0] + r))[:, None]
+        x_post = x + K * (z - x[:, 0])[:, None]
+        I_KH = np.zeros((n_rows, 2, 2))
+        I_KH[:, 0, 0] = 1.0 - K[:, 0]
+        I_KH[:, 1, 0] = -K[:, 1]
+        I_KH[:, 1, 1] = 1.0
+        P_post = I_KH @ P @ I_KH.transpose(0, 2, 1)
+        P_post += K[:, :, None] * r * K[:, None, :]
+        x = np.where(seen[:, None], x_post, x)
+        P = np.where(seen[:, None, None], P_post, P)
+
+        xs[t, active] = x[active]
+        if rts:
+            Ps[t] = P
+
+    if rts:
+        for t in range(n_steps - 2, -1, -1):
+            active = start <= t
+            Pp = F @ Ps[t] @ F.T + Q
+            K = Ps[t] @ F.T @ np.linalg.inv(Pp)
+            residual = xs[t + 1] - xs[t] @ F.T
+            xs[t, active] += (K @ residual[:, :, None])[active, :, 0]
+            Ps[t, active] += (K @ (Ps[t + 1] - Pp) @ K.transpose(0, 2, 1))[active]
+
+    return xs[:, :, 0].T
+
+
+def smooth_kalman(data, rts=False):
+    """Apply Kalman filter smoothing to time series (see kalman_smooth)."""
+    return kalman_smooth(np.asarray(data, dtype=np.float64), rts)[0]
 
 
 def smooth_timeseries(data, method="lowess", **kwargs):
@@ -147,12 +1123,86 @@ def smooth_timeseries(data, method="lowess", **kwargs):
         return lowess(data, np.arange(len(data)), frac=frac)[:, 1]
 
     elif method == "kalman":
-        return smooth_kalman(data)
+        return smooth_kalman(data, rts=kwargs.get("rts", False))
+
+    else:
+        raise ValueError(f"Unknown smoothing method: {method}")
+
+
+def smooth_rows(rows, method, kwargs):
+    """smooth_timeseries of each row of a 2D array; runs in a worker process."""
+    return np.array(
+        [
+            np.asarray(smooth_timeseries(pd.Series(row), method, **kwargs))
+            for row in rows
+        ]
+    ).reshape(rows.shape)
+
+
+def smooth_block(block, method, processes=None, **kwargs):
+    """Smooth each row of a 2D array as one series, like smooth_timeseries.
+
+    sma, savgol and kalman run along the date axis of the whole block at once;
+    lowess rows are split across up to `processes` worker processes (default:
+    one per CPU; 1 smooths in this process). As with parse_sources, a script
+    calling this needs a __main__ guard.
+    """
+    if method == "sma":
+        window = kwargs.get("window", 5)
+        rolled = pd.DataFrame(block.T).rolling(window=window, center=True).mean()
+        return rolled.to_numpy().T
+
+    elif method == "savgol":
+        window = kwargs.get("window", 5)
+        polyorder = kwargs.get("polyorder", 2)
+        return savgol_filter(block, window_length=window, polyorder=polyorder, axis=1)
+
+    elif method == "kalman":
+        return kalman_smooth(block, rts=kwargs.get("rts", False))
+
+    elif method == "lowess":
+        processes = processes or os.cpu_count() or 1
+        if processes == 1 or len(block) < 2 * processes:
+            return smooth_rows(block, method, kwargs)
+        chunks = np.array_split(block, processes)
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            smoothed = executor.map(
+                partial(smooth_rows, method=method, kwargs=kwargs), chunks
+            )
+            return np.concatenate(list(smoothed))
 
     else:
         raise ValueError(f"Unknown smoothing method: {method}")
 
 
+def smooth_matrix(values, mask=None, method="lowess", processes=None, **kwargs):
+    """Smooth every row of a location x date matrix in one call.
+
+    Each row's observed values (`mask`, default: not NaN) are smoothed as one
+    series, as smooth_timeseries would for that location, and written back
+    to the same cells; the rest is NaN. Rows with the same number of
+    observations are smoothed together (see smooth_block).
+
+    With method="kalman" and gaps=True rows are instead filtered day by day,
+    treating unobserved cells as missing measurements, so every cell from a
+    location's first observation on gets an estimate.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    mask = ~np.isnan(values) if mask is None else mask
+    if method == "kalman" and kwargs.get("gaps"):
+        return kalman_smooth(np.where(mask, values, np.nan), kwargs.get("rts", False))
+    smoothed = np.full(values.shape, np.nan)
+
+    lengths = mask.sum(axis=1)
+    for length in np.unique(lengths[lengths > 0]).tolist():
+        rows = np.flatnonzero(lengths == length)
+        block = values[rows][mask[rows]].reshape(len(rows), length)
+        filled = smoothed[rows]
+        filled[mask[rows]] = smooth_block(block, method, processes, **kwargs).ravel()
+        smoothed[rows] = filled
+    return smoothed
+
+
 ### MAP MUNGING
 
 
@@ -479,32 +1529,20 @@ def interpolate_timeseries(pollen_df, method="linear"):
     # Get unique locations
     locations = pollen_df["location"].unique()
 
-    # Create an empty DataFrame to store interpolated results
-    interpolated_df = pd.DataFrame()
-
-    # Process each location separately
-    for loc in locations:
-        # Filter data for this location
-        loc_data = pollen_df[pollen_df["location"] == loc].copy()
-
-        # Set date as index for easier reindexing and interpolation
-        loc_data = loc_data.set_index("date")
-
-        # Reindex to include all dates in the range
-        loc_data_full = loc_data.reindex(date_range)
-
-        # Set location for new rows
-        loc_data_full["location"] = loc
-
-        # Interpolate missing values
-        loc_data_full["index"] = loc_data_full["index"].interpolate(method=method)
-
-        # Reset index to get date as a column again
-        loc_data_full = loc_data_full.reset_index()
-        loc_data_full = loc_data_full.rename(columns={"level_0": "date"})
+    # Reindex once to every (location, date) pair, location-major
+    full_index = pd.MultiIndex.from_product(
+        [locations, date_range], names=["location", "date"]
+    )
+    interpolated_df = pollen_df.set_index(["location", "date"]).reindex(full_index)
 
-        # Append to the results
-        interpolated_df = pd.concat([interpolated_df, loc_data_full])
+    # Interpolate all locations together as the columns of a date x location matrix
+    wide = pd.DataFrame(
+        interpolated_df["index"].to_numpy().reshape(len(locations), -1).T,
+        index=date_range,
+    )
+    wide = wide.interpolate(method=method)
+    interpolated_df["index"] = wide.to_numpy().T.ravel()
 
-    interpolated_df = interpolated_df.reset_index(drop=True)
+    columns = ["date"] + [c for c in pollen_df.columns if c != "date"]
+    interpolated_df = interpolated_df.reset_index()[columns]
     return interpolated_df
@@ -0,0 +1,97 @@
+"""Per-location checkpoints that make a day's ingestion resumable.
+
+Every fetched response is stored under checkpoints/{date}/{period}/{zip}.json
+as soon as it arrives, so a failed run keeps everything it fetched. A retry
+lists those objects, fetches only the missing ZIPs and then finalizes the
+period into the day's object. Finalized periods are recorded in
+checkpoints/{date}/manifest.json so a retry skips them. Once every period is
+stored the whole checkpoints/{date}/ prefix is deleted.
+"""
+
+import json
+import threading
+
+PREFIX = "checkpoints"
+
+
+class DailyCheckpoint:
+    def __init__(self, s3, bucket, date):
+        self.s3 = s3
+        self.bucket = bucket
+        self.date = date
+        self.manifest = self._get_manifest()
+        self._completed = {}
+        self._lock = threading.Lock()
+
+    @property
+    def manifest_key(self):
+        return f"{PREFIX}/{self.date}/manifest.json"
+
+    def _prefix(self, period=None):
+        if period is None:
+            return f"{PREFIX}/{self.date}/"
+        return f"{PREFIX}/{self.date}/{period}/"
+
+    def _delete_prefix(self, prefix):
+        paginator = self.s3.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+            objects = [{"Key": obj["Key"]} for obj in page.get("Contents", [])]
+            if objects:
+                self.s3.delete_objects(Bucket=self.bucket, Delete={"Objects": objects})
+
+    def _get_manifest(self):
+        try:
+            response = self.s3.get_object(Bucket=self.bucket, Key=self.manifest_key)
+        except self.s3.exceptions.NoSuchKey:
+            return {"date": self.date, "finalized": []}
+        return json.loads(response["Body"].read())
+
+    def finalized(self, period):
+        return period in self.manifest["finalized"]
+
+    def completed(self, period):
+        """ZIPs with a stored checkpoint for `period`, listed once per run."""
+        with self._lock:
+            if period not in self._completed:
+                zips = set()
+                paginator = self.s3.get_paginator("list_objects_v2")
+                prefix = self._prefix(period)
+                for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+                    for obj in page.get("Contents", []):
+                        zips.add(obj["Key"][len(prefix) :].split(".")[0])
+                self._completed[period] = zips
+            return self._completed[period]
+
+    def fetcher(self, fetch):
+        """Wrap fetch(period, zip) to reuse stored responses and store new ones."""
+
+        def checkpointed(period, zip):
+            key = f"{self._prefix(period)}{zip}.json"
+            if zip in self.completed(period):
+                response = self.s3.get_object(Bucket=self.bucket, Key=key)
+                return json.loads(response["Body"].read())
+
+            forecast = fetch(period, zip)
+            self.s3.put_object(Bucket=self.bucket, Key=key, Body=json.dumps(forecast))
+            return forecast
+
+        return checkpointed
+
+    def finalize(self, period):
+        """Record `period` as stored and drop its per-location checkpoints."""
+        if not self.finalized(period):
+            self.manifest["finalized"].append(period)
+        self.s3.put_object(
+            Bucket=self.bucket, Key=self.manifest_key, Body=json.dumps(self.manifest)
+        )
+
+        self._delete_prefix(self._prefix(period))
+        with self._lock:
+            self._completed.pop(period, None)
+
+    def clear(self):
+        """Delete the day's manifest and any checkpoints left after a full run."""
+        self._delete_prefix(self._prefix())
+        self.manifest = {"date": self.date, "finalized": []}
+        with self._lock:
+            self._completed.clear()
@@ -0,0 +1,82 @@
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+class Hedger:
+    """Issue a duplicate of any call slower than a latency percentile.
+
+    Latencies are those passed to `record` over the current run. Once
+    `min_samples` have been recorded, a call still running after the
+    `percentile`-th latency gets a second call, and whichever finishes first
+    successfully wins. The loser is left to finish in the background.
+    """
+
+    def __init__(self, percentile=95, min_samples=20, max_workers=32):
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._latencies = []
+            self.calls = 0
+            self.hedged = 0
+            self.hedge_wins = 0
+
+    def threshold(self):
+        """Current hedging delay in seconds, or None until enough samples."""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            latencies = sorted(self._latencies)
+        rank = round(self.percentile / 100 * (len(latencies) - 1))
+        return latencies[rank]
+
+    def record(self, seconds):
+        """Add the latency of one successful request, hedged or not."""
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def call(self, fn, duplicate=None, accept=None):
+        """Result of fn(), or of duplicate() (default fn) if fn is running late.
+
+        A result only wins if accept(result) holds (default: any result), so
+        e.g. a fast 429 does not beat a slower 200. If neither call produces
+        an accepted result, the primary's result is returned, or the hedge's
+        if only the primary raised, or else the primary's error is raised.
+        """
+        accept = accept or (lambda result: True)
+        with self._lock:
+            self.calls += 1
+        threshold = self.threshold()
+        primary = self._executor.submit(fn)
+        if threshold is None or wait([primary], timeout=threshold).done:
+            return primary.result()
+
+        hedge = self._executor.submit(duplicate or fn)
+        with self._lock:
+            self.hedged += 1
+
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None and accept(future.result()):
+                    if future is hedge:
+                        with self._lock:
+                            self.hedge_wins += 1
+                    return future.result()
+        if primary.exception() is not None and hedge.exception() is None:
+            return hedge.result()
+        return primary.result()  # raises the original error if it failed
+
+    def stats(self):
+        threshold = self.threshold()
+        return {
+            "calls": self.calls,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "threshold_ms": None if threshold is None else round(threshold * 1000),
+        }
@@ -0,0 +1,101 @@
+"""Delta storage for the overlapping 30-day historic window.
+
+Each day's historic response repeats ~29 periods from the previous day. In
+delta mode only periods that are new, or whose index changed, are stored in
+{date}_historic_delta.jsonl[.gz]. Revised periods keep the superseded value
+in "PreviousIndex", and every location records the "WindowStart" and
+"WindowEnd" dates of its full window so a loader can rebuild any day's
+snapshot by replaying the deltas listed in the manifest up to that day.
+"""
+
+import json
+
+MANIFEST_KEY = "historic_manifest.json"
+STATE_KEY = "historic_state.json"
+MANIFEST_VERSION = 1
+
+
+def period_date(period):
+    return period["Period"].split("T")[0]
+
+
+def diff_snapshot(previous, forecasts):
+    """Reduce a historic snapshot to the periods that differ from `previous`.
+
+    Args:
+        previous: dict of ZIP -> {date: index} for the last stored snapshot
+        forecasts: historic API responses, one per location
+
+    Returns:
+        (deltas, state): delta records in forecast order, and the
+        ZIP -> {date: index} mapping of `forecasts` to diff the next day against
+    """
+    deltas = []
+    state = {}
+
+    for forecast in forecasts:
+        location = forecast["Location"]
+        seen = previous.get(location["ZIP"], {})
+
+        window = {}
+        periods = []
+        for period in location["periods"]:
+            date = period_date(period)
+            window[date] = period["Index"]
+            if date not in seen:
+                periods.append(period)
+            elif seen[date] != period["Index"]:
+                periods.append(dict(period, PreviousIndex=seen[date]))
+
+        dates = sorted(window)
+        deltas.append(
+            dict(
+                forecast,
+                Location=dict(
+                    location,
+                    periods=periods,
+                    WindowStart=dates[0] if dates else None,
+                    WindowEnd=dates[-1] if dates else None,
+                ),
+            )
+        )
+        state[location["ZIP"]] = window
+
+    return deltas, state
+
+
+def _get_json(s3, bucket, key, default):
+    try:
+        response = s3.get_object(Bucket=bucket, Key=key)
+    except s3.exceptions.NoSuchKey:
+        return default
+    return json.loads(response["Body"].read())
+
+
+def _put_json(s3, bucket, key, data):
+    s3.put_object(Bucket=bucket, Key=key, Body=json.dumps(data))
+
+
+def load_base(s3, bucket, date):
+    """ZIP -> {date: index} of the last snapshot stored before `date`.
+
+    A rerun on the same day diffs against the same base as the first run, so
+    the day's delta object is rewritten rather than emptied.
+    """
+    state = _get_json(s3, bucket, STATE_KEY, {})
+    if state.get("date") == date:
+        return state["base"]
+    return state.get("windows", {})
+
+
+def save_state(s3, bucket, date, base, windows):
+    _put_json(s3, bucket, STATE_KEY, {"date": date, "base": base, "windows": windows})
+
+
+def record_snapshot(s3, bucket, date, key):
+    """Add a day's delta object to the manifest."""
+    manifest = _get_json(
+        s3, bucket, MANIFEST_KEY, {"version": MANIFEST_VERSION, "snapshots": {}}
+    )
+    manifest["snapshots"][date] = {"key": key}
+    _put_json(s3, bucket, MANIFEST_KEY, manifest)
@@ -4,29 +4,169 @@ import os
 import sys
 from datetime import datetime
 
+from startup import ImportProfiler
+
+# Times every import until the first invocation finishes, for the cold-start report
+import_profiler = ImportProfiler().install()
+
 lib_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "lib")
 sys.path.append(lib_dir)
 
-import boto3
-from pollen_data import fetch_all_forecasts, format_jsonl
+import historic_delta
+from checkpoints import DailyCheckpoint
+import pollen_data
+from pollen_data import (
+    enable_hedging,
+    fetch_current_from_map,
+    fetch_forecast,
+    fetch_pipelined,
+    iter_forecasts,
+    limiter,
+)
+from s3_writer import JsonlUploader
+
+BUCKET = "pollendatabucket"
+
+logging.getLogger().setLevel(logging.INFO)
+
+# Concurrent requests per period sweep; set to 1 for strictly sequential fetching
+FETCH_WORKERS = int(os.environ.get("FETCH_WORKERS", "16"))
+# "forecast" fetches "current" per ZIP (with triggers); "map" uses one map API call
+CURRENT_SOURCE = os.environ.get("CURRENT_SOURCE", "forecast")
+# "sweep" fetches one period at a time; "pipelined" fetches all periods per location
+INGEST_MODE = os.environ.get("INGEST_MODE", "sweep")
+# "gzip" stores {date}_{period}.jsonl.gz; "none" stores plain {date}_{period}.jsonl
+COMPRESSION = os.environ.get("COMPRESSION", "gzip")
+# "full" stores each day's historic window; "delta" stores only new/revised periods
+HISTORIC_MODE = os.environ.get("HISTORIC_MODE", "full")
+# "flat" stores {date}_{period}.jsonl.gz; "partitioned" prefixes it with {period}/YYYY/MM/
+KEY_LAYOUT = os.environ.get("KEY_LAYOUT", "flat")
+# "1" checkpoints every response so a failed run can be resumed by re-invoking
+CHECKPOINTS = os.environ.get("CHECKPOINTS", "0") == "1"
+# Latency percentile after which a duplicate request is sent; 0 disables hedging
+HEDGE_PERCENTILE = float(os.environ.get("HEDGE_PERCENTILE", "0"))
+
+import_profiler.mark_init()
+
+
+_s3 = None
+
+
+def get_s3_client():
+    """S3 client, created on first use and reused across warm invocations."""
+    global _s3
+    if _s3 is None:
+        import boto3
+
+        _s3 = boto3.client("s3")
+    return _s3
+
+
+def fetch_period(period, fetch):
+    if period == "current" and CURRENT_SOURCE == "map":
+        return fetch_current_from_map(max_workers=FETCH_WORKERS, fetch=fetch)
+    return iter_forecasts(period, max_workers=FETCH_WORKERS, fetch=fetch)
+
+
+def object_key(date, period):
+    suffix = ".jsonl.gz" if COMPRESSION == "gzip" else ".jsonl"
+    key = f"{date}_{period}{suffix}"
+    if KEY_LAYOUT == "partitioned":
+        key = f"{period}/{date[:4]}/{date[4:6]}/{key}"
+    return key
+
+
+def store_forecasts(s3, date, period, forecasts):
+    """Stream forecasts into the day's S3 object as they arrive."""
+    key = object_key(date, period)
+    with JsonlUploader(s3, BUCKET, key, compress=COMPRESSION == "gzip") as uploader:
+        uploader.write_all(forecasts)
+
+
+def store_historic_delta(s3, date, forecasts):
+    """Store only the historic periods that changed since the last snapshot."""
+    base = historic_delta.load_base(s3, BUCKET, date)
+    deltas, windows = historic_delta.diff_snapshot(base, forecasts)
+
+    key = object_key(date, "historic_delta")
+    store_forecasts(s3, date, "historic_delta", deltas)
+    historic_delta.record_snapshot(s3, BUCKET, date, key)
+    historic_delta.save_state(s3, BUCKET, date, base, windows)
+
+
+def store_period(s3, date, period, forecasts):
+    if period == "historic" and HISTORIC_MODE == "delta":
+        store_historic_delta(s3, date, forecasts)
+    else:
+        store_forecasts(s3, date, period, forecasts)
+
+
+def run_date(event):
+    """YYYYMMDD the run stores data under.
+
+    An explicit "date" in the event wins, then the scheduled event's "time", so
+    a retry after midnight still resumes the day it was scheduled for.
+    """
+    event = event or {}
+    if event.get("date"):
+        return event["date"].replace("-", "")
+    if event.get("time"):
+        scheduled = datetime.fromisoformat(event["time"].replace("Z", "+00:00"))
+        return scheduled.strftime("%Y%m%d")
+    return datetime.now().strftime("%Y%m%d")
 
 
 def lambda_handler(event, context):
-    date = datetime.now().strftime("%Y%m%d")
+    date = run_date(event)
     periods = ["current", "extended", "historic"]
 
+    # Don't let a throttled earlier run slow this one down in a warm container
+    limiter.reset()
+    if HEDGE_PERCENTILE > 0:
+        enable_hedging(HEDGE_PERCENTILE)
+
     try:
-        for period in periods:
-            forecasts = fetch_all_forecasts(period)
+        s3 = get_s3_client()
+
+        checkpoint = DailyCheckpoint(s3, BUCKET, date) if CHECKPOINTS else None
+        if checkpoint is not None:
+            fetch = checkpoint.fetcher(fetch_forecast)
+            periods = [p for p in periods if not checkpoint.finalized(p)]
+        else:
+            fetch = fetch_forecast
+
+        def finish(period, forecasts):
+            store_period(s3, date, period, forecasts)
+            if checkpoint is not None:
+                checkpoint.finalize(period)
 
-            s3 = boto3.client("s3")
-            s3.put_object(
-                Bucket="pollendatabucket",
-                Key=f"{date}_{period}.jsonl",
-                Body=format_jsonl(forecasts),
-            )
+        if INGEST_MODE == "pipelined":
+            if "current" in periods and CURRENT_SOURCE == "map":
+                finish("current", fetch_period("current", fetch))
+                periods.remove("current")
+            fetch_pipelined(periods, finish, max_workers=FETCH_WORKERS, fetch=fetch)
+        else:
+            # Keep going after a failed period so a retry has less to refetch
+            failed = []
+            for period in periods:
+                try:
+                    finish(period, fetch_period(period, fetch))
+                except Exception as e:
+                    logging.error(f"Failed to store {period}: {e}")
+                    failed.append(period)
+            if failed:
+                raise RuntimeError(f"Periods not stored: {', '.join(failed)}")
 
+        if checkpoint is not None:
+            checkpoint.clear()
         return {"statusCode": 200, "body": json.dumps("Data stored successfully")}
     except Exception as e:
         logging.error(f"An error occurred: {e}")
         return {"statusCode": 500, "body": json.dumps("An error occurred")}
+    finally:
+        logging.info(f"pollen.com limiter: {limiter.stats()}")
+        if pollen_data.hedger is not None:
+            logging.info(f"pollen.com hedging: {pollen_data.hedger.stats()}")
+        if import_profiler.elapsed is None:
+            import_profiler.uninstall()
+            logging.info(import_profiler.report())
@@ -1,15 +0,0 @@
-# PYTHON_ARGCOMPLETE_OK
-# encoding: utf-8
-"""Terminal-based IPython entry point.
-"""
-# -----------------------------------------------------------------------------
-#  Copyright (c) 2012, IPython Development Team.
-#
-#  Distributed under the terms of the Modified BSD License.
-#
-#  The full license is in the file COPYING.txt, distributed with this software.
-# -----------------------------------------------------------------------------
-
-from IPython import start_ipython
-
-start_ipython()
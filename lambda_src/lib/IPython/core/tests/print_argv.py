@@ -1,3 +0,0 @@
-import sys
-
-print(sys.argv[1:])
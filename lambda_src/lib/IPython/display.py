@@ -1,44 +0,0 @@
-"""Public API for display tools in IPython.
-"""
-
-# -----------------------------------------------------------------------------
-#       Copyright (C) 2012 The IPython Development Team
-#
-#  Distributed under the terms of the BSD License.  The full license is in
-#  the file COPYING, distributed as part of this software.
-# -----------------------------------------------------------------------------
-
-# -----------------------------------------------------------------------------
-# Imports
-# -----------------------------------------------------------------------------
-
-from IPython.core.display_functions import *
-from IPython.core.display import (
-    display_pretty as display_pretty,
-    display_html as display_html,
-    display_markdown as display_markdown,
-    display_svg as display_svg,
-    display_png as display_png,
-    display_jpeg as display_jpeg,
-    display_latex as display_latex,
-    display_json as display_json,
-    display_javascript as display_javascript,
-    display_pdf as display_pdf,
-    DisplayObject as DisplayObject,
-    TextDisplayObject as TextDisplayObject,
-    Pretty as Pretty,
-    HTML as HTML,
-    Markdown as Markdown,
-    Math as Math,
-    Latex as Latex,
-    SVG as SVG,
-    ProgressBar as ProgressBar,
-    JSON as JSON,
-    GeoJSON as GeoJSON,
-    Javascript as Javascript,
-    Image as Image,
-    set_matplotlib_formats as set_matplotlib_formats,
-    set_matplotlib_close as set_matplotlib_close,
-    Video as Video,
-)
-from IPython.lib.display import *
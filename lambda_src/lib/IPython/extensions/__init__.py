@@ -1,2 +0,0 @@
-# -*- coding: utf-8 -*-
-"""This directory is meant for IPython extensions."""
@@ -1,7 +0,0 @@
-"""
-This package contains all third-party modules bundled with IPython.
-"""
-
-from typing import List
-
-__all__: List[str] = []
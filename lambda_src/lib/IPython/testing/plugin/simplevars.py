@@ -1,2 +0,0 @@
-x = 1
-print("x is:", x)
@@ -1,10 +0,0 @@
-# encoding: utf-8
-__docformat__ = "restructuredtext en"
-#-------------------------------------------------------------------------------
-#       Copyright (C) 2005  Fernando Perez <fperez@colorado.edu>
-#                           Brian E Granger <ellisonbg@gmail.com>
-#                           Benjamin Ragan-Kelley <benjaminrk@gmail.com>
-#
-#  Distributed under the terms of the BSD License.  The full license is in
-#  the file COPYING, distributed as part of this software.
-#-------------------------------------------------------------------------------
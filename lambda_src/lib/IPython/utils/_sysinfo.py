@@ -1,2 +0,0 @@
-# GENERATED BY setup.py
-commit = "49914f938"
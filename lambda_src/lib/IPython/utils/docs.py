@@ -1,3 +0,0 @@
-import os
-
-GENERATING_DOCUMENTATION = os.environ.get("IN_SPHINX_RUN", None) == "True"
@@ -1 +0,0 @@
-__version__ = "2.4.1"
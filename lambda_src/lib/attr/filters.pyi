@@ -1,6 +0,0 @@
-from typing import Any, Union
-
-from . import Attribute, _FilterType
-
-def include(*what: Union[type, str, Attribute[Any]]) -> _FilterType[Any]: ...
-def exclude(*what: Union[type, str, Attribute[Any]]) -> _FilterType[Any]: ...
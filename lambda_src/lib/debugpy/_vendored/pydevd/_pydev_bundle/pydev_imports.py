@@ -1,13 +0,0 @@
-from _pydev_bundle._pydev_saved_modules import xmlrpclib
-from _pydev_bundle._pydev_saved_modules import xmlrpcserver
-
-SimpleXMLRPCServer = xmlrpcserver.SimpleXMLRPCServer
-
-from _pydev_bundle._pydev_execfile import execfile
-
-from _pydev_bundle._pydev_saved_modules import _queue
-
-from _pydevd_bundle.pydevd_exec2 import Exec
-
-from urllib.parse import quote, quote_plus, unquote_plus  # @UnresolvedImport
-
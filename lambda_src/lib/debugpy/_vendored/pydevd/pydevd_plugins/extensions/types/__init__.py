@@ -1,2 +0,0 @@
-import pkgutil
-__path__ = pkgutil.extend_path(__path__, __name__)
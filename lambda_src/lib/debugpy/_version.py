@@ -1,21 +0,0 @@
-
-# This file was generated by 'versioneer.py' (0.23) from
-# revision-control system data, or from the parent directory name of an
-# unpacked source archive. Distribution tarballs contain a pre-generated copy
-# of this file.
-
-import json
-
-version_json = '''
-{
- "date": "2024-01-25T14:22:43-0800",
- "dirty": false,
- "error": null,
- "full-revisionid": "42853a99c4d3d4d27e4960c8894d780d4f091d68",
- "version": "1.8.1"
-}
-'''  # END VERSION_JSON
-
-
-def get_versions():
-    return json.loads(version_json)
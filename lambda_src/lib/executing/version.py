@@ -1 +0,0 @@
-__version__ = '2.0.1'
\ No newline at end of file
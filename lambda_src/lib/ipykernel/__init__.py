@@ -1,7 +0,0 @@
-from ._version import (
-    __version__,
-    kernel_protocol_version,
-    kernel_protocol_version_info,
-    version_info,
-)
-from .connect import *  # noqa: F403
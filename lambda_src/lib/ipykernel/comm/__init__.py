@@ -1,4 +0,0 @@
-__all__ = ["Comm", "CommManager"]
-
-from .comm import Comm
-from .manager import CommManager
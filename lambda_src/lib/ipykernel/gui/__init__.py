@@ -1,15 +0,0 @@
-"""GUI support for the IPython ZeroMQ kernel.
-
-This package contains the various toolkit-dependent utilities we use to enable
-coordination between the IPython kernel and the event loops of the various GUI
-toolkits.
-"""
-
-# -----------------------------------------------------------------------------
-#  Copyright (C) 2010-2011  The IPython Development Team.
-#
-#  Distributed under the terms of the BSD License.
-#
-#  The full license is in the file LICENSE, distributed as part of this
-#  software.
-# -----------------------------------------------------------------------------
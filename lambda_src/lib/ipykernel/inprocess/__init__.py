@@ -1,4 +0,0 @@
-from .blocking import BlockingInProcessKernelClient
-from .channels import InProcessChannel, InProcessHBChannel
-from .client import InProcessKernelClient
-from .manager import InProcessKernelManager
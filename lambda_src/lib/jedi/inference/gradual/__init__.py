@@ -1,4 +0,0 @@
-"""
-It is unfortunately not well documented how stubs and annotations work in Jedi.
-If somebody needs an introduction, please let me know.
-"""
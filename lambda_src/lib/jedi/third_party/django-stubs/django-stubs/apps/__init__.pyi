@@ -1,3 +0,0 @@
-from .config import AppConfig as AppConfig
-
-from .registry import apps as apps
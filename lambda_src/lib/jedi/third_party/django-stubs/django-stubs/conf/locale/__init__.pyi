@@ -1,3 +0,0 @@
-from typing import Dict, Any
-
-LANG_INFO: Dict[str, Any] = ...
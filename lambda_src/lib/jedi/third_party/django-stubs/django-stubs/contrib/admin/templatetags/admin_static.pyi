@@ -1,5 +0,0 @@
-from typing import Any
-
-register: Any
-
-def static(path: str) -> str: ...
@@ -1,4 +0,0 @@
-from django.core import validators
-
-class ASCIIUsernameValidator(validators.RegexValidator): ...
-class UnicodeUsernameValidator(validators.RegexValidator): ...
@@ -1,3 +0,0 @@
-from django.apps import AppConfig
-
-class ContentTypesConfig(AppConfig): ...
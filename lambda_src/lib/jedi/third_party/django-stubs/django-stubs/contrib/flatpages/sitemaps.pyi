@@ -1,3 +0,0 @@
-from django.contrib.sitemaps import Sitemap
-
-class FlatPageSitemap(Sitemap): ...
@@ -1,3 +0,0 @@
-from typing import Any, List
-
-urlpatterns: List[Any] = ...
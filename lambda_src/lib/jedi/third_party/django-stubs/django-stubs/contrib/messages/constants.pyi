@@ -1,11 +0,0 @@
-from typing import Dict
-
-DEBUG: int = ...
-INFO: int = ...
-SUCCESS: int = ...
-WARNING: int = ...
-ERROR: int = ...
-
-DEFAULT_TAGS: Dict[int, str] = ...
-
-DEFAULT_LEVELS: Dict[str, int] = ...
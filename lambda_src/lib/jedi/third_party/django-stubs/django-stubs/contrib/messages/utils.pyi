@@ -1,3 +0,0 @@
-from typing import Dict
-
-def get_level_tags() -> Dict[int, str]: ...
@@ -1 +0,0 @@
-class OrderableAggMixin: ...
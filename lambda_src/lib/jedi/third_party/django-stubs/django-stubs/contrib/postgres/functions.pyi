@@ -1,4 +0,0 @@
-from django.db.models import Func
-
-class RandomUUID(Func): ...
-class TransactionNow(Func): ...
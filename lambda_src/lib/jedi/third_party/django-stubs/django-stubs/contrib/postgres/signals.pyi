@@ -1,5 +0,0 @@
-from typing import Any, Tuple
-
-def get_hstore_oids(connection_alias: str) -> Tuple[Any, ...]: ...
-def get_citext_oids(connection_alias: str) -> Tuple[Any, ...]: ...
-def register_type_handlers(connection: Any, **kwargs: Any) -> None: ...
@@ -1,3 +0,0 @@
-from django.contrib.sessions.backends.base import SessionBase
-
-class SessionStore(SessionBase): ...
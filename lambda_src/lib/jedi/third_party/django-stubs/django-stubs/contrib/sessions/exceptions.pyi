@@ -1,4 +0,0 @@
-from django.core.exceptions import SuspiciousOperation
-
-class InvalidSessionKey(SuspiciousOperation): ...
-class SuspiciousSession(SuspiciousOperation): ...
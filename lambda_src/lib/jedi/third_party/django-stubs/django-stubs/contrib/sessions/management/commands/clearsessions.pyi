@@ -1,3 +0,0 @@
-from django.core.management.base import BaseCommand
-
-class Command(BaseCommand): ...
@@ -1,4 +0,0 @@
-from django.contrib.sessions.base_session import AbstractBaseSession, BaseSessionManager
-
-class SessionManager(BaseSessionManager): ...
-class Session(AbstractBaseSession): ...
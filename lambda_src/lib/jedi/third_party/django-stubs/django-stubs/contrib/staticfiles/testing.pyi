@@ -1,3 +0,0 @@
-from django.test import LiveServerTestCase
-
-class StaticLiveServerTestCase(LiveServerTestCase): ...
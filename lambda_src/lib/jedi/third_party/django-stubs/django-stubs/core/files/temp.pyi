@@ -1,5 +0,0 @@
-import tempfile
-
-NamedTemporaryFile = tempfile.NamedTemporaryFile
-
-gettempdir = tempfile.gettempdir
@@ -1,4 +0,0 @@
-from django.core.management.base import BaseCommand
-
-class ProxyModelWarning(Warning): ...
-class Command(BaseCommand): ...
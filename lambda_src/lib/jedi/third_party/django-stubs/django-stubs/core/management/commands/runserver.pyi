@@ -1,7 +0,0 @@
-from django.core.management.base import BaseCommand
-
-class Command(BaseCommand):
-    default_addr: str = ...
-    default_addr_ipv6: str = ...
-    default_port: int = ...
-    protocol: str = ...
@@ -1,3 +0,0 @@
-from django.core.handlers.wsgi import WSGIHandler
-
-def get_wsgi_application() -> WSGIHandler: ...
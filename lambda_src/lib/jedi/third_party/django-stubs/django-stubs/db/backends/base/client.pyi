@@ -1,9 +0,0 @@
-from typing import Any
-
-from django.db.backends.base.base import BaseDatabaseWrapper
-
-class BaseDatabaseClient:
-    executable_name: Any = ...
-    connection: Any = ...
-    def __init__(self, connection: BaseDatabaseWrapper) -> None: ...
-    def runshell(self) -> None: ...
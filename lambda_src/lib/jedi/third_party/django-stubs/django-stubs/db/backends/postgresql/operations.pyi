@@ -1,3 +0,0 @@
-from django.db.backends.base.operations import BaseDatabaseOperations
-
-class DatabaseOperations(BaseDatabaseOperations): ...
@@ -1,3 +0,0 @@
-from django.dispatch import Signal
-
-connection_created: Signal = ...
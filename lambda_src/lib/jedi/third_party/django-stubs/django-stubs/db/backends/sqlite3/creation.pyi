@@ -1,3 +0,0 @@
-from django.db.backends.base.creation import BaseDatabaseCreation
-
-class DatabaseCreation(BaseDatabaseCreation): ...
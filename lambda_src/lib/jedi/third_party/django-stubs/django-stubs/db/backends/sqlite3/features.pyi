@@ -1,3 +0,0 @@
-from django.db.backends.base.features import BaseDatabaseFeatures
-
-class DatabaseFeatures(BaseDatabaseFeatures): ...
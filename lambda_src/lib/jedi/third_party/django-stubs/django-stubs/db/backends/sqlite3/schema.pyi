@@ -1,3 +0,0 @@
-from django.db.backends.base.schema import BaseDatabaseSchemaEditor
-
-class DatabaseSchemaEditor(BaseDatabaseSchemaEditor): ...
@@ -1,3 +0,0 @@
-class FixDecimalInputMixin: ...
-class FixDurationInputMixin: ...
-class NumericOutputFieldMixin: ...
@@ -1 +0,0 @@
-from django.dispatch.dispatcher import Signal as Signal, receiver as receiver
@@ -1,7 +0,0 @@
-from django.http.request import HttpRequest
-from django.http.response import HttpResponseBase
-from django.utils.deprecation import MiddlewareMixin
-
-class ConditionalGetMiddleware(MiddlewareMixin):
-    def process_response(self, request: HttpRequest, response: HttpResponseBase) -> HttpResponseBase: ...
-    def needs_etag(self, response: HttpResponseBase) -> bool: ...
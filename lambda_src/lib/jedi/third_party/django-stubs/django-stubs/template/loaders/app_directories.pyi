@@ -1,3 +0,0 @@
-from .filesystem import Loader as FilesystemLoader
-
-class Loader(FilesystemLoader): ...
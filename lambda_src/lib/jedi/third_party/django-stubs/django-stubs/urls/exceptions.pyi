@@ -1,4 +0,0 @@
-from django.http import Http404
-
-class Resolver404(Http404): ...
-class NoReverseMatch(Exception): ...
@@ -1,5 +0,0 @@
-from datetime import timedelta
-
-def duration_string(duration: timedelta) -> str: ...
-def duration_iso_string(duration: timedelta) -> str: ...
-def duration_microseconds(delta: timedelta) -> int: ...
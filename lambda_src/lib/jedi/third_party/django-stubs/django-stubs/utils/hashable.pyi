@@ -1,3 +0,0 @@
-from typing import Any
-
-def make_hashable(value: Any) -> Any: ...
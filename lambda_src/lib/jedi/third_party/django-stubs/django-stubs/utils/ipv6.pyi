@@ -1,4 +0,0 @@
-from typing import Any
-
-def clean_ipv6_address(ip_str: Any, unpack_ipv4: bool = ..., error_message: Any = ...): ...
-def is_valid_ipv6_address(ip_str: str) -> bool: ...
@@ -1,3 +0,0 @@
-from typing import Any
-
-def is_iterable(x: Any) -> bool: ...
@@ -1 +0,0 @@
-from .generic.base import View as View
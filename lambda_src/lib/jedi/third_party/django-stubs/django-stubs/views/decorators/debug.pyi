@@ -1,4 +0,0 @@
-from typing import Any, Callable
-
-def sensitive_variables(*variables: Any) -> Callable: ...
-def sensitive_post_parameters(*parameters: Any) -> Callable: ...
@@ -1,10 +0,0 @@
-from typing import AnyStr, Text, Tuple, overload
-
-def getstatus(file: Text) -> str: ...
-def getoutput(cmd: Text) -> str: ...
-def getstatusoutput(cmd: Text) -> Tuple[int, str]: ...
-@overload
-def mk2arg(head: bytes, x: bytes) -> bytes: ...
-@overload
-def mk2arg(head: Text, x: Text) -> Text: ...
-def mkarg(x: AnyStr) -> AnyStr: ...
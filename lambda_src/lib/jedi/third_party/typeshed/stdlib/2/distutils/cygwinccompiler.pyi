@@ -1,4 +0,0 @@
-from distutils.unixccompiler import UnixCCompiler
-
-class CygwinCCompiler(UnixCCompiler): ...
-class Mingw32CCompiler(CygwinCCompiler): ...
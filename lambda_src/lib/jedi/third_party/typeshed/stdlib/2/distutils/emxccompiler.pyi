@@ -1,3 +0,0 @@
-from distutils.unixccompiler import UnixCCompiler
-
-class EMXCCompiler(UnixCCompiler): ...
@@ -1,3 +0,0 @@
-from distutils.ccompiler import CCompiler
-
-class UnixCCompiler(CCompiler): ...
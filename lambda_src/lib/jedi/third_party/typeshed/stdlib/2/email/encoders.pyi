@@ -1,4 +0,0 @@
-def encode_base64(msg) -> None: ...
-def encode_quopri(msg) -> None: ...
-def encode_7or8bit(msg) -> None: ...
-def encode_noop(msg) -> None: ...
@@ -1,4 +0,0 @@
-from email.mime.nonmultipart import MIMENonMultipart
-
-class MIMEMessage(MIMENonMultipart):
-    def __init__(self, _msg, _subtype=...) -> None: ...
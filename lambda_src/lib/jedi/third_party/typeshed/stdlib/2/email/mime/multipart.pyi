@@ -1,4 +0,0 @@
-from email.mime.base import MIMEBase
-
-class MIMEMultipart(MIMEBase):
-    def __init__(self, _subtype=..., boundary=..., _subparts=..., **_params) -> None: ...
@@ -1,4 +0,0 @@
-from email.mime.base import MIMEBase
-
-class MIMENonMultipart(MIMEBase):
-    def attach(self, payload): ...
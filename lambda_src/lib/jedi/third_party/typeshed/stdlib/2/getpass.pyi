@@ -1,6 +0,0 @@
-from typing import IO, Any
-
-class GetPassWarning(UserWarning): ...
-
-def getpass(prompt: str = ..., stream: IO[Any] = ...) -> str: ...
-def getuser() -> str: ...
@@ -1,5 +0,0 @@
-from typing import Dict
-
-name2codepoint: Dict[str, int]
-codepoint2name: Dict[int, str]
-entitydefs: Dict[str, str]
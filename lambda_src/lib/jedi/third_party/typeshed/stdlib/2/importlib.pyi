@@ -1,4 +0,0 @@
-import types
-from typing import Optional, Text
-
-def import_module(name: Text, package: Optional[Text] = ...) -> types.ModuleType: ...
@@ -1,5 +0,0 @@
-from hashlib import md5 as md5
-
-new = md5
-blocksize: int
-digest_size: int
@@ -1,4 +0,0 @@
-from typing import AnyStr
-
-def url2pathname(url: AnyStr) -> AnyStr: ...
-def pathname2url(p: AnyStr) -> AnyStr: ...
@@ -1,6 +0,0 @@
-from typing import Any
-
-def __getattr__(name) -> Any: ...
-
-home: str
-pythonrc: str
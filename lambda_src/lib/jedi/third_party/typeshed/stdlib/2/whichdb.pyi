@@ -1,3 +0,0 @@
-from typing import Optional, Text
-
-def whichdb(filename: Text) -> Optional[str]: ...
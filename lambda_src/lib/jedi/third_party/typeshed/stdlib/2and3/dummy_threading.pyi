@@ -1,2 +0,0 @@
-from _dummy_threading import *
-from _dummy_threading import __all__ as __all__
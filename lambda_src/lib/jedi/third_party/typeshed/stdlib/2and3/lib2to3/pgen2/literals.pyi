@@ -1,7 +0,0 @@
-from typing import Dict, Match, Text
-
-simple_escapes: Dict[Text, Text]
-
-def escape(m: Match[str]) -> Text: ...
-def evalString(s: Text) -> Text: ...
-def test() -> None: ...
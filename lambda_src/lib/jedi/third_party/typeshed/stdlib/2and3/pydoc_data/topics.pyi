@@ -1,3 +0,0 @@
-from typing import Dict
-
-topics: Dict[str, str]
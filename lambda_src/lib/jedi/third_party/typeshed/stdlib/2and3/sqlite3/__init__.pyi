@@ -1 +0,0 @@
-from sqlite3.dbapi2 import *  # noqa: F403
@@ -1,4 +0,0 @@
-from typing import Dict
-
-s: str
-d: Dict[str, str]
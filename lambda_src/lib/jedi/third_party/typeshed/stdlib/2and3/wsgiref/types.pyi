@@ -1,3 +0,0 @@
-# Obsolete, use _typeshed.wsgi directly.
-
-from _typeshed.wsgi import *
@@ -1 +0,0 @@
-import xml.parsers as parsers
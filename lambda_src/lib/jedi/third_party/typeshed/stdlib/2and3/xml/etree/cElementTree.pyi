@@ -1 +0,0 @@
-from xml.etree.ElementTree import *  # noqa: F403
@@ -1 +0,0 @@
-import xml.parsers.expat as expat
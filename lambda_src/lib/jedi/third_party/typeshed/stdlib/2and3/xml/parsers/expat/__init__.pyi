@@ -1 +0,0 @@
-from pyexpat import *
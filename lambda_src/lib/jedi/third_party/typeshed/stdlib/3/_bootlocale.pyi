@@ -1 +0,0 @@
-def getpreferredencoding(do_setlocale: bool = ...) -> str: ...
@@ -1 +0,0 @@
-from decimal import *
@@ -1,3 +0,0 @@
-# This is a slight lie, the implementations aren't exactly identical
-# However, in all likelihood, the differences are inconsequential
-from decimal import *
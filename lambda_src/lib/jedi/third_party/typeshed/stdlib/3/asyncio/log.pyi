@@ -1,3 +0,0 @@
-import logging
-
-logger: logging.Logger
@@ -1 +0,0 @@
-DEBUG: bool
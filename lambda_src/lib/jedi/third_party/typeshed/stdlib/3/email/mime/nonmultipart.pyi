@@ -1,3 +0,0 @@
-from email.mime.base import MIMEBase
-
-class MIMENonMultipart(MIMEBase): ...
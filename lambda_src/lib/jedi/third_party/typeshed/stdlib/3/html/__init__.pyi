@@ -1,4 +0,0 @@
-from typing import AnyStr
-
-def escape(s: AnyStr, quote: bool = ...) -> AnyStr: ...
-def unescape(s: AnyStr) -> AnyStr: ...
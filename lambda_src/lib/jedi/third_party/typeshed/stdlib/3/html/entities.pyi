@@ -1,6 +0,0 @@
-from typing import Dict
-
-name2codepoint: Dict[str, int]
-html5: Dict[str, str]
-codepoint2name: Dict[int, str]
-entitydefs: Dict[str, str]
@@ -1 +0,0 @@
-def main() -> None: ...
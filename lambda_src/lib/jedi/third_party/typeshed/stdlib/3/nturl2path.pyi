@@ -1,2 +0,0 @@
-def url2pathname(url: str) -> str: ...
-def pathname2url(p: str) -> str: ...
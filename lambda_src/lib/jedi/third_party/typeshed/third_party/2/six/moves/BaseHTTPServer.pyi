@@ -1 +0,0 @@
-from BaseHTTPServer import *
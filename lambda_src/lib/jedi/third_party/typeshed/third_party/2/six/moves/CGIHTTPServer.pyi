@@ -1 +0,0 @@
-from CGIHTTPServer import *
@@ -1 +0,0 @@
-from SimpleHTTPServer import *
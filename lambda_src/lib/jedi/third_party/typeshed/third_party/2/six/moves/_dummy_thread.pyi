@@ -1 +0,0 @@
-from dummy_thread import *
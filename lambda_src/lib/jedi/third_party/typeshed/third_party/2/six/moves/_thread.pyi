@@ -1 +0,0 @@
-from thread import *
@@ -1 +0,0 @@
-from cPickle import *
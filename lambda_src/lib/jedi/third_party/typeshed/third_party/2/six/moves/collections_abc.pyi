@@ -1 +0,0 @@
-from collections import *
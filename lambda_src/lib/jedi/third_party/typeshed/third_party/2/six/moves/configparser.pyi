@@ -1 +0,0 @@
-from ConfigParser import *
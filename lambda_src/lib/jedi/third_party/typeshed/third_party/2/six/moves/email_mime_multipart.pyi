@@ -1 +0,0 @@
-from email.mime.multipart import *
@@ -1 +0,0 @@
-from email.MIMEText import *
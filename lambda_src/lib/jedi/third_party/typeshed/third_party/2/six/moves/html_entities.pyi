@@ -1 +0,0 @@
-from htmlentitydefs import *
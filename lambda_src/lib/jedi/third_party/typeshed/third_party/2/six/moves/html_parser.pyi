@@ -1 +0,0 @@
-from HTMLParser import *
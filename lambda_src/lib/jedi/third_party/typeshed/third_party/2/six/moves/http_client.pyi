@@ -1 +0,0 @@
-from httplib import *
@@ -1 +0,0 @@
-from cookielib import *
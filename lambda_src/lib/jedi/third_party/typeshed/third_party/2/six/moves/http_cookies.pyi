@@ -1 +0,0 @@
-from Cookie import *
@@ -1 +0,0 @@
-from Queue import *
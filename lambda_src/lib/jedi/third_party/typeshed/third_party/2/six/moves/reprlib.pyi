@@ -1 +0,0 @@
-from repr import *
@@ -1 +0,0 @@
-from SocketServer import *
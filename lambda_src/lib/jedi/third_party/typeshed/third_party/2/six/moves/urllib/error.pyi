@@ -1,2 +0,0 @@
-from urllib import ContentTooShortError as ContentTooShortError
-from urllib2 import HTTPError as HTTPError, URLError as URLError
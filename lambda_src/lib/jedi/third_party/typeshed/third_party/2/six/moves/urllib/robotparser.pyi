@@ -1 +0,0 @@
-from robotparser import RobotFileParser as RobotFileParser
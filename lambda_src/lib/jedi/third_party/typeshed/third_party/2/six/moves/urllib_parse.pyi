@@ -1 +0,0 @@
-from .urllib.parse import *
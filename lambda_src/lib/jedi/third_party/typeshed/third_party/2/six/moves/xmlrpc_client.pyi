@@ -1 +0,0 @@
-from xmlrpclib import *
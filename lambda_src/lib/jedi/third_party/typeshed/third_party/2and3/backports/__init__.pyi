@@ -1,4 +0,0 @@
-from typing import Any
-
-# Explicitly mark this package as incomplete.
-def __getattr__(name: str) -> Any: ...
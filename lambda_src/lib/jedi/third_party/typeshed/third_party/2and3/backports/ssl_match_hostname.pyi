@@ -1,3 +0,0 @@
-class CertificateError(ValueError): ...
-
-def match_hostname(cert, hostname): ...
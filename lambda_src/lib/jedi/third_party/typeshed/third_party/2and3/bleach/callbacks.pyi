@@ -1,6 +0,0 @@
-from typing import Any, MutableMapping, Text
-
-_Attrs = MutableMapping[Any, Text]
-
-def nofollow(attrs: _Attrs, new: bool = ...) -> _Attrs: ...
-def target_blank(attrs: _Attrs, new: bool = ...) -> _Attrs: ...
@@ -1 +0,0 @@
-def where() -> str: ...
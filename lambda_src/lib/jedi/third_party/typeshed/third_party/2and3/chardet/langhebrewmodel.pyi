@@ -1,7 +0,0 @@
-from typing import Tuple
-
-from . import _LangModelType
-
-WIN1255_CHAR_TO_ORDER_MAP: Tuple[int, ...]
-HEBREW_LANG_MODEL: Tuple[int, ...]
-Win1255HebrewModel: _LangModelType
@@ -1,7 +0,0 @@
-from typing import Tuple
-
-from . import _LangModelType
-
-TIS620CharToOrderMap: Tuple[int, ...]
-ThaiLangModel: Tuple[int, ...]
-TIS620ThaiModel: _LangModelType
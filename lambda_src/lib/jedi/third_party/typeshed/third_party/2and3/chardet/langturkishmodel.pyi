@@ -1,7 +0,0 @@
-from typing import Tuple
-
-from . import _LangModelType
-
-Latin5_TurkishCharToOrderMap: Tuple[int, ...]
-TurkishLangModel: Tuple[int, ...]
-Latin5TurkishModel: _LangModelType
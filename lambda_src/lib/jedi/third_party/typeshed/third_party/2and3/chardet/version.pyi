@@ -1,4 +0,0 @@
-from typing import List
-
-__version__: str
-VERSION: List[str]
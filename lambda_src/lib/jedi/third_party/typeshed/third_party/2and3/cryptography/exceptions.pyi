@@ -1,7 +0,0 @@
-class AlreadyFinalized(Exception): ...
-class AlreadyUpdated(Exception): ...
-class InvalidKey(Exception): ...
-class InvalidSignature(Exception): ...
-class InvalidTag(Exception): ...
-class NotYetFinalized(Exception): ...
-class UnsupportedAlgorithm(Exception): ...
@@ -1,6 +0,0 @@
-from typing import Any
-
-def default_backend() -> Any: ...
-
-# TODO: add some backends
-def __getattr__(name: str) -> Any: ...
@@ -1 +0,0 @@
-def bytes_eq(a: bytes, b: bytes) -> bool: ...
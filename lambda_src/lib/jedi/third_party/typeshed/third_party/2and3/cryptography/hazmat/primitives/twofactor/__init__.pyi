@@ -1 +0,0 @@
-class InvalidToken(Exception): ...
@@ -1,15 +0,0 @@
-from .tz import (
-    datetime_ambiguous as datetime_ambiguous,
-    datetime_exists as datetime_exists,
-    gettz as gettz,
-    resolve_imaginary as resolve_imaginary,
-    tzfile as tzfile,
-    tzical as tzical,
-    tzlocal as tzlocal,
-    tzoffset as tzoffset,
-    tzrange as tzrange,
-    tzstr as tzstr,
-    tzutc as tzutc,
-)
-
-UTC: tzutc
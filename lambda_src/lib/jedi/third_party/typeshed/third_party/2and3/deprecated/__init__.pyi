@@ -1 +0,0 @@
-from .classic import deprecated as deprecated
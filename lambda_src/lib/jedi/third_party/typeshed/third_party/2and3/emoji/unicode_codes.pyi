@@ -1,6 +0,0 @@
-from typing import Dict, Text
-
-EMOJI_ALIAS_UNICODE: Dict[Text, Text]
-EMOJI_UNICODE: Dict[Text, Text]
-UNICODE_EMOJI: Dict[Text, Text]
-UNICODE_EMOJI_ALIAS: Dict[Text, Text]
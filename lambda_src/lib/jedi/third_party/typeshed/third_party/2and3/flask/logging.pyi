@@ -1,8 +0,0 @@
-from typing import Any
-
-def wsgi_errors_stream(): ...
-def has_level_handler(logger: Any): ...
-
-default_handler: Any
-
-def create_logger(app: Any): ...
@@ -1,3 +0,0 @@
-class SimpleEquality:
-    def __eq__(self, other: object) -> bool: ...
-    def __ne__(self, other: object) -> bool: ...
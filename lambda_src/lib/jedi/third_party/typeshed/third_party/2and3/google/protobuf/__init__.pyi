@@ -1 +0,0 @@
-__version__: bytes
@@ -1,5 +0,0 @@
-class MessageListener(object):
-    def Modified(self) -> None: ...
-
-class NullMessageListener(MessageListener):
-    def Modified(self) -> None: ...
@@ -1 +0,0 @@
-class GeneratedProtocolMessageType(type): ...
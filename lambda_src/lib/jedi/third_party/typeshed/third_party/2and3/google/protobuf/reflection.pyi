@@ -1,6 +0,0 @@
-class GeneratedProtocolMessageType(type):
-    def __new__(cls, name, bases, dictionary): ...
-    def __init__(self, name, bases, dictionary) -> None: ...
-
-def ParseMessage(descriptor, byte_str): ...
-def MakeClass(descriptor): ...
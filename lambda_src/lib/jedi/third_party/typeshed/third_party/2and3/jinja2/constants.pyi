@@ -1 +0,0 @@
-LOREM_IPSUM_WORDS: str
@@ -1,2 +0,0 @@
-from .core import Markdown as Markdown, markdown as markdown, markdownFromFile as markdownFromFile
-from .extensions import Extension as Extension
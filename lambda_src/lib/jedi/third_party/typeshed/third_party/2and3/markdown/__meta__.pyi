@@ -1,3 +0,0 @@
-from typing import Any
-
-__version_info__: Any
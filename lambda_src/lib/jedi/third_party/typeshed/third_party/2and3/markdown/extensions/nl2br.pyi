@@ -1,9 +0,0 @@
-from typing import Any
-
-from markdown.extensions import Extension
-
-BR_RE: str
-
-class Nl2BrExtension(Extension): ...
-
-def makeExtension(**kwargs): ...
@@ -1,4 +0,0 @@
-from typing import Any
-
-def to_html_string(element): ...
-def to_xhtml_string(element): ...
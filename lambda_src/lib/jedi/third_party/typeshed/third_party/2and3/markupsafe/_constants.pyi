@@ -1,3 +0,0 @@
-from typing import Dict, Text
-
-HTML_ENTITIES: Dict[Text, int]
@@ -1,6 +0,0 @@
-MODE_AUTO: int = ...
-MODE_MMAP_EXT: int = ...
-MODE_MMAP: int = ...
-MODE_FILE: int = ...
-MODE_MEMORY: int = ...
-MODE_FD: int = ...
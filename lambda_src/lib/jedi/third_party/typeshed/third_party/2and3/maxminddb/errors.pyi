@@ -1 +0,0 @@
-class InvalidDatabaseError(RuntimeError): ...
@@ -1 +0,0 @@
-from .nmap import *
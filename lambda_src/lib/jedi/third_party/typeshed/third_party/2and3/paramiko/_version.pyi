@@ -1,3 +0,0 @@
-from typing import Tuple
-
-__version_info__: Tuple[int, int, int]
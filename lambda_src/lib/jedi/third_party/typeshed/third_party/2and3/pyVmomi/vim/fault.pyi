@@ -1,7 +0,0 @@
-from typing import Any
-
-def __getattr__(name: str) -> Any: ...  # incomplete
-
-class InvalidName(Exception): ...
-class RestrictedByAdministrator(Exception): ...
-class NoPermission(Exception): ...
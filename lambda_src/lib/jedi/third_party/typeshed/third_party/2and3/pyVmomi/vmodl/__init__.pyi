@@ -1,5 +0,0 @@
-from typing import Any
-
-class DynamicProperty:
-    name: str
-    val: Any
@@ -1,5 +0,0 @@
-from typing import Any
-
-def __getattr__(name: str) -> Any: ...  # incomplete
-
-class InvalidArgument(Exception): ...
@@ -1,10 +0,0 @@
-from typing import Any
-
-Date: Any
-Time: Any
-TimeDelta: Any
-Timestamp: Any
-
-def DateFromTicks(ticks): ...
-def TimeFromTicks(ticks): ...
-def TimestampFromTicks(ticks): ...
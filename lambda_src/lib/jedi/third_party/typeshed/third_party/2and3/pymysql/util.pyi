@@ -1,3 +0,0 @@
-def byte2int(b): ...
-def int2byte(i): ...
-def join_bytes(bs): ...
@@ -1 +0,0 @@
-__license__: str
@@ -1,2 +0,0 @@
-from pynamodb.connection.base import Connection as Connection
-from pynamodb.connection.table import TableConnection as TableConnection
@@ -1,3 +0,0 @@
-from typing import Text
-
-def pythonic(var_name: Text) -> Text: ...
@@ -1,5 +0,0 @@
-STRING: str
-NUMBER: str
-BINARY: str
-HASH: str
-RANGE: str
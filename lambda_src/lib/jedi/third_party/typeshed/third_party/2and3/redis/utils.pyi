@@ -1,8 +0,0 @@
-from typing import Any
-
-HIREDIS_AVAILABLE: Any
-
-def from_url(url, db=..., **kwargs): ...
-def pipeline(redis_obj): ...
-
-class dummy: ...
@@ -1,3 +0,0 @@
-import collections
-
-OrderedDict = collections.OrderedDict
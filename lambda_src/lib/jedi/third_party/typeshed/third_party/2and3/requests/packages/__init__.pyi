@@ -1,4 +0,0 @@
-class VendorAlias:
-    def __init__(self, package_names) -> None: ...
-    def find_module(self, fullname, path=...): ...
-    def load_module(self, name): ...
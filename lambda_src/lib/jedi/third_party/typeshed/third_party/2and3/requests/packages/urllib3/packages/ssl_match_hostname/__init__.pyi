@@ -1,4 +0,0 @@
-import ssl
-
-CertificateError = ssl.CertificateError
-match_hostname = ssl.match_hostname
@@ -1 +0,0 @@
-def is_fp_closed(obj): ...
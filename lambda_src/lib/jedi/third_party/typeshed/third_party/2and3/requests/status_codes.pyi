@@ -1,3 +0,0 @@
-from typing import Any
-
-codes: Any
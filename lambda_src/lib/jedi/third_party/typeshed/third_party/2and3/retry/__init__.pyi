@@ -1 +0,0 @@
-from .api import retry as retry
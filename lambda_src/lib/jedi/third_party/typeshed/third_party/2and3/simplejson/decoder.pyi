@@ -1,6 +0,0 @@
-from typing import Match
-
-class JSONDecoder(object):
-    def __init__(self, **kwargs): ...
-    def decode(self, s: str, _w: Match[str], _PY3: bool): ...
-    def raw_decode(self, s: str, idx: int, _w: Match[str], _PY3: bool): ...
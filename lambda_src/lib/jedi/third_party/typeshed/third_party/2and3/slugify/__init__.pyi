@@ -1,2 +0,0 @@
-from .slugify import *
-from .special import *
@@ -1,8 +0,0 @@
-from typing import Sequence, Tuple
-
-def add_uppercase_char(char_list: Sequence[Tuple[str, str]]) -> Sequence[Tuple[str, str]]: ...
-
-CYRILLIC: Sequence[Tuple[str, str]]
-GERMAN: Sequence[Tuple[str, str]]
-GREEK: Sequence[Tuple[str, str]]
-PRE_TRANSLATIONS: Sequence[Tuple[str, str]]
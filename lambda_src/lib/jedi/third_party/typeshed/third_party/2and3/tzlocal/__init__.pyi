@@ -1,4 +0,0 @@
-from pytz import BaseTzInfo
-
-def reload_localzone() -> None: ...
-def get_localzone() -> BaseTzInfo: ...
@@ -1 +0,0 @@
-from ..middleware.lint import *
@@ -1,8 +0,0 @@
-from werkzeug.wrappers import Response
-
-class ContentAccessors:
-    def xml(self): ...
-    def lxml(self): ...
-    def json(self): ...
-
-class TestResponse(Response, ContentAccessors): ...
@@ -1 +0,0 @@
-from .threadpool import open as open
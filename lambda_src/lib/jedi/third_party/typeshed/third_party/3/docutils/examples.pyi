@@ -1,5 +0,0 @@
-from typing import Any
-
-html_parts: Any
-
-def __getattr__(name: str) -> Any: ...
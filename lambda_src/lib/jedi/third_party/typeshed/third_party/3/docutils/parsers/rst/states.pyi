@@ -1,6 +0,0 @@
-from typing import Any
-
-class Inliner:
-    def __init__(self) -> None: ...
-
-def __getattr__(name: str) -> Any: ...
@@ -1 +0,0 @@
-from .api import freeze_time as freeze_time
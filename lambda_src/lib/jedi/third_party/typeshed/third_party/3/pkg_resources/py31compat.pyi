@@ -1,5 +0,0 @@
-import os
-
-needs_makedirs: bool
-
-makedirs = os.makedirs
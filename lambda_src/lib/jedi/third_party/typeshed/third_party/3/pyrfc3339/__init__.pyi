@@ -1,2 +0,0 @@
-from .generator import generate as generate
-from .parser import parse as parse
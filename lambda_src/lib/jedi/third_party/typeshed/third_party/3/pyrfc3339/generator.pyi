@@ -1,3 +0,0 @@
-from datetime import datetime
-
-def generate(dt: datetime, utc: bool = ..., accept_naive: bool = ..., microseconds: bool = ...) -> str: ...
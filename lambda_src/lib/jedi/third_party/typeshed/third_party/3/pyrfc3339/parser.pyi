@@ -1,3 +0,0 @@
-from datetime import datetime
-
-def parse(timestamp: str, utc: bool = ..., produce_naive: bool = ...) -> datetime: ...
@@ -1 +0,0 @@
-from http.server import *
@@ -1 +0,0 @@
-from _dummy_thread import *
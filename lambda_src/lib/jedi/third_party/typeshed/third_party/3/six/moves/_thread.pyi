@@ -1 +0,0 @@
-from _thread import *
@@ -1 +0,0 @@
-from builtins import *
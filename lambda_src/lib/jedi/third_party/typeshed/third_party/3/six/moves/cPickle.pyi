@@ -1 +0,0 @@
-from pickle import *
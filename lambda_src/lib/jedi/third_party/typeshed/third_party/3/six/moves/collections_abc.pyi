@@ -1 +0,0 @@
-from collections.abc import *
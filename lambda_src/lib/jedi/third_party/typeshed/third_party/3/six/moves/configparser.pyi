@@ -1 +0,0 @@
-from configparser import *
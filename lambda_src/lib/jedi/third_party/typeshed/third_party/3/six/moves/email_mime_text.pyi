@@ -1 +0,0 @@
-from email.mime.text import *
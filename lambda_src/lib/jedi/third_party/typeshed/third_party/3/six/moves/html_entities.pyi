@@ -1 +0,0 @@
-from html.entities import *
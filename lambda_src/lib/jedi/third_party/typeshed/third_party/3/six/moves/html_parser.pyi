@@ -1 +0,0 @@
-from html.parser import *
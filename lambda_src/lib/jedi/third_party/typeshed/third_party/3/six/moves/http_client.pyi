@@ -1 +0,0 @@
-from http.client import *
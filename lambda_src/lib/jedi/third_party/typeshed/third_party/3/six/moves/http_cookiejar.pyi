@@ -1 +0,0 @@
-from http.cookiejar import *
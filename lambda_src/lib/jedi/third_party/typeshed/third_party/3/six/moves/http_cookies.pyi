@@ -1 +0,0 @@
-from http.cookies import *
@@ -1 +0,0 @@
-from queue import *
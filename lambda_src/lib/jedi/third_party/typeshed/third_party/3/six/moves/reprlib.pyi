@@ -1 +0,0 @@
-from reprlib import *
@@ -1 +0,0 @@
-from socketserver import *
@@ -1 +0,0 @@
-from tkinter.commondialog import *
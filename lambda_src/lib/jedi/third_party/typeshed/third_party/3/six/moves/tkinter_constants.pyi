@@ -1 +0,0 @@
-from tkinter.constants import *
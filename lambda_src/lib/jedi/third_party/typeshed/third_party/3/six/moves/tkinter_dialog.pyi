@@ -1 +0,0 @@
-from tkinter.dialog import *
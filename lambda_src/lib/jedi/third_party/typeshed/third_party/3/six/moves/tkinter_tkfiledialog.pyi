@@ -1 +0,0 @@
-from tkinter.filedialog import *
@@ -1 +0,0 @@
-from tkinter.ttk import *
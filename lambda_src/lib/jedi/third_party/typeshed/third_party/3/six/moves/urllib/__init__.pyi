@@ -1,5 +0,0 @@
-import six.moves.urllib.error as error
-import six.moves.urllib.parse as parse
-import six.moves.urllib.request as request
-import six.moves.urllib.response as response
-import six.moves.urllib.robotparser as robotparser
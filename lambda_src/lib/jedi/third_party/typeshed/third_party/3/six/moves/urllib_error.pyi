@@ -1 +0,0 @@
-from urllib.error import *
@@ -1 +0,0 @@
-from .urllib.request import *
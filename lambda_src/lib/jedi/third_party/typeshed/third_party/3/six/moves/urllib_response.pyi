@@ -1 +0,0 @@
-from .urllib.response import *
@@ -1 +0,0 @@
-from urllib.robotparser import *
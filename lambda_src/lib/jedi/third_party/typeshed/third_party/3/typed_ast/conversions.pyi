@@ -1,3 +0,0 @@
-from . import ast3, ast27
-
-def py2to3(ast: ast27.AST) -> ast3.AST: ...
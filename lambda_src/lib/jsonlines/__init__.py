@@ -1,20 +0,0 @@
-"""
-Module for the jsonlines data format.
-"""
-
-# expose only public api
-from .jsonlines import (
-    Error,
-    InvalidLineError,
-    Reader,
-    Writer,
-    open,
-)
-
-__all__ = [
-    "Error",
-    "InvalidLineError",
-    "Reader",
-    "Writer",
-    "open",
-]
@@ -1,10 +0,0 @@
-"""Client-side implementations of the Jupyter protocol"""
-from ._version import __version__, protocol_version, protocol_version_info, version_info
-from .asynchronous import AsyncKernelClient
-from .blocking import BlockingKernelClient
-from .client import KernelClient
-from .connect import *  # noqa
-from .launcher import *  # noqa
-from .manager import AsyncKernelManager, KernelManager, run_kernel
-from .multikernelmanager import AsyncMultiKernelManager, MultiKernelManager
-from .provisioning import KernelProvisionerBase, LocalProvisioner
@@ -1 +0,0 @@
-from .client import BlockingKernelClient  # noqa
@@ -1,4 +0,0 @@
-from .manager import AsyncIOLoopKernelManager  # noqa
-from .manager import IOLoopKernelManager  # noqa
-from .restarter import AsyncIOLoopKernelRestarter  # noqa
-from .restarter import IOLoopKernelRestarter  # noqa
@@ -1,3 +0,0 @@
-from .factory import KernelProvisionerFactory  # noqa
-from .local_provisioner import LocalProvisioner  # noqa
-from .provisioner_base import KernelProvisionerBase  # noqa
@@ -1 +0,0 @@
-from .tunnel import *  # noqa
@@ -1,18 +0,0 @@
-"""
-store the current version info of the jupyter_core.
-"""
-from __future__ import annotations
-
-import re
-
-# Version string must appear intact for hatch versioning
-__version__ = "5.7.2"
-
-# Build up version_info tuple for backwards compatibility
-pattern = r"(?P<major>\d+).(?P<minor>\d+).(?P<patch>\d+)(?P<rest>.*)"
-match = re.match(pattern, __version__)
-assert match is not None
-parts: list[object] = [int(match[part]) for part in ["major", "minor", "patch"]]
-if match["rest"]:
-    parts.append(match["rest"])
-version_info = tuple(parts)
@@ -1,2 +0,0 @@
-from . import backend_inline, config  # noqa
-__version__ = "0.1.7"  # noqa
@@ -1,3 +0,0 @@
-import platform
-
-is_pypy = platform.python_implementation() == 'PyPy'
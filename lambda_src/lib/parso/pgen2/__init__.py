@@ -1,10 +0,0 @@
-# Copyright 2004-2005 Elemental Security, Inc. All Rights Reserved.
-# Licensed to PSF under a Contributor Agreement.
-
-# Modifications:
-# Copyright 2006 Google, Inc. All Rights Reserved.
-# Licensed to PSF under a Contributor Agreement.
-# Copyright 2014 David Halter and Contributors
-# Modifications are dual-licensed: MIT and PSF.
-
-from parso.pgen2.generator import generate_grammar
@@ -1,32 +0,0 @@
-from __future__ import annotations
-
-from .application import Application
-from .current import (
-    AppSession,
-    create_app_session,
-    create_app_session_from_tty,
-    get_app,
-    get_app_or_none,
-    get_app_session,
-    set_app,
-)
-from .dummy import DummyApplication
-from .run_in_terminal import in_terminal, run_in_terminal
-
-__all__ = [
-    # Application.
-    "Application",
-    # Current.
-    "AppSession",
-    "get_app_session",
-    "create_app_session",
-    "create_app_session_from_tty",
-    "get_app",
-    "get_app_or_none",
-    "set_app",
-    # Dummy.
-    "DummyApplication",
-    # Run_in_terminal
-    "in_terminal",
-    "run_in_terminal",
-]
@@ -1,5 +0,0 @@
-from __future__ import annotations
-
-from .system import SystemCompleter
-
-__all__ = ["SystemCompleter"]
@@ -1,8 +0,0 @@
-from __future__ import annotations
-
-from .server import PromptToolkitSSHServer, PromptToolkitSSHSession
-
-__all__ = [
-    "PromptToolkitSSHSession",
-    "PromptToolkitSSHServer",
-]
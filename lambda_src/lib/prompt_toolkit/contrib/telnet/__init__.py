@@ -1,7 +0,0 @@
-from __future__ import annotations
-
-from .server import TelnetServer
-
-__all__ = [
-    "TelnetServer",
-]
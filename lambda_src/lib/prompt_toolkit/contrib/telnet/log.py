@@ -1,13 +0,0 @@
-"""
-Python logger for the telnet server.
-"""
-
-from __future__ import annotations
-
-import logging
-
-logger = logging.getLogger(__package__)
-
-__all__ = [
-    "logger",
-]
@@ -1,31 +0,0 @@
-from __future__ import annotations
-
-from .async_generator import aclosing, generator_to_async_generator
-from .inputhook import (
-    InputHook,
-    InputHookContext,
-    InputHookSelector,
-    new_eventloop_with_inputhook,
-    set_eventloop_with_inputhook,
-)
-from .utils import (
-    call_soon_threadsafe,
-    get_traceback_from_context,
-    run_in_executor_with_context,
-)
-
-__all__ = [
-    # Async generator
-    "generator_to_async_generator",
-    "aclosing",
-    # Utils.
-    "run_in_executor_with_context",
-    "call_soon_threadsafe",
-    "get_traceback_from_context",
-    # Inputhooks.
-    "InputHook",
-    "new_eventloop_with_inputhook",
-    "set_eventloop_with_inputhook",
-    "InputHookSelector",
-    "InputHookContext",
-]
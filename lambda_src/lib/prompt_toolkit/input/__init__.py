@@ -1,14 +0,0 @@
-from __future__ import annotations
-
-from .base import DummyInput, Input, PipeInput
-from .defaults import create_input, create_pipe_input
-
-__all__ = [
-    # Base.
-    "Input",
-    "PipeInput",
-    "DummyInput",
-    # Defaults.
-    "create_input",
-    "create_pipe_input",
-]
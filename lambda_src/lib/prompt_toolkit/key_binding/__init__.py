@@ -1,22 +0,0 @@
-from __future__ import annotations
-
-from .key_bindings import (
-    ConditionalKeyBindings,
-    DynamicKeyBindings,
-    KeyBindings,
-    KeyBindingsBase,
-    merge_key_bindings,
-)
-from .key_processor import KeyPress, KeyPressEvent
-
-__all__ = [
-    # key_bindings.
-    "ConditionalKeyBindings",
-    "DynamicKeyBindings",
-    "KeyBindings",
-    "KeyBindingsBase",
-    "merge_key_bindings",
-    # key_processor
-    "KeyPress",
-    "KeyPressEvent",
-]
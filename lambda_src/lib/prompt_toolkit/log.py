@@ -1,13 +0,0 @@
-"""
-Logging configuration.
-"""
-
-from __future__ import annotations
-
-import logging
-
-__all__ = [
-    "logger",
-]
-
-logger = logging.getLogger(__package__)
@@ -1,46 +0,0 @@
-from __future__ import annotations
-
-from .dialogs import (
-    button_dialog,
-    checkboxlist_dialog,
-    input_dialog,
-    message_dialog,
-    progress_dialog,
-    radiolist_dialog,
-    yes_no_dialog,
-)
-from .progress_bar import ProgressBar, ProgressBarCounter
-from .prompt import (
-    CompleteStyle,
-    PromptSession,
-    confirm,
-    create_confirm_session,
-    prompt,
-)
-from .utils import clear, clear_title, print_container, print_formatted_text, set_title
-
-__all__ = [
-    # Dialogs.
-    "input_dialog",
-    "message_dialog",
-    "progress_dialog",
-    "checkboxlist_dialog",
-    "radiolist_dialog",
-    "yes_no_dialog",
-    "button_dialog",
-    # Prompts.
-    "PromptSession",
-    "prompt",
-    "confirm",
-    "create_confirm_session",
-    "CompleteStyle",
-    # Progress bars.
-    "ProgressBar",
-    "ProgressBarCounter",
-    # Utils.
-    "clear",
-    "clear_title",
-    "print_container",
-    "print_formatted_text",
-    "set_title",
-]
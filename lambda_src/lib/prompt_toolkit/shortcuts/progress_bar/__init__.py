@@ -1,33 +0,0 @@
-from __future__ import annotations
-
-from .base import ProgressBar, ProgressBarCounter
-from .formatters import (
-    Bar,
-    Formatter,
-    IterationsPerSecond,
-    Label,
-    Percentage,
-    Progress,
-    Rainbow,
-    SpinningWheel,
-    Text,
-    TimeElapsed,
-    TimeLeft,
-)
-
-__all__ = [
-    "ProgressBar",
-    "ProgressBarCounter",
-    # Formatters.
-    "Formatter",
-    "Text",
-    "Label",
-    "Percentage",
-    "Bar",
-    "Progress",
-    "TimeElapsed",
-    "TimeLeft",
-    "IterationsPerSecond",
-    "SpinningWheel",
-    "Rainbow",
-]
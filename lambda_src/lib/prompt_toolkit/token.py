@@ -1,9 +0,0 @@
-""" """
-
-from __future__ import annotations
-
-__all__ = [
-    "ZeroWidthEscape",
-]
-
-ZeroWidthEscape = "[ZeroWidthEscape]"
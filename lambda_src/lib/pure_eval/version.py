@@ -1 +0,0 @@
-__version__ = '0.2.2'
\ No newline at end of file
@@ -1,10 +0,0 @@
-from .core import Source, FrameInfo, markers_from_ranges, Options, LINE_GAP, Line, Variable, RangeInLine, \
-    RepeatedFrames, MarkerInLine, style_with_executing_node, BlankLineRange, BlankLines
-from .formatting import Formatter
-from .serializing import Serializer
-
-try:
-    from .version import __version__
-except ImportError:
-    # version.py is auto-generated with the git tag when building
-    __version__ = "???"
@@ -1 +0,0 @@
-__version__ = '0.6.3'
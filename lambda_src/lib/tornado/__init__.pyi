@@ -1,33 +0,0 @@
-import typing
-
-version: str
-version_info: typing.Tuple[int, int, int, int]
-
-from . import auth
-from . import autoreload
-from . import concurrent
-from . import curl_httpclient
-from . import escape
-from . import gen
-from . import http1connection
-from . import httpclient
-from . import httpserver
-from . import httputil
-from . import ioloop
-from . import iostream
-from . import locale
-from . import locks
-from . import log
-from . import netutil
-from . import options
-from . import platform
-from . import process
-from . import queues
-from . import routing
-from . import simple_httpclient
-from . import tcpclient
-from . import tcpserver
-from . import template
-from . import testing
-from . import util
-from . import web
@@ -1 +0,0 @@
-def websocket_mask(mask: bytes, data: bytes) -> bytes: ...
@@ -1,19 +0,0 @@
-"""
-handle the current version info of traitlets.
-"""
-from __future__ import annotations
-
-import re
-from typing import List
-
-# Version string must appear intact for hatch versioning
-__version__ = "5.14.3"
-
-# Build up version_info tuple for backwards compatibility
-pattern = r"(?P<major>\d+).(?P<minor>\d+).(?P<patch>\d+)(?P<rest>.*)"
-match = re.match(pattern, __version__)
-assert match is not None
-parts: List[object] = [int(match[part]) for part in ["major", "minor", "patch"]]
-if match["rest"]:
-    parts.append(match["rest"])
-version_info = tuple(parts)
@@ -1 +0,0 @@
-from zmq.backend.cython cimport Context, Frame, Socket, libzmq
@@ -1,13 +0,0 @@
-"""Utilities for ZAP authentication.
-
-To run authentication in a background thread, see :mod:`zmq.auth.thread`.
-For integration with the asyncio event loop, see :mod:`zmq.auth.asyncio`.
-
-Authentication examples are provided in the pyzmq codebase, under
-`/examples/security/`.
-
-.. versionadded:: 14.1
-"""
-
-from .base import *
-from .certs import *
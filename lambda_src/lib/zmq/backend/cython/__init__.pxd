@@ -1 +0,0 @@
-from zmq.backend.cython._zmq cimport Context, Frame, Socket
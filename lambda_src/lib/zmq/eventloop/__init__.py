@@ -1,5 +0,0 @@
-"""Tornado eventloop integration for pyzmq"""
-
-from tornado.ioloop import IOLoop
-
-__all__ = ['IOLoop']
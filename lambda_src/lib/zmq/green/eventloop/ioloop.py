@@ -1 +0,0 @@
-from zmq.eventloop.ioloop import *  # noqa
@@ -1 +0,0 @@
-from zmq.ssh.tunnel import *
@@ -1,10 +0,0 @@
-from zmq.error import *
-
-from . import constants as constants
-from .constants import *
-from .context import *
-from .frame import *
-from .poll import *
-from .socket import *
-from .tracker import *
-from .version import *
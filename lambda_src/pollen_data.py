@@ -1,12 +1,20 @@
 import json
 import os
 import sys
-import xml.etree.ElementTree as ET
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
 
-lib_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "lib")
-sys.path.append(lib_dir)
+src_dir = os.path.dirname(os.path.realpath(__file__))
+lib_dir = os.path.join(src_dir, "lib")
+# src_dir lets sibling modules resolve when imported as lambda_src.pollen_data
+sys.path.extend([src_dir, lib_dir])
 
-import requests
+from hedge import Hedger
+from throttle import AdaptiveLimiter, backoff_delay, retry_after_seconds
+
+# Overridable so fetches can be pointed at a local stand-in server
+BASE_URL = os.environ.get("POLLEN_BASE_URL", "https://www.pollen.com")
 
 HEADERS = {
     "Accept": "application/json, text/javascript, */*; q=0.01",
@@ -18,11 +26,139 @@ HEADERS = {
     "X-Requested-With": "XMLHttpRequest",
 }
 
+# Upper bound on pooled keep-alive connections to pollen.com
+POOL_SIZE = 32
+
+# (connect, read) timeouts in seconds
+REQUEST_TIMEOUT = (5, 30)
+# Responses slower than this are treated as a congestion signal
+SLOW_RESPONSE = 5.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 4
+
+# Shared by every fetcher so all requests to pollen.com draw on one budget
+limiter = AdaptiveLimiter(max_concurrency=POOL_SIZE)
+# Set by enable_hedging; None sends each request once
+hedger = None
+
+_session = None
+
+
+def get_session():
+    """Shared keep-alive session, reused across warm Lambda invocations."""
+    global _session
+    if _session is None:
+        # Imported on first use to keep requests off the cold-start import path
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        _session = requests.Session()
+        _session.headers.update(HEADERS)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE)
+        _session.mount("https://", adapter)
+        _session.mount("http://", adapter)
+    return _session
+
+
+@lru_cache(maxsize=None)
+def load_locations():
+    """Locations from map_augmented.json, keyed by map key, in file order."""
+    map_path = os.path.join(os.path.dirname(__file__), "map_augmented.json")
+    with open(map_path, "r") as f:
+        map_data = json.load(f)
+    return map_data["Locations"]
+
+
+def enable_hedging(percentile=95, min_samples=20):
+    """Duplicate requests slower than `percentile` of this run's latencies.
+
+    Call once per run; latencies from earlier runs are discarded.
+    """
+    global hedger
+    if hedger is None:
+        hedger = Hedger(percentile, min_samples, max_workers=2 * POOL_SIZE)
+    hedger.percentile = percentile
+    hedger.min_samples = min_samples
+    hedger.reset()
+    return hedger
+
+
+def http_get(url):
+    """GET `url` through the shared limiter, retrying throttled or failed attempts.
+
+    429 and 5xx responses, connection errors and timeouts are retried with
+    jittered exponential backoff, honouring Retry-After when the server sends
+    one. Raises the last error once MAX_RETRIES is exhausted. With hedging
+    enabled, a first attempt slower than the hedger's threshold is duplicated;
+    retries, which follow a congestion signal, never are.
+    """
+    import requests
+
+    for attempt in range(MAX_RETRIES + 1):
+        last_attempt = attempt == MAX_RETRIES
+        limiter.acquire()
+        try:
+            if hedger is not None and attempt == 0:
+                # The duplicate takes its own limiter slot; the primary has one
+                response = hedger.call(
+                    partial(_send, url),
+                    partial(_acquire_and_send, url),
+                    accept=lambda response: response.ok,
+                )
+            else:
+                response = _send(url)
+        except (requests.ConnectionError, requests.Timeout):
+            if last_attempt:
+                raise
+            time.sleep(backoff_delay(attempt))
+            continue
+
+        if response.status_code in RETRY_STATUSES and not last_attempt:
+            delay = retry_after_seconds(response.headers.get("Retry-After"))
+            if delay is None:
+                delay = backoff_delay(attempt)
+            elif response.status_code == 429:
+                limiter.pause(delay)
+            time.sleep(delay)
+            continue
+
+        response.raise_for_status()  # Raises an HTTPError for bad responses
+        return response
+
+
+def _send(url):
+    """One GET on an acquired limiter slot, which it releases.
+
+    Successful responses add their own latency, without limiter waits or
+    backoff, to the hedger's samples.
+    """
+    import requests
+
+    started = time.monotonic()
+    try:
+        response = get_session().get(url, timeout=REQUEST_TIMEOUT)
+    except (requests.ConnectionError, requests.Timeout):
+        limiter.release(congested=True)
+        raise
+
+    elapsed = time.monotonic() - started
+    retry = response.status_code in RETRY_STATUSES
+    limiter.release(congested=retry or elapsed > SLOW_RESPONSE)
+    if hedger is not None and response.ok:
+        hedger.record(elapsed)
+    return response
+
+
+def _acquire_and_send(url):
+    limiter.acquire()
+    return _send(url)
+
 
 def fetch_xml_locations():
-    url = "https://www.pollen.com/sitemap.xml"
-    response = requests.get(url, headers=HEADERS)
-    response.raise_for_status()
+    import xml.etree.ElementTree as ET
+
+    url = f"{BASE_URL}/sitemap.xml"
+    response = http_get(url)
     root = ET.fromstring(response.content)
     locations = [
         elem.text
@@ -37,29 +173,130 @@ def fetch_xml_locations():
 
 def fetch_forecast(period, zip):
     """period in {historic, current, extended}"""
-    url = f"https://www.pollen.com/api/forecast/{period}/pollen/{zip}"
-    response = requests.get(url, headers=HEADERS)
-    response.raise_for_status()  # Raises an HTTPError for bad responses
+    url = f"{BASE_URL}/api/forecast/{period}/pollen/{zip}"
+    response = http_get(url)
     return response.json()
 
 
-def fetch_all_forecasts(period):
-    map_path = os.path.join(os.path.dirname(__file__), "map_augmented.json")
-    with open(map_path, "r") as f:
-        map_data = json.load(f)
+def _iter_many(period, zips, max_workers, fetch):
+    if max_workers <= 1:
+        for zip in zips:
+            yield fetch(period, zip)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(lambda zip: fetch(period, zip), zips)
+
+
+def iter_forecasts(period, max_workers=1, fetch=fetch_forecast):
+    """Yield `period` forecasts in map_augmented.json order as they arrive.
+
+    With max_workers > 1, requests run concurrently on a bounded thread pool
+    sharing the pooled session. `fetch(period, zip)` can be swapped for a
+    wrapper around fetch_forecast, e.g. one that checkpoints responses.
+    """
+    zips = [loc["ZIP"] for loc in load_locations().values()]
+    yield from _iter_many(period, zips, max_workers, fetch)
+
+
+def fetch_all_forecasts(period, max_workers=1, fetch=fetch_forecast):
+    """Fetch `period` for every location, in map_augmented.json order."""
+    return list(iter_forecasts(period, max_workers, fetch))
+
+
+def fetch_pipelined(periods, on_complete, max_workers=16, fetch=fetch_forecast):
+    """Fetch all `periods` for each location together.
+
+    Requests are scheduled location by location, so a location's periods are
+    in flight at the same time instead of in separate sweeps. As soon as every
+    location has returned for a period, on_complete(period, forecasts) is
+    called from the calling thread with forecasts in map_augmented.json order,
+    while the remaining requests keep running.
+    """
+    zips = [loc["ZIP"] for loc in load_locations().values()]
+    results = {period: [None] * len(zips) for period in periods}
+    remaining = {period: len(zips) for period in periods}
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = {
+            executor.submit(fetch, period, zip): (period, i)
+            for i, zip in enumerate(zips)
+            for period in periods
+        }
+        for future in as_completed(futures):
+            period, i = futures[future]
+            results[period][i] = future.result()
+            remaining[period] -= 1
+            if remaining[period] == 0:
+                on_complete(period, results.pop(period))
+    except BaseException:
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
+
+
+def forecast_from_map(location, map_period):
+    """Build a "current"-shaped forecast record from one map API period.
+
+    Only the "Today" index is known, so the period carries no Triggers.
+    """
+    return {
+        "Type": "pollen",
+        "ForecastDate": map_period["Period"].split("T")[0] + "T00:00:00",
+        "Source": "map",
+        "Location": {
+            "ZIP": location["ZIP"],
+            "City": location["ForecastCity"],
+            "State": location["State"],
+            "periods": [
+                {
+                    "Period": map_period["Period"],
+                    "Type": "Today",
+                    "Index": map_period["Index"],
+                }
+            ],
+            "DisplayLocation": location["ForecastDisplayLocation"],
+        },
+    }
+
+
+def fetch_current_from_map(max_workers=1, triggers=False, fetch=fetch_forecast):
+    """Fetch "current" forecasts from one map API call.
+
+    Locations missing from the map response fall back to per-ZIP
+    fetch_forecast. With triggers=True every location is fetched per ZIP,
+    since the map API carries no trigger detail.
+    """
+    if triggers:
+        return fetch_all_forecasts("current", max_workers, fetch)
+
+    map_locations = fetch_map_data()["Locations"]
+    locations = list(load_locations().items())
 
     forecasts = []
-    for loc in map_data["Locations"]:
-        zip = map_data["Locations"][loc]["ZIP"]
-        forecasts.append(fetch_forecast(period, zip))
+    missing = []
+    for key, location in locations:
+        periods = map_locations.get(key, {}).get("periods") or [{}]
+        if periods[0].get("Index") is None:
+            missing.append(len(forecasts))
+            forecasts.append(None)
+        else:
+            forecasts.append(forecast_from_map(location, periods[0]))
+
+    if missing:
+        zips = [locations[i][1]["ZIP"] for i in missing]
+        for i, forecast in zip(
+            missing, _iter_many("current", zips, max_workers, fetch)
+        ):
+            forecasts[i] = forecast
 
     return forecasts
 
 
 def fetch_map_data():
-    url = "https://www.pollen.com/api/map"
-    response = requests.get(url, headers=HEADERS)
-    response.raise_for_status()  # Raises an HTTPError for bad responses
+    url = f"{BASE_URL}/api/map"
+    response = http_get(url)
     return response.json()
 
 
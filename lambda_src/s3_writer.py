@@ -0,0 +1,101 @@
+import json
+import zlib
+
+# S3 requires every part of a multipart upload except the last to be >= 5 MiB
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+
+class JsonlUploader:
+    """Stream records to S3 as JSONL, optionally gzip-compressed.
+
+    Records are encoded as they are written and shipped in multipart-upload
+    parts, so only one part is ever held in memory. Objects smaller than one
+    part are stored with a single put_object. Lines are joined with "\\n" and
+    have no trailing newline, matching format_jsonl.
+
+    Use as a context manager; an exception inside the block aborts the upload.
+    """
+
+    def __init__(self, s3, bucket, key, compress=True, part_size=MIN_PART_SIZE):
+        self.s3 = s3
+        self.bucket = bucket
+        self.key = key
+        self.part_size = max(part_size, MIN_PART_SIZE)
+        # wbits=31 selects the gzip container, readable by gzip.open
+        self._compressor = zlib.compressobj(wbits=31) if compress else None
+        self._buffer = bytearray()
+        self._parts = []
+        self._upload_id = None
+        self._empty = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+    def write(self, record):
+        line = json.dumps(record)
+        if not self._empty:
+            line = "\n" + line
+        self._empty = False
+        self._append(line.encode("utf-8"))
+
+    def write_all(self, records):
+        for record in records:
+            self.write(record)
+
+    def close(self):
+        if self._compressor is not None:
+            self._buffer += self._compressor.flush()
+
+        if self._upload_id is None:
+            self.s3.put_object(
+                Bucket=self.bucket, Key=self.key, Body=bytes(self._buffer)
+            )
+            return
+
+        if self._buffer:
+            self._upload_part(bytes(self._buffer))
+        self.s3.complete_multipart_upload(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self._upload_id,
+            MultipartUpload={"Parts": self._parts},
+        )
+
+    def abort(self):
+        if self._upload_id is not None:
+            self.s3.abort_multipart_upload(
+                Bucket=self.bucket, Key=self.key, UploadId=self._upload_id
+            )
+            self._upload_id = None
+
+    def _append(self, data):
+        if self._compressor is not None:
+            data = self._compressor.compress(data)
+        self._buffer += data
+
+        while len(self._buffer) >= self.part_size:
+            part = bytes(self._buffer[: self.part_size])
+            del self._buffer[: self.part_size]
+            self._upload_part(part)
+
+    def _upload_part(self, body):
+        if self._upload_id is None:
+            response = self.s3.create_multipart_upload(Bucket=self.bucket, Key=self.key)
+            self._upload_id = response["UploadId"]
+
+        part_number = len(self._parts) + 1
+        response = self.s3.upload_part(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=body,
+        )
+        self._parts.append({"ETag": response["ETag"], "PartNumber": part_number})
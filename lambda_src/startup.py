@@ -0,0 +1,66 @@
+import builtins
+import sys
+import threading
+import time
+
+
+class ImportProfiler:
+    """Record how long each newly imported package takes while installed.
+
+    Wraps builtins.__import__, so every `import` statement that loads a module
+    not yet in sys.modules is timed. Time is attributed to top-level packages
+    as self time: a package's figure excludes other packages it imports, like
+    `python -X importtime` grouped by distribution.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.init_elapsed = None
+        self.elapsed = None
+        self.packages = {}
+        self._original = None
+        self._local = threading.local()
+
+    def install(self):
+        self._original = builtins.__import__
+        builtins.__import__ = self._import
+        return self
+
+    def mark_init(self):
+        """Record the end of module initialisation."""
+        self.init_elapsed = time.perf_counter() - self.started
+
+    def uninstall(self):
+        if self._original is not None:
+            builtins.__import__ = self._original
+            self._original = None
+            self.elapsed = time.perf_counter() - self.started
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        stack = self._local.__dict__.setdefault("stack", [])
+        package = name.split(".")[0]
+        if level or name in sys.modules or any(p == package for p, _ in stack):
+            return self._original(name, globals, locals, fromlist, level)
+
+        stack.append([package, 0.0])
+        started = time.perf_counter()
+        try:
+            return self._original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - started
+            _, children = stack.pop()
+            self.packages[package] = self.packages.get(package, 0) + elapsed - children
+            if stack:
+                stack[-1][1] += elapsed
+
+    def report(self, top=10):
+        elapsed = self.elapsed
+        if elapsed is None:
+            elapsed = time.perf_counter() - self.started
+        imports = sorted(self.packages.items(), key=lambda item: -item[1])[:top]
+        breakdown = ", ".join(f"{name}={t * 1000:.0f}ms" for name, t in imports)
+        init = f"init {self.init_elapsed * 1000:.0f}ms, " if self.init_elapsed else ""
+        return (
+            f"cold start: {init}first invocation done at {elapsed * 1000:.0f}ms; "
+            f"imports: {breakdown}"
+        )
@@ -0,0 +1,122 @@
+import random
+import threading
+import time
+
+
+class AdaptiveLimiter:
+    """Token-bucket rate limiter with AIMD-adjusted rate and concurrency.
+
+    Every request takes a token and an in-flight slot. Each uncongested
+    response raises the rate by `rate_step` per second and the concurrency
+    limit by 1/limit (about +1 per full window); a congestion signal (429,
+    5xx, timeout or slow response) halves both. The limiter therefore settles
+    near the highest throughput the server sustains. `pause` stops all new
+    requests, e.g. until a Retry-After deadline.
+    """
+
+    def __init__(
+        self,
+        rate=10.0,
+        max_rate=100.0,
+        min_rate=1.0,
+        rate_step=0.5,
+        concurrency=4,
+        max_concurrency=32,
+    ):
+        self.initial_rate = rate
+        self.initial_concurrency = concurrency
+        self.rate = rate
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.rate_step = rate_step
+        self.concurrency = float(concurrency)
+        self.max_concurrency = max_concurrency
+
+        self._tokens = 1.0
+        self._refilled_at = time.monotonic()
+        self._resume_at = 0.0
+        self._in_flight = 0
+        self._cond = threading.Condition()
+
+        self.requests = 0
+        self.congested = 0
+
+    def reset(self):
+        """Return to the initial rate and concurrency, e.g. at the start of a run."""
+        with self._cond:
+            self.rate = self.initial_rate
+            self.concurrency = float(self.initial_concurrency)
+            self._resume_at = 0.0
+            self.requests = 0
+            self.congested = 0
+
+    def _refill(self, now):
+        burst = max(1.0, self.rate)
+        self._tokens = min(burst, self._tokens + (now - self._refilled_at) * self.rate)
+        self._refilled_at = now
+
+    def acquire(self):
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self._resume_at:
+                    timeout = self._resume_at - now
+                elif self._in_flight >= int(self.concurrency):
+                    timeout = None  # woken by release()
+                elif self._tokens < 1.0:
+                    timeout = (1.0 - self._tokens) / self.rate
+                else:
+                    self._tokens -= 1.0
+                    self._in_flight += 1
+                    self.requests += 1
+                    return
+                self._cond.wait(timeout)
+
+    def release(self, congested=False):
+        with self._cond:
+            self._in_flight -= 1
+            if congested:
+                self.congested += 1
+                self.rate = max(self.min_rate, self.rate / 2)
+                self.concurrency = max(1.0, self.concurrency / 2)
+            else:
+                self.rate = min(self.max_rate, self.rate + self.rate_step)
+                self.concurrency = min(
+                    self.max_concurrency, self.concurrency + 1 / self.concurrency
+                )
+            self._cond.notify_all()
+
+    def pause(self, seconds):
+        with self._cond:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+            self._cond.notify_all()
+
+    def stats(self):
+        return {
+            "requests": self.requests,
+            "congested": self.congested,
+            "rate": round(self.rate, 2),
+            "concurrency": int(self.concurrency),
+        }
+
+
+def backoff_delay(attempt, base=0.5, cap=20.0):
+    """Full-jitter exponential backoff for the given 0-based retry attempt."""
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+def retry_after_seconds(value):
+    """Parse a Retry-After header (seconds or HTTP date); None if absent."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    from email.utils import parsedate_to_datetime
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
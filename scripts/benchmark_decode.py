@@ -0,0 +1,84 @@
+"""
+Compare full and selective JSON decoding of daily forecast files.
+
+Reads every {date}_{period}.jsonl file of a directory (by default the
+checked-in data/example_forecasts) repeatedly through
+analysis.utils.read_records, the reader behind load_data, the rows cache and
+iter_records, and reports lines and megabytes read per second. "full" reads
+with triggers=True; "no_triggers" with triggers=False, which leaves the
+Triggers lists of current files out of decoding (see decode_without_triggers).
+Other periods have no Triggers and are decoded in full either way.
+"""
+
+import argparse
+import time
+from functools import partial
+
+from analysis.storage import LocalStorage
+from analysis.utils import read_records
+
+READERS = {
+    "full": partial(read_records, triggers=True),
+    "no_triggers": partial(read_records, triggers=False),
+}
+
+
+def benchmark(storage, keys, repeat):
+    """Best time of each reader over every file, alternating readers."""
+    best = dict.fromkeys(READERS, float("inf"))
+    for _ in range(repeat):
+        for name, read in READERS.items():
+            started = time.perf_counter()
+            for key in keys:
+                read(storage, key)
+            best[name] = min(best[name], time.perf_counter() - started)
+    return best
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--data_directory",
+        type=str,
+        default="data/example_forecasts",
+        help="Directory of daily forecast files (default: data/example_forecasts)",
+    )
+    parser.add_argument(
+        "--periods",
+        nargs="+",
+        default=["current", "extended", "historic"],
+        help="Periods to benchmark (default: current extended historic)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=20, help="Passes per reader (default: 20)"
+    )
+    return parser.parse_args()
+
+
+def main(args):
+    storage = LocalStorage(args.data_directory)
+    print(f"{'period':<10} {'reader':<12} {'lines/s':>9} {'MB/s':>7} {'speedup':>8}")
+    for period in args.periods:
+        keys = storage.find(period)
+        if not keys:
+            continue
+        lines = 0
+        megabytes = 0.0
+        for key in keys:
+            with storage.open(key) as f:
+                for line in f:
+                    lines += 1
+                    megabytes += len(line) / 1e6
+
+        seconds = benchmark(storage, keys, args.repeat)
+        for name in READERS:
+            print(
+                f"{period:<10} {name:<12} {lines / seconds[name]:>9.0f} "
+                f"{megabytes / seconds[name]:>7.1f} "
+                f"{seconds['full'] / seconds[name]:>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    main(args)
@@ -0,0 +1,136 @@
+"""
+Load-test the daily ingestion fetch strategies against the local pollen.com stand-in.
+
+Starts scripts/pollen_stub_server.py in-process, points lambda_src/pollen_data.py at
+it and runs a full current/extended/historic sweep with each strategy, reporting
+wall-clock time, server requests per second and per-location latency percentiles.
+"""
+
+import argparse
+import threading
+import time
+
+import numpy as np
+
+from lambda_src import pollen_data
+from scripts.pollen_stub_server import add_stub_arguments, start_stub_server
+
+PERIODS = ["current", "extended", "historic"]
+STRATEGIES = ["sequential", "concurrent", "pipelined", "map_current", "hedged"]
+
+
+def run_strategy(strategy, fetch, workers, hedge_percentile):
+    if strategy == "sequential":
+        for period in PERIODS:
+            pollen_data.fetch_all_forecasts(period, 1, fetch)
+    elif strategy in ("concurrent", "hedged"):
+        if strategy == "hedged":
+            pollen_data.enable_hedging(hedge_percentile)
+        for period in PERIODS:
+            pollen_data.fetch_all_forecasts(period, workers, fetch)
+    elif strategy == "pipelined":
+        pollen_data.fetch_pipelined(PERIODS, lambda period, f: None, workers, fetch)
+    elif strategy == "map_current":
+        pollen_data.fetch_current_from_map(workers, fetch=fetch)
+        for period in PERIODS[1:]:
+            pollen_data.fetch_all_forecasts(period, workers, fetch)
+    else:
+        raise ValueError(f"Unknown strategy: {strategy}")
+
+
+def benchmark(strategy, server, workers, hedge_percentile, max_rate):
+    """Run one strategy from a fresh limiter and return its measurements."""
+    pollen_data.limiter = pollen_data.AdaptiveLimiter(
+        max_rate=max_rate, max_concurrency=pollen_data.POOL_SIZE
+    )
+    pollen_data.hedger = None
+
+    latencies = []
+    lock = threading.Lock()
+
+    def timed_fetch(period, zip):
+        started = time.perf_counter()
+        forecast = pollen_data.fetch_forecast(period, zip)
+        with lock:
+            latencies.append(time.perf_counter() - started)
+        return forecast
+
+    requests_before = server.requests
+    started = time.perf_counter()
+    run_strategy(strategy, timed_fetch, workers, hedge_percentile)
+    elapsed = time.perf_counter() - started
+    n_requests = server.requests - requests_before
+
+    p50, p95, p99 = (
+        np.percentile(latencies, [50, 95, 99]) * 1000 if latencies else [0] * 3
+    )
+    result = {
+        "strategy": strategy,
+        "seconds": elapsed,
+        "requests": n_requests,
+        "req_per_s": n_requests / elapsed,
+        "p50_ms": p50,
+        "p95_ms": p95,
+        "p99_ms": p99,
+    }
+    if pollen_data.hedger is not None:
+        result["hedged"] = pollen_data.hedger.hedged
+    return result
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--strategies",
+        nargs="+",
+        choices=STRATEGIES,
+        default=STRATEGIES,
+        help="Fetch strategies to compare (default: all)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=16, help="Concurrent requests (default: 16)"
+    )
+    parser.add_argument(
+        "--hedge_percentile",
+        type=float,
+        default=95,
+        help="Latency percentile that triggers a hedge for the hedged strategy",
+    )
+    parser.add_argument(
+        "--max_rate",
+        type=float,
+        default=pollen_data.limiter.max_rate,
+        help="Rate limiter ceiling in requests per second",
+    )
+    add_stub_arguments(parser)
+    return parser.parse_args()
+
+
+def main(args):
+    server = start_stub_server(args)
+    pollen_data.BASE_URL = server.base_url
+    print(f"Stub server at {server.base_url}")
+
+    print(
+        f"{'strategy':<12} {'seconds':>8} {'requests':>9} {'req/s':>7} "
+        f"{'p50 ms':>7} {'p95 ms':>7} {'p99 ms':>7}"
+    )
+    for strategy in args.strategies:
+        r = benchmark(
+            strategy, server, args.workers, args.hedge_percentile, args.max_rate
+        )
+        line = (
+            f"{r['strategy']:<12} {r['seconds']:>8.2f} {r['requests']:>9d} "
+            f"{r['req_per_s']:>7.1f} {r['p50_ms']:>7.0f} {r['p95_ms']:>7.0f} "
+            f"{r['p99_ms']:>7.0f}"
+        )
+        if "hedged" in r:
+            line += f"  ({r['hedged']} hedged)"
+        print(line)
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    main(args)
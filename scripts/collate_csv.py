@@ -1,107 +1,71 @@
+"""
+Write data/collated.csv: one row per day with every location's raw and
+LOWESS-smoothed pollen index.
+
+Parsing and smoothing run in worker processes, so this script must be run as
+`python -m scripts.collate_csv`, and everything stays under the __main__ guard.
+"""
+
+import argparse
 import warnings
 
+import numpy as np
 import pandas as pd
 import pandas.errors
 
-from analysis.utils import load_data, smooth_timeseries
+from analysis.locations import get_registry
+from analysis.utils import load_cube
 
 warnings.filterwarnings("ignore", category=pandas.errors.PerformanceWarning)
 
 OUTPUT_DIR = "data"
 
-# State abbreviation to full name mapping
-STATE_NAMES = {
-    "AL": "Alabama",
-    "AK": "Alaska",
-    "AZ": "Arizona",
-    "AR": "Arkansas",
-    "CA": "California",
-    "CO": "Colorado",
-    "CT": "Connecticut",
-    "DE": "Delaware",
-    "FL": "Florida",
-    "GA": "Georgia",
-    "HI": "Hawaii",
-    "ID": "Idaho",
-    "IL": "Illinois",
-    "IN": "Indiana",
-    "IA": "Iowa",
-    "KS": "Kansas",
-    "KY": "Kentucky",
-    "LA": "Louisiana",
-    "ME": "Maine",
-    "MD": "Maryland",
-    "MA": "Massachusetts",
-    "MI": "Michigan",
-    "MN": "Minnesota",
-    "MS": "Mississippi",
-    "MO": "Missouri",
-    "MT": "Montana",
-    "NE": "Nebraska",
-    "NV": "Nevada",
-    "NH": "New Hampshire",
-    "NJ": "New Jersey",
-    "NM": "New Mexico",
-    "NY": "New York",
-    "NC": "North Carolina",
-    "ND": "North Dakota",
-    "OH": "Ohio",
-    "OK": "Oklahoma",
-    "OR": "Oregon",
-    "PA": "Pennsylvania",
-    "RI": "Rhode Island",
-    "SC": "South Carolina",
-    "SD": "South Dakota",
-    "TN": "Tennessee",
-    "TX": "Texas",
-    "UT": "Utah",
-    "VT": "Vermont",
-    "VA": "Virginia",
-    "WA": "Washington",
-    "WV": "West Virginia",
-    "WI": "Wisconsin",
-    "WY": "Wyoming",
-    "DC": "District of Columbia",
-}
-
-
-def format_location(loc):
-    # Split into city and state
-    city, state = loc.split(",")
-    state = state.strip()
-
-    # Properly capitalize city (handle multi-word cities)
-    city = " ".join(word.capitalize() for word in city.lower().split())
-
-    # Convert state abbreviation to full name
-    full_state = STATE_NAMES[state]
-
-    return f"{city} {full_state}"
-
-
-# Load data
-df = load_data("s3_data")
-
-# Create wide format dataframe
-dates = sorted(df["date"].unique())
-locations = sorted(df["location"].unique())
-wide_df = pd.DataFrame({"date": dates})
-
-# Add raw data columns
-for loc in locations:
-    loc_data = df[df["location"] == loc].set_index("date")["index"]
-    formatted_loc = format_location(loc)
-    wide_df[f"{formatted_loc} (raw)"] = wide_df["date"].map(loc_data)
-
-# Add smoothed data columns
-smooth_method = "lowess"
-smooth_params = {"frac": 0.1}
-
-for loc in locations:
-    loc_data = df[df["location"] == loc]["index"]
-    smoothed = smooth_timeseries(loc_data, method=smooth_method, **smooth_params)
-    formatted_loc = format_location(loc)
-    wide_df[f"{formatted_loc} (smoothed)"] = smoothed
-
-wide_df = wide_df.iloc[:, :]
-wide_df.to_csv(f"{OUTPUT_DIR}/collated.csv", index=False, encoding="utf-8")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--data_directory",
+        type=str,
+        default="s3_data",
+        help="Directory or s3://bucket URL with pollen forecasts",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=None,
+        help="Worker processes for parsing and smoothing (default: one per CPU; "
+        "1 runs everything in this process)",
+    )
+    return parser.parse_args()
+
+
+def main(args):
+    # Load data
+    cube = load_cube(args.data_directory, processes=args.processes)
+
+    # Create wide format dataframe over the days any location has data for
+    days = cube.mask.any(axis=0)
+    wide_df = pd.DataFrame({"date": np.datetime_as_string(cube.dates[days], unit="D")})
+
+    # "City State" column label of each location
+    labels = get_registry().labels_for(cube.locations)
+
+    # Add raw data columns
+    for loc, label in zip(cube.locations, labels):
+        wide_df[f"{label} (raw)"] = cube.row(loc)[days]
+
+    # Add smoothed data columns
+    smooth_method = "lowess"
+    smooth_params = {"frac": 0.1}
+
+    smoothed = cube.smooth(smooth_method, args.processes, **smooth_params)
+    for loc, label in zip(cube.locations, labels):
+        wide_df[f"{label} (smoothed)"] = smoothed.row(loc)[days]
+
+    wide_df = wide_df.iloc[:, :]
+    wide_df.to_csv(f"{OUTPUT_DIR}/collated.csv", index=False, encoding="utf-8")
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    main(args)
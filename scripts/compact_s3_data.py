@@ -0,0 +1,98 @@
+"""
+Fold a month of daily forecast files into one columnar archive per period.
+
+Thousands of small {date}_{period}.jsonl[.gz] objects make listing, downloading
+and parsing dominated by per-object overhead. This packs each complete month of
+current, extended and historic responses into
+{period}/YYYY/MM/{YYYYMM}_{period}.npz (see analysis/archive.py), which
+analysis.utils reads through the same API as loose daily files.
+
+Works on a local directory or straight on the bucket (s3://bucket[/prefix]).
+Loose files are only deleted with --delete, after the archive has been read
+back and checked against them. Days that arrive after a month was compacted are
+merged into the archive on the next run.
+"""
+
+import argparse
+import os
+from datetime import date
+
+from dotenv import load_dotenv
+
+from analysis.archive import load_archive, pack_records, records_match, unpack_records
+from analysis.storage import archive_key, get_storage, parse_key
+from analysis.utils import iter_daily_records
+
+load_dotenv()
+
+PERIODS = ["current", "extended", "historic"]
+
+
+def compact_month(storage, period, month, delete=False):
+    """Write the `period` archive of YYYYMM `month`; returns days archived."""
+    loose = storage.find(period, f"{month}01", f"{month}31")
+    days = list(iter_daily_records(storage, period, f"{month}01", f"{month}31"))
+    if not days:
+        return 0
+
+    key = archive_key(period, month)
+    data = pack_records(period, days)
+    if not records_match(list(unpack_records(load_archive(data))), days):
+        raise RuntimeError(f"{key} does not round-trip; leaving daily files")
+    storage.write_bytes(key, data)
+    print(f"Wrote {key}: {len(days)} days, {len(data) / 1e3:.0f} kB")
+
+    if delete:
+        storage.map(storage.delete, loose)
+        print(f"Deleted {len(loose)} daily files")
+    return len(days)
+
+
+def months_to_compact(storage, period, months=None):
+    """Months with loose `period` files, excluding the current month."""
+    this_month = date.today().strftime("%Y%m")
+    found = {parse_key(key)[0][:6] for key in storage.find(period)}
+    if months:
+        found &= set(months)
+    return sorted(month for month in found if month < this_month)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--data_directory",
+        type=str,
+        default=f"s3://{os.getenv('AWS_BUCKET_NAME')}",
+        help="Directory or s3://bucket URL to compact (default: $AWS_BUCKET_NAME)",
+    )
+    parser.add_argument(
+        "--periods",
+        nargs="+",
+        choices=PERIODS,
+        default=PERIODS,
+        help="Periods to compact (default: all)",
+    )
+    parser.add_argument(
+        "--months",
+        nargs="+",
+        default=None,
+        help="YYYYMM months to compact (default: every complete month)",
+    )
+    parser.add_argument(
+        "--delete",
+        action="store_true",
+        help="Delete daily files once they are archived",
+    )
+    return parser.parse_args()
+
+
+def main(args):
+    storage = get_storage(args.data_directory)
+    for period in args.periods:
+        for month in months_to_compact(storage, period, args.months):
+            compact_month(storage, period, month, args.delete)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    main(args)
@@ -0,0 +1,54 @@
+"""
+Count how often each pollen trigger was reported for each location.
+
+Streams the current forecasts through analysis.utils.iter_records, so the
+whole history is read in bounded memory, and writes one row per location and
+trigger with the number of days it was among the "Today" triggers.
+"""
+
+import argparse
+
+from analysis.utils import count_triggers, iter_records
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--data_directory",
+        type=str,
+        default="s3_data",
+        help="Directory or s3://bucket URL with pollen forecasts",
+    )
+    parser.add_argument(
+        "--output_file",
+        type=str,
+        default="data/trigger_counts.csv",
+        help="CSV to write (default: data/trigger_counts.csv)",
+    )
+    parser.add_argument(
+        "--start_date",
+        type=str,
+        default=None,
+        help="Start date in YYYY-MM-DD format (default: earliest available)",
+    )
+    parser.add_argument(
+        "--end_date",
+        type=str,
+        default=None,
+        help="End date in YYYY-MM-DD format (default: latest available)",
+    )
+    return parser.parse_args()
+
+
+def main(args):
+    batches = iter_records(
+        args.data_directory, "current", args.start_date, args.end_date
+    )
+    counts = count_triggers(batches)
+    counts.to_csv(args.output_file, index=False, encoding="utf-8")
+    print(f"Wrote {len(counts)} location/trigger counts to {args.output_file}")
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    main(args)
@@ -1,54 +1,188 @@
+import argparse
+import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 
 import boto3
 from botocore.exceptions import ClientError
 from dotenv import load_dotenv
 
+from analysis.storage import (
+    PERIODS,
+    in_range,
+    listing_prefixes,
+    parse_archive_key,
+    parse_key,
+)
+
 load_dotenv()
 
+MANIFEST_NAME = ".s3_manifest.json"
+# Lambda bookkeeping that analysis never reads
+SKIP_PREFIXES = ("checkpoints/", "historic_state.json")
+# Undated objects needed to read historic deltas
+METADATA_KEYS = ["historic_manifest.json"]
+
+
+def load_manifest(local_directory):
+    """Local record of downloaded keys and their ETag/size."""
+    path = os.path.join(local_directory, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {"version": 1, "objects": {}}
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def save_manifest(local_directory, manifest):
+    path = os.path.join(local_directory, MANIFEST_NAME)
+    with open(f"{path}.tmp", "w") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(f"{path}.tmp", path)
+
 
-def download_s3_bucket(bucket_name, local_directory):
+def lookback_start(manifest, lookback_days):
+    """YYYYMMDD to re-check from, or None if nothing has been downloaded.
+
+    Only the last `lookback_days` before the newest downloaded day are
+    re-listed to pick up late or rewritten objects.
+    """
+    dates = [parsed[0] for parsed in map(parse_key, manifest["objects"]) if parsed]
+    if not dates:
+        return None
+    cutoff = datetime.strptime(max(dates), "%Y%m%d") - timedelta(days=lookback_days)
+    return cutoff.strftime("%Y%m%d")
+
+
+def list_objects(s3_client, bucket_name, periods, start=None, end=None):
+    """Objects for `periods` dated within [start, end], plus delta metadata.
+
+    Monthly archives from scripts/compact_s3_data.py are included when their
+    month overlaps the range.
     """
-    Download all files from an S3 bucket to a local directory.
-    Skip files that already exist locally.
+    paginator = s3_client.get_paginator("list_objects_v2")
+
+    prefixes = listing_prefixes(periods, start, end)
+    if start is not None:
+        prefixes = METADATA_KEYS + prefixes
+
+    for prefix in prefixes:
+        for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
+            for obj in page.get("Contents", []):
+                key = obj["Key"]
+                if key.startswith(SKIP_PREFIXES):
+                    continue
+                archived = parse_archive_key(key)
+                if archived is not None:
+                    month, period = archived
+                    if period in periods and in_range(
+                        month, start and start[:6], end and end[:6]
+                    ):
+                        yield obj
+                    continue
+                parsed = parse_key(key)
+                if parsed is None:
+                    if key in METADATA_KEYS and "historic_delta" in periods:
+                        yield obj
+                    continue
+                day, period = parsed
+                if period in periods and in_range(day, start, end):
+                    yield obj
+
+
+def is_current(obj, manifest, local_directory):
+    local_file_path = os.path.join(local_directory, obj["Key"])
+    if not os.path.exists(local_file_path):
+        return False
+
+    entry = manifest["objects"].get(obj["Key"])
+    if entry is None:
+        # Downloaded before the manifest existed; adopt it if the size matches
+        if os.path.getsize(local_file_path) != obj["Size"]:
+            return False
+        entry = manifest["objects"][obj["Key"]] = {
+            "etag": obj["ETag"],
+            "size": obj["Size"],
+        }
+    return entry["etag"] == obj["ETag"] and entry["size"] == obj["Size"]
+
+
+def download_s3_bucket(
+    bucket_name,
+    local_directory,
+    max_workers=16,
+    lookback_days=7,
+    full=False,
+    start_date=None,
+    end_date=None,
+    periods=None,
+):
+    """
+    Sync an S3 bucket to a local directory.
+
+    Objects whose ETag and size match the local manifest are skipped, and
+    unless `full` is set only keys from the last `lookback_days` of already
+    downloaded history are listed. New or changed objects are downloaded
+    concurrently. Date and period filters are turned into prefix listings
+    for both the flat and the partitioned key layout.
 
     Args:
         bucket_name (str): Name of the S3 bucket
         local_directory (str): Local directory to save files
+        max_workers (int): Concurrent downloads
+        lookback_days (int): Days of known history to re-check for changes
+        full (bool): List the whole bucket instead of recent keys only
+        start_date (str): Earliest date to sync, YYYY-MM-DD (default: all)
+        end_date (str): Latest date to sync, YYYY-MM-DD (default: today)
+        periods (list): Periods to sync (default: all)
     """
     # Create S3 client
     s3_client = boto3.client("s3")
 
     try:
         # Create local directory if it doesn't exist
-        if not os.path.exists(local_directory):
-            os.makedirs(local_directory)
+        os.makedirs(local_directory, exist_ok=True)
+
+        manifest = load_manifest(local_directory)
+        periods = periods or PERIODS
+        start = start_date.replace("-", "") if start_date else None
+        end = end_date.replace("-", "") if end_date else None
+        if not full:
+            recent = lookback_start(manifest, lookback_days)
+            if recent is not None and (start is None or recent > start):
+                print(f"Listing keys from {recent}")
+                start = recent
+        if start is not None and end is None:
+            end = date.today().strftime("%Y%m%d")
 
-        # List all objects in the bucket
-        paginator = s3_client.get_paginator("list_objects_v2")
-        page_iterator = paginator.paginate(Bucket=bucket_name)
+        pending = [
+            obj
+            for obj in list_objects(s3_client, bucket_name, periods, start, end)
+            if not is_current(obj, manifest, local_directory)
+        ]
 
-        # Download each object
-        for page in page_iterator:
-            if "Contents" in page:
-                for obj in page["Contents"]:
-                    # Get the file path
-                    key = obj["Key"]
-                    local_file_path = os.path.join(local_directory, key)
+        def download(obj):
+            key = obj["Key"]
+            local_file_path = os.path.join(local_directory, key)
 
-                    # Skip if file already exists
-                    if os.path.exists(local_file_path):
-                        print(f"Skipping (already exists): {key}")
-                        continue
+            # Create directories if the file is in a subdirectory
+            os.makedirs(os.path.dirname(local_file_path), exist_ok=True)
 
-                    # Create directories if the file is in a subdirectory
-                    os.makedirs(os.path.dirname(local_file_path), exist_ok=True)
+            print(f"Downloading: {key}")
+            s3_client.download_file(bucket_name, key, local_file_path)
+            return obj
 
-                    # Download the file
-                    print(f"Downloading: {key}")
-                    s3_client.download_file(bucket_name, key, local_file_path)
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for obj in executor.map(download, pending):
+                    manifest["objects"][obj["Key"]] = {
+                        "etag": obj["ETag"],
+                        "size": obj["Size"],
+                    }
+        finally:
+            save_manifest(local_directory, manifest)
 
-        print("Download completed successfully!")
+        print(f"Download completed successfully! ({len(pending)} new or changed)")
 
     except ClientError as e:
         print(f"Error: {e}")
@@ -58,8 +192,60 @@ def download_s3_bucket(bucket_name, local_directory):
         raise
 
 
-# Usage example
+def parse_args():
+    parser = argparse.ArgumentParser(description="Sync pollen data from S3.")
+    parser.add_argument(
+        "--bucket_name",
+        type=str,
+        default=os.getenv("AWS_BUCKET_NAME"),
+        help="S3 bucket (default: $AWS_BUCKET_NAME)",
+    )
+    parser.add_argument("--local_directory", type=str, default="s3_data")
+    parser.add_argument(
+        "--workers", type=int, default=16, help="Concurrent downloads (default: 16)"
+    )
+    parser.add_argument(
+        "--lookback_days",
+        type=int,
+        default=7,
+        help="Days of already-downloaded history to re-check (default: 7)",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="List the whole bucket, re-checking every object",
+    )
+    parser.add_argument(
+        "--start_date",
+        type=str,
+        default=None,
+        help="Start date in YYYY-MM-DD format (default: earliest available)",
+    )
+    parser.add_argument(
+        "--end_date",
+        type=str,
+        default=None,
+        help="End date in YYYY-MM-DD format (default: today)",
+    )
+    parser.add_argument(
+        "--periods",
+        nargs="+",
+        choices=PERIODS,
+        default=None,
+        help="Periods to sync (default: all)",
+    )
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    bucket_name = os.getenv("AWS_BUCKET_NAME")
-    local_directory = "s3_data"
-    download_s3_bucket(bucket_name, local_directory)
+    args = parse_args()
+    download_s3_bucket(
+        args.bucket_name,
+        args.local_directory,
+        max_workers=args.workers,
+        lookback_days=args.lookback_days,
+        full=args.full,
+        start_date=args.start_date,
+        end_date=args.end_date,
+        periods=args.periods,
+    )
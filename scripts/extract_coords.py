@@ -1,29 +1,15 @@
-#!/usr/bin/env python3
 """Extract station coordinates from merged_2025.json into data/station_coords.json.
 
 Maps "CITY, ST" format from merged_2025.json to "City State" format used in collated.csv.
+Run from the repository root as `python -m scripts.extract_coords`.
 """
 import csv
 import json
 from pathlib import Path
 
-ROOT = Path(__file__).resolve().parent.parent
+from analysis.locations import location_label
 
-STATE_ABBREV = {
-    'AL': 'Alabama', 'AK': 'Alaska', 'AZ': 'Arizona', 'AR': 'Arkansas',
-    'CA': 'California', 'CO': 'Colorado', 'CT': 'Connecticut', 'DE': 'Delaware',
-    'FL': 'Florida', 'GA': 'Georgia', 'HI': 'Hawaii', 'ID': 'Idaho',
-    'IL': 'Illinois', 'IN': 'Indiana', 'IA': 'Iowa', 'KS': 'Kansas',
-    'KY': 'Kentucky', 'LA': 'Louisiana', 'ME': 'Maine', 'MD': 'Maryland',
-    'MA': 'Massachusetts', 'MI': 'Michigan', 'MN': 'Minnesota', 'MS': 'Mississippi',
-    'MO': 'Missouri', 'MT': 'Montana', 'NE': 'Nebraska', 'NV': 'Nevada',
-    'NH': 'New Hampshire', 'NJ': 'New Jersey', 'NM': 'New Mexico', 'NY': 'New York',
-    'NC': 'North Carolina', 'ND': 'North Dakota', 'OH': 'Ohio', 'OK': 'Oklahoma',
-    'OR': 'Oregon', 'PA': 'Pennsylvania', 'RI': 'Rhode Island', 'SC': 'South Carolina',
-    'SD': 'South Dakota', 'TN': 'Tennessee', 'TX': 'Texas', 'UT': 'Utah',
-    'VT': 'Vermont', 'VA': 'Virginia', 'WA': 'Washington', 'WV': 'West Virginia',
-    'WI': 'Wisconsin', 'WY': 'Wyoming', 'DC': 'District of Columbia',
-}
+ROOT = Path(__file__).resolve().parent.parent
 
 
 def main():
@@ -42,9 +28,7 @@ def main():
         parts = merged_name.split(', ')
         if len(parts) != 2:
             continue
-        city = parts[0].title()
-        state_full = STATE_ABBREV.get(parts[1], parts[1])
-        csv_name = f'{city} {state_full}'
+        csv_name = location_label(merged_name)
         if csv_name in csv_locs:
             coords[csv_name] = {'lat': round(info['lat'], 4), 'lon': round(info['lon'], 4)}
 
@@ -0,0 +1,181 @@
+"""
+Local stand-in for the pollen.com endpoints used by lambda_src/pollen_data.py.
+
+Replays recorded responses so fetch strategies can be benchmarked offline:
+   /api/forecast/{period}/pollen/{zip}  one line of data/example_forecasts/{date}_{period}.jsonl
+   /api/map                             lambda_src/map_augmented.json
+   /sitemap.xml                         built from data/sitemap.json
+
+Latency, server errors and 429 throttling can be injected to exercise the
+rate limiter, retries and hedging. Point the fetchers at it with
+POLLEN_BASE_URL=http://127.0.0.1:{port}.
+"""
+
+import argparse
+import glob
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DATA_DIR = os.path.join("data", "example_forecasts")
+MAP_PATH = os.path.join("lambda_src", "map_augmented.json")
+SITEMAP_PATH = os.path.join("data", "sitemap.json")
+
+
+def load_responses(data_dir=DATA_DIR, date=None):
+    """Map (period, ZIP) -> recorded response body for one day of forecasts."""
+    if date is None:
+        date = max(
+            os.path.basename(p).split("_")[0] for p in glob.glob(f"{data_dir}/*")
+        )
+
+    responses = {}
+    for period in ["current", "extended", "historic"]:
+        with open(os.path.join(data_dir, f"{date}_{period}.jsonl"), "r") as f:
+            for line in f:
+                zip = json.loads(line)["Location"]["ZIP"]
+                responses[(period, zip)] = line.strip().encode("utf-8")
+
+    with open(MAP_PATH, "rb") as f:
+        responses["map"] = f.read()
+
+    with open(SITEMAP_PATH, "r") as f:
+        urls = json.load(f)
+    responses["sitemap"] = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        + "".join(f"<url><loc>{url}</loc></url>" for url in urls)
+        + "</urlset>"
+    ).encode("utf-8")
+
+    return responses
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    # Keep-alive, so pooled sessions behave as they would against pollen.com
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; avoid Nagle/delayed-ACK stalls
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body=b"", content_type="application/json", headers=()):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        server.count_request()
+        options = server.options
+
+        latency = (
+            random.expovariate(1 / options.latency_ms) if options.latency_ms else 0
+        )
+        if random.random() < options.tail_rate:
+            latency += options.tail_ms
+        time.sleep(latency / 1000)
+
+        if random.random() < options.throttle_rate:
+            retry_after = (("Retry-After", str(options.retry_after)),)
+            return self._send(429, headers=retry_after)
+        if random.random() < options.error_rate:
+            return self._send(503)
+
+        parts = self.path.strip("/").split("/")
+        if parts == ["api", "map"]:
+            return self._send(200, server.responses["map"])
+        if parts == ["sitemap.xml"]:
+            return self._send(200, server.responses["sitemap"], "application/xml")
+        if len(parts) == 5 and parts[:2] == ["api", "forecast"]:
+            body = server.responses.get((parts[2], parts[4]))
+            if body is not None:
+                return self._send(200, body)
+        self._send(404)
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, options, responses):
+        super().__init__(address, StubHandler)
+        self.options = options
+        self.responses = responses
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def count_request(self):
+        with self._lock:
+            self.requests += 1
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def start_stub_server(options, port=0):
+    """Serve in a background thread; port=0 picks a free port."""
+    server = StubServer(("127.0.0.1", port), options, load_responses(date=options.date))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def add_stub_arguments(parser):
+    parser.add_argument(
+        "--date",
+        type=str,
+        default=None,
+        help="YYYYMMDD of example_forecasts to replay (default: latest)",
+    )
+    parser.add_argument(
+        "--latency_ms",
+        type=float,
+        default=50,
+        help="Mean of the exponential per-request latency (default: 50)",
+    )
+    parser.add_argument(
+        "--tail_rate",
+        type=float,
+        default=0.01,
+        help="Fraction of requests given an extra --tail_ms delay",
+    )
+    parser.add_argument("--tail_ms", type=float, default=2000)
+    parser.add_argument(
+        "--error_rate", type=float, default=0.0, help="Fraction answered with 503"
+    )
+    parser.add_argument(
+        "--throttle_rate", type=float, default=0.0, help="Fraction answered with 429"
+    )
+    parser.add_argument(
+        "--retry_after",
+        type=float,
+        default=1,
+        help="Retry-After seconds sent with 429 responses",
+    )
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, default=8000)
+    add_stub_arguments(parser)
+    return parser.parse_args()
+
+
+def main(args):
+    server = StubServer(("127.0.0.1", args.port), args, load_responses(date=args.date))
+    print(f"Serving pollen.com stand-in at {server.base_url}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    main(args)
@@ -21,6 +21,12 @@ def parse_args():
     parser.add_argument("--historic", action="store_true")
     parser.add_argument("--current", action="store_true")
     parser.add_argument("--extended", action="store_true")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Concurrent requests per period (default: 1, sequential)",
+    )
 
     return parser.parse_args()
 
@@ -50,17 +56,17 @@ def main(args):
             print(f"An error occurred: {e}")
 
     if args.current:
-        forecasts = fetch_all_forecasts("current")
+        forecasts = fetch_all_forecasts("current", max_workers=args.workers)
         with jsonlines.open(f"data/{date}_current.jsonl", mode="w") as f:
             f.write_all(forecasts)
 
     if args.extended:
-        forecasts = fetch_all_forecasts("extended")
+        forecasts = fetch_all_forecasts("extended", max_workers=args.workers)
         with jsonlines.open(f"data/{date}_extended.jsonl", mode="w") as f:
             f.write_all(forecasts)
 
     if args.historic:
-        forecasts = fetch_all_forecasts("historic")
+        forecasts = fetch_all_forecasts("historic", max_workers=args.workers)
         with jsonlines.open(f"data/{date}_historic.jsonl", mode="w") as f:
             f.write_all(forecasts)
 
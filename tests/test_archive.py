@@ -0,0 +1,60 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from analysis.archive import load_archive, pack_records, records_match, unpack_records
+from analysis.utils import iter_daily_records
+
+EXAMPLES = Path(__file__).resolve().parent.parent / "data" / "example_forecasts"
+DATES = ["20240602", "20240603", "20240604"]
+
+
+def read_days(period):
+    days = []
+    for date in DATES:
+        with open(EXAMPLES / f"{date}_{period}.jsonl") as f:
+            days.append((date, [json.loads(line) for line in f]))
+    return days
+
+
+@pytest.mark.parametrize("period", ["current", "extended", "historic"])
+def test_pack_unpack_round_trip(period):
+    days = read_days(period)
+
+    unpacked = list(unpack_records(load_archive(pack_records(period, days))))
+
+    assert [day for day, _ in unpacked] == DATES
+    for (_, records), (_, original) in zip(unpacked, days):
+        assert records_match(records, original)
+
+
+def test_unpack_selected_days_without_triggers():
+    days = read_days("current")
+    arrays = load_archive(pack_records("current", days))
+
+    ((day, records),) = unpack_records(arrays, {"20240603"}, triggers=False)
+
+    assert day == "20240603"
+    original = days[1][1]
+    for record, expected in zip(records, original):
+        periods = record["Location"]["periods"]
+        assert all("Triggers" not in p for p in periods)
+        assert [p["Index"] for p in periods] == [
+            p["Index"] for p in expected["Location"]["periods"]
+        ]
+
+
+def test_archived_and_loose_days_read_alike(tmp_path):
+    days = read_days("current")
+    month = tmp_path / "current" / "2024" / "06"
+    month.mkdir(parents=True)
+    (month / "202406_current.npz").write_bytes(pack_records("current", days[:2]))
+    with open(tmp_path / "20240604_current.jsonl", "w") as f:
+        f.write("\n".join(json.dumps(r) for r in days[2][1]))
+
+    read = list(iter_daily_records(tmp_path, "current"))
+
+    assert [day for day, _ in read] == DATES
+    for (_, records), (_, original) in zip(read, days):
+        assert records_match(records, original)
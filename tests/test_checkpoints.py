@@ -0,0 +1,69 @@
+from lambda_src.checkpoints import DailyCheckpoint
+
+
+class NoSuchKey(Exception):
+    pass
+
+
+class FakeS3:
+    """The few S3 client calls DailyCheckpoint makes, over a dict."""
+
+    class exceptions:
+        NoSuchKey = NoSuchKey
+
+    def __init__(self):
+        self.objects = {}
+
+    def get_object(self, Bucket, Key):
+        if Key not in self.objects:
+            raise NoSuchKey(Key)
+        return {"Body": FakeBody(self.objects[Key])}
+
+    def put_object(self, Bucket, Key, Body):
+        self.objects[Key] = Body
+
+    def delete_objects(self, Bucket, Delete):
+        for obj in Delete["Objects"]:
+            self.objects.pop(obj["Key"], None)
+
+    def get_paginator(self, name):
+        return self
+
+    def paginate(self, Bucket, Prefix):
+        keys = sorted(key for key in self.objects if key.startswith(Prefix))
+        yield {"Contents": [{"Key": key} for key in keys]}
+
+
+class FakeBody:
+    def __init__(self, body):
+        self.body = body
+
+    def read(self):
+        return self.body.encode()
+
+
+def test_retry_resumes_and_clear_removes_the_day():
+    s3 = FakeS3()
+    s3.put_object("b", "20240602_current.jsonl.gz", "stored data")
+    fetched = []
+
+    def fetch(period, zip):
+        fetched.append((period, zip))
+        return {"zip": zip}
+
+    checkpoint = DailyCheckpoint(s3, "b", "20240602")
+    checkpointed = checkpoint.fetcher(fetch)
+    checkpointed("current", "00001")
+    checkpoint.finalize("current")
+    checkpointed("extended", "00001")
+
+    # A retry of the failed run reuses the stored response and skips "current"
+    retry = DailyCheckpoint(s3, "b", "20240602")
+    assert retry.finalized("current")
+    assert retry.fetcher(fetch)("extended", "00001") == {"zip": "00001"}
+    assert fetched == [("current", "00001"), ("extended", "00001")]
+
+    retry.clear()
+
+    assert list(s3.objects) == ["20240602_current.jsonl.gz"]
+    assert not retry.finalized("current")
@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+
+from analysis.utils import PollenCube, read_cube_header
+
+
+def frame():
+    return pd.DataFrame(
+        {
+            "date": ["2024-06-01", "2024-06-03", "2024-06-01", "2024-06-02"],
+            "location": ["B, ST", "B, ST", "A, ST", "A, ST"],
+            # Values float32 cannot hold exactly
+            "index": [0.1, 7.3, 11.9, 3.333333333],
+        }
+    )
+
+
+def test_from_frame_to_frame_round_trip_is_exact():
+    cube = PollenCube.from_frame(frame())
+
+    assert cube.locations == ["A, ST", "B, ST"]
+    assert cube.shape == (2, 3)
+    assert cube.values.dtype == np.float64
+    assert np.isnan(cube.row("B, ST")[1])
+
+    expected = frame().sort_values(["location", "date"], ignore_index=True)
+    pd.testing.assert_frame_equal(
+        cube.to_frame(), expected, check_dtype=False, check_exact=True
+    )
+
+
+def test_save_and_open_round_trip(tmp_path):
+    cube = PollenCube.from_frame(frame())
+    path = tmp_path / "cube.bin"
+
+    cube.save(path, source="abc")
+    opened = PollenCube.open(path)
+
+    assert read_cube_header(path)["source"] == "abc"
+    assert opened.locations == cube.locations
+    np.testing.assert_array_equal(opened.dates, cube.dates)
+    np.testing.assert_array_equal(opened.values, cube.values)
+    np.testing.assert_array_equal(opened.mask, cube.mask)
+
+
+def test_integral_fills_gaps_and_carries_last_value():
+    cube = PollenCube.from_frame(frame())
+
+    # A: 11.9 + 3.333333333 + carried 3.333333333; B: 0.1 + 3.7 + 7.3
+    np.testing.assert_allclose(
+        cube.integral(), [11.9 + 2 * 3.333333333, 0.1 + 3.7 + 7.3]
+    )
@@ -0,0 +1,39 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from analysis.utils import decode_without_triggers
+
+EXAMPLES = Path(__file__).resolve().parent.parent / "data" / "example_forecasts"
+
+
+def without_triggers(record):
+    for period in record["Location"]["periods"]:
+        period.pop("Triggers", None)
+    return record
+
+
+@pytest.mark.parametrize("period", ["current", "extended", "historic"])
+def test_matches_full_decode_without_triggers(period):
+    with open(EXAMPLES / f"20240602_{period}.jsonl") as f:
+        lines = f.read().splitlines()
+
+    for line in lines:
+        assert decode_without_triggers(line) == without_triggers(json.loads(line))
+
+
+@pytest.mark.parametrize(
+    "periods",
+    [
+        [{"Period": "2024-06-02T00:00:00", "Index": 3.1, "Triggers": []}],
+        [{"Triggers": [{"LGID": 1, "Name": "Oak"}], "Index": 3.1}],
+        [{"Index": 3.1, "Triggers": [{"LGID": 1, "Name": "Oak"}]}],
+        [{"Index": 3.1, "Note": 'no "Triggers": [] here'}],
+    ],
+)
+def test_odd_trigger_layouts(periods):
+    record = {"Type": "pollen", "Location": {"ZIP": "57401", "periods": periods}}
+    line = json.dumps(record)
+
+    assert decode_without_triggers(line) == without_triggers(json.loads(line))
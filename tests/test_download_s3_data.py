@@ -0,0 +1,141 @@
+import json
+
+import pytest
+
+from scripts import download_s3_data
+from scripts.download_s3_data import (
+    MANIFEST_NAME,
+    download_s3_bucket,
+    is_current,
+    list_objects,
+    lookback_start,
+)
+
+
+class FakeS3:
+    """Bucket of key -> bytes with list_objects_v2 pagination and downloads."""
+
+    def __init__(self, objects):
+        self.objects = dict(objects)
+        self.lists = []
+        self.downloads = []
+
+    def put(self, key, body):
+        self.objects[key] = body
+
+    def get_paginator(self, name):
+        return self
+
+    def paginate(self, Bucket, Prefix):
+        self.lists.append(Prefix)
+        contents = [
+            {"Key": k, "ETag": f'"{hash(v)}"', "Size": len(v)}
+            for k, v in sorted(self.objects.items())
+            if k.startswith(Prefix)
+        ]
+        yield {"Contents": contents}
+
+    def download_file(self, Bucket, Key, Filename):
+        self.downloads.append(Key)
+        with open(Filename, "wb") as f:
+            f.write(self.objects[Key])
+
+
+OBJECTS = {
+    "20240601_current.jsonl.gz": b"a",
+    "20240601_historic.jsonl.gz": b"bb",
+    "current/2024/06/20240602_current.jsonl.gz": b"ccc",
+    "current/2024/05/202405_current.npz": b"dddd",
+    "historic_delta/2024/06/20240602_historic_delta.jsonl.gz": b"e",
+    "historic_manifest.json": b"{}",
+    "checkpoints/20240602/current.jsonl": b"f",
+    "historic_state.json": b"{}",
+}
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    fake = FakeS3(OBJECTS)
+    monkeypatch.setattr(download_s3_data.boto3, "client", lambda name: fake)
+    return fake
+
+
+def test_sync_downloads_new_objects_once(s3, tmp_path):
+    download_s3_bucket("bucket", tmp_path)
+
+    skipped = {"checkpoints/20240602/current.jsonl", "historic_state.json"}
+    assert sorted(s3.downloads) == sorted(set(OBJECTS) - skipped)
+    for key in s3.downloads:
+        assert (tmp_path / key).read_bytes() == OBJECTS[key]
+    with open(tmp_path / MANIFEST_NAME) as f:
+        assert sorted(json.load(f)["objects"]) == sorted(s3.downloads)
+
+    s3.downloads.clear()
+    download_s3_bucket("bucket", tmp_path)
+    assert s3.downloads == []
+
+
+def test_sync_redownloads_changed_objects(s3, tmp_path):
+    download_s3_bucket("bucket", tmp_path)
+    s3.downloads.clear()
+
+    s3.put("current/2024/06/20240602_current.jsonl.gz", b"changed")
+    s3.put("current/2024/06/20240603_current.jsonl.gz", b"new")
+    download_s3_bucket("bucket", tmp_path)
+
+    assert sorted(s3.downloads) == [
+        "current/2024/06/20240602_current.jsonl.gz",
+        "current/2024/06/20240603_current.jsonl.gz",
+    ]
+    assert (tmp_path / "current/2024/06/20240602_current.jsonl.gz").read_bytes() == (
+        b"changed"
+    )
+
+
+def test_later_syncs_only_list_the_lookback_window(s3, tmp_path):
+    download_s3_bucket("bucket", tmp_path)
+    assert s3.lists == [""]
+
+    s3.lists.clear()
+    download_s3_bucket("bucket", tmp_path, lookback_days=1)
+
+    assert "" not in s3.lists
+    assert "202406" in s3.lists and "current/2024/06/" in s3.lists
+    assert "historic_manifest.json" in s3.lists
+
+    s3.lists.clear()
+    download_s3_bucket("bucket", tmp_path, full=True)
+    assert s3.lists == [""]
+
+
+def test_lookback_start():
+    manifest = {"objects": {"20240601_current.jsonl.gz": {}, "x/20240610_a.jsonl": {}}}
+
+    assert lookback_start(manifest, 7) == "20240603"
+    assert lookback_start({"objects": {"historic_manifest.json": {}}}, 7) is None
+
+
+def test_list_objects_filters_periods_and_dates(s3):
+    keys = [
+        obj["Key"]
+        for obj in list_objects(s3, "bucket", ["current"], "20240602", "20240630")
+    ]
+
+    assert keys == ["current/2024/06/20240602_current.jsonl.gz"]
+
+
+def test_is_current_adopts_files_downloaded_before_the_manifest(tmp_path):
+    key = "20240601_current.jsonl.gz"
+    obj = {"Key": key, "ETag": '"abc"', "Size": 3}
+    manifest = {"objects": {}}
+    assert not is_current(obj, manifest, tmp_path)
+
+    (tmp_path / key).write_bytes(b"ab")
+    assert not is_current(obj, manifest, tmp_path)
+    assert manifest["objects"] == {}
+
+    (tmp_path / key).write_bytes(b"abc")
+    assert is_current(obj, manifest, tmp_path)
+    assert manifest["objects"][key] == {"etag": '"abc"', "size": 3}
+
+    assert not is_current(dict(obj, ETag='"new"'), manifest, tmp_path)
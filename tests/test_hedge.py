@@ -0,0 +1,64 @@
+import time
+
+from lambda_src.hedge import Hedger
+
+
+def test_only_recorded_latencies_set_the_threshold():
+    hedger = Hedger(percentile=50, min_samples=3)
+    assert hedger.call(lambda: "fast") == "fast"
+    assert hedger.threshold() is None
+
+    for seconds in [0.01, 0.02, 0.03]:
+        hedger.record(seconds)
+    assert hedger.threshold() == 0.02
+
+
+def test_slow_call_is_hedged_and_duplicate_wins():
+    hedger = Hedger(percentile=50, min_samples=1)
+    hedger.record(0.01)
+
+    result = hedger.call(lambda: time.sleep(1) or "slow", lambda: "duplicate")
+
+    assert result == "duplicate"
+    assert hedger.stats()["hedged"] == 1
+    assert hedger.stats()["hedge_wins"] == 1
+
+
+class Response:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+
+def test_fast_throttled_response_does_not_beat_a_slow_success():
+    hedger = Hedger(percentile=50, min_samples=1)
+    hedger.record(0.01)
+
+    def primary():
+        time.sleep(0.05)
+        return Response(429)
+
+    def duplicate():
+        time.sleep(0.3)
+        return Response(200)
+
+    response = hedger.call(primary, duplicate, accept=lambda r: r.ok)
+
+    assert response.status_code == 200
+    assert hedger.stats()["hedge_wins"] == 1
+
+
+def test_no_accepted_result_returns_the_primary():
+    hedger = Hedger(percentile=50, min_samples=1)
+    hedger.record(0.01)
+
+    def primary():
+        time.sleep(0.05)
+        return Response(429)
+
+    response = hedger.call(primary, lambda: Response(503), accept=lambda r: r.ok)
+
+    assert response.status_code == 429
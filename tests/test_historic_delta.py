@@ -0,0 +1,75 @@
+import json
+from pathlib import Path
+
+from analysis.utils import load_historic_revisions, rebuild_historic_snapshot
+from lambda_src.historic_delta import diff_snapshot
+
+EXAMPLES = Path(__file__).resolve().parent.parent / "data" / "example_forecasts"
+DATES = ["20240602", "20240603", "20240604"]
+
+
+def read_day(date):
+    with open(EXAMPLES / f"{date}_historic.jsonl") as f:
+        return [json.loads(line) for line in f]
+
+
+def store_deltas(root, days):
+    """Write each day's delta object and the manifest, as the Lambda does."""
+    state = {}
+    snapshots = {}
+    for date, forecasts in days.items():
+        deltas, state = diff_snapshot(state, forecasts)
+        key = f"{date}_historic_delta.jsonl"
+        (root / key).write_text("\n".join(json.dumps(d) for d in deltas))
+        snapshots[date] = {"key": key}
+    manifest = {"version": 1, "snapshots": snapshots}
+    (root / "historic_manifest.json").write_text(json.dumps(manifest))
+
+
+def test_deltas_hold_only_new_and_revised_periods():
+    first, second = read_day(DATES[0]), read_day(DATES[1])
+    deltas, _ = diff_snapshot(diff_snapshot({}, first)[1], second)
+
+    for before, after, delta in zip(first, second, deltas):
+        seen = {
+            p["Period"].split("T")[0]: p["Index"] for p in before["Location"]["periods"]
+        }
+        for period in delta["Location"]["periods"]:
+            day = period["Period"].split("T")[0]
+            assert day not in seen or seen[day] != period["Index"]
+            if day in seen:
+                assert period["PreviousIndex"] == seen[day]
+    assert sum(len(d["Location"]["periods"]) for d in deltas) < sum(
+        len(f["Location"]["periods"]) for f in second
+    )
+
+
+def test_rebuild_round_trips_every_day(tmp_path):
+    days = {date: read_day(date) for date in DATES}
+    store_deltas(tmp_path, days)
+
+    for date, forecasts in days.items():
+        assert rebuild_historic_snapshot(tmp_path, date) == forecasts
+
+
+def test_revisions_list_changed_values(tmp_path):
+    days = {date: read_day(date) for date in DATES}
+    # Revise the index a location reported for its first day yesterday
+    revised = days[DATES[1]][0]["Location"]["periods"][0]
+    previous = revised["Index"]
+    revised["Index"] = previous + 1.0
+    store_deltas(tmp_path, days)
+
+    revisions = load_historic_revisions(tmp_path)
+
+    assert revisions.to_dict("records") == [
+        {
+            "snapshot": DATES[1],
+            "date": revised["Period"].split("T")[0],
+            "location": "ABERDEEN, SD",
+            "previous_index": previous,
+            "index": previous + 1.0,
+        }
+    ]
+    # Later days still rebuild exactly
+    assert rebuild_historic_snapshot(tmp_path, DATES[2]) == days[DATES[2]]
@@ -0,0 +1,170 @@
+import json
+import random
+import threading
+import time
+from argparse import Namespace
+from pathlib import Path
+
+import pytest
+
+from lambda_src import pollen_data
+from scripts.pollen_stub_server import StubServer, load_responses
+
+ROOT = Path(__file__).resolve().parent.parent
+
+ZIPS = [loc["ZIP"] for loc in pollen_data.load_locations().values()]
+
+
+def test_fetch_pipelined_returns_each_period_in_location_order():
+    calls = []
+    lock = threading.Lock()
+
+    def fetch(period, zip):
+        with lock:
+            calls.append((period, zip))
+        time.sleep(random.uniform(0, 0.002))
+        return {"period": period, "ZIP": zip}
+
+    completed = {}
+    pollen_data.fetch_pipelined(
+        ["current", "extended"],
+        lambda period, forecasts: completed.setdefault(period, forecasts),
+        max_workers=8,
+        fetch=fetch,
+    )
+
+    assert sorted(completed) == ["current", "extended"]
+    for period, forecasts in completed.items():
+        assert forecasts == [{"period": period, "ZIP": zip} for zip in ZIPS]
+    assert len(calls) == 2 * len(ZIPS)
+
+
+def test_fetch_pipelined_schedules_location_by_location():
+    calls = []
+
+    def fetch(period, zip):
+        calls.append((period, zip))
+        return zip
+
+    pollen_data.fetch_pipelined(
+        ["current", "historic"], lambda *_: None, max_workers=1, fetch=fetch
+    )
+
+    assert calls[:4] == [
+        ("current", ZIPS[0]),
+        ("historic", ZIPS[0]),
+        ("current", ZIPS[1]),
+        ("historic", ZIPS[1]),
+    ]
+
+
+def test_fetch_pipelined_completes_periods_as_they_finish():
+    current_done = threading.Event()
+    order = []
+
+    def fetch(period, zip):
+        # extended can only finish once current has been handed over
+        if period == "extended" and zip == ZIPS[-1]:
+            assert current_done.wait(timeout=5)
+        return zip
+
+    def on_complete(period, forecasts):
+        order.append(period)
+        current_done.set()
+
+    pollen_data.fetch_pipelined(
+        ["extended", "current"], on_complete, max_workers=4, fetch=fetch
+    )
+
+    assert order == ["current", "extended"]
+
+
+def test_fetch_pipelined_raises_fetch_errors():
+    def fetch(period, zip):
+        if zip == ZIPS[3]:
+            raise RuntimeError("boom")
+        return zip
+
+    with pytest.raises(RuntimeError, match="boom"):
+        pollen_data.fetch_pipelined(["current"], lambda *_: None, fetch=fetch)
+
+
+class FlakyStubServer(StubServer):
+    """Stub server answering the first `failures` requests with `status`."""
+
+    def __init__(self, status, failures):
+        options = Namespace(
+            latency_ms=0,
+            tail_rate=0,
+            tail_ms=0,
+            error_rate=0,
+            throttle_rate=0,
+            retry_after=0,
+        )
+        super().__init__(("127.0.0.1", 0), options, load_responses())
+        self.rate = "throttle_rate" if status == 429 else "error_rate"
+        self.failures = failures
+
+    def count_request(self):
+        super().count_request()
+        setattr(self.options, self.rate, float(self.requests <= self.failures))
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    monkeypatch.chdir(ROOT)
+    monkeypatch.setattr(pollen_data, "backoff_delay", lambda attempt: 0)
+    pollen_data.limiter.reset()
+    servers = []
+
+    def start(status=429, failures=0):
+        server = FlakyStubServer(status, failures)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        monkeypatch.setattr(pollen_data, "BASE_URL", server.base_url)
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+    pollen_data.limiter.reset()
+
+
+def recorded(period, zip):
+    date = max(
+        p.name.split("_")[0] for p in (ROOT / "data/example_forecasts").iterdir()
+    )
+    with open(ROOT / "data/example_forecasts" / f"{date}_{period}.jsonl") as f:
+        records = [json.loads(line) for line in f]
+    return next(r for r in records if r["Location"]["ZIP"] == zip)
+
+
+def test_fetch_forecast_from_stub_server(stub):
+    server = stub()
+
+    forecast = pollen_data.fetch_forecast("current", ZIPS[0])
+
+    assert forecast == recorded("current", ZIPS[0])
+    assert server.requests == 1
+
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_http_get_retries_throttled_and_failed_requests(stub, status):
+    server = stub(status, failures=2)
+
+    forecast = pollen_data.fetch_forecast("extended", ZIPS[1])
+
+    assert forecast == recorded("extended", ZIPS[1])
+    assert server.requests == 3
+
+
+def test_http_get_raises_once_retries_are_exhausted(stub, monkeypatch):
+    import requests
+
+    monkeypatch.setattr(pollen_data, "MAX_RETRIES", 1)
+    server = stub(429, failures=10)
+
+    with pytest.raises(requests.HTTPError):
+        pollen_data.fetch_forecast("current", ZIPS[0])
+    assert server.requests == 2
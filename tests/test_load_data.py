@@ -0,0 +1,78 @@
+import json
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+from analysis.utils import (
+    PollenCube,
+    iter_records,
+    load_current_forecast_data,
+    load_data,
+    running_integral,
+)
+
+EXAMPLES = Path(__file__).resolve().parent.parent / "data" / "example_forecasts"
+
+
+def test_rows_are_limited_to_the_date_range():
+    # Each historic file repeats ~30 days before its own date
+    data = load_data(EXAMPLES, "2024-06-03", "2024-06-04", cache=False)
+
+    assert sorted(data["date"].unique()) == ["2024-06-03", "2024-06-04"]
+    assert not data.duplicated(["date", "location"]).any()
+
+
+def test_unbounded_range_keeps_historic_window():
+    data = load_data(EXAMPLES, cache=False)
+
+    assert data["date"].min() < "2024-06-02"
+
+
+def test_range_without_files_is_empty():
+    data = load_data(EXAMPLES, "2023-01-01", "2023-01-31", cache=False)
+
+    assert data.empty
+    assert list(data.columns) == ["date", "location", "index"]
+
+
+def test_delta_mode_without_snapshots_in_range(tmp_path):
+    for path in EXAMPLES.glob("*_current.jsonl"):
+        shutil.copy(path, tmp_path)
+    manifest = {"snapshots": {"20240101": {"key": "20240101_historic_delta.jsonl"}}}
+    (tmp_path / "historic_manifest.json").write_text(json.dumps(manifest))
+
+    data = load_data(tmp_path, "2024-06-03", "2024-06-04", cache=False)
+
+    assert sorted(data["date"].unique()) == ["2024-06-03", "2024-06-04"]
+
+
+def test_running_integral_matches_cube_integral():
+    data = load_current_forecast_data(EXAMPLES, cache=False)
+    # Leave a gap in one location so the linear fill is exercised
+    gap = ("ABERDEEN, SD", "2024-06-03")
+    cube = PollenCube.from_frame(
+        data[(data["location"] != gap[0]) | (data["date"] != gap[1])]
+    )
+
+    def without_gap(batch):
+        hole = (batch["location"] == gap[0]) & (batch["date"] == np.datetime64(gap[1]))
+        return dict(batch, index=np.where(hole, np.nan, batch["index"]))
+
+    batches = iter_records(EXAMPLES, "current", triggers=False, batch_rows=100)
+    totals = running_integral(without_gap(batch) for batch in batches)
+
+    assert list(totals.index) == cube.locations
+    np.testing.assert_allclose(totals.to_numpy(), cube.integral(), rtol=1e-6)
+
+
+def test_backfilled_rows_are_sorted(tmp_path):
+    # Without 2024-06-03's current file its rows come from later snapshots
+    for path in EXAMPLES.glob("*.jsonl"):
+        if path.name != "20240603_current.jsonl":
+            shutil.copy(path, tmp_path)
+
+    data = load_data(tmp_path, cache=False)
+
+    assert (data["date"] == "2024-06-03").sum() == 245
+    assert data.equals(data.sort_values(["date", "location"], ignore_index=True))
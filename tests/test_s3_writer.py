@@ -0,0 +1,81 @@
+import gzip
+import json
+
+import pytest
+
+from lambda_src.s3_writer import MIN_PART_SIZE, JsonlUploader
+
+
+class FakeS3:
+    """Records single and multipart uploads like S3 would assemble them."""
+
+    def __init__(self):
+        self.objects = {}
+        self.parts = {}
+        self.aborted = []
+
+    def put_object(self, Bucket, Key, Body):
+        self.objects[Key] = Body
+
+    def create_multipart_upload(self, Bucket, Key):
+        upload_id = f"upload-{len(self.parts)}"
+        self.parts[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        self.parts[UploadId][PartNumber] = Body
+        return {"ETag": f'"{PartNumber}"'}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        numbers = [part["PartNumber"] for part in MultipartUpload["Parts"]]
+        assert numbers == sorted(self.parts[UploadId])
+        self.objects[Key] = b"".join(self.parts[UploadId][n] for n in numbers)
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.aborted.append(UploadId)
+
+
+def records(n, size=100):
+    return [{"ZIP": f"{i:05d}", "text": "x" * size} for i in range(n)]
+
+
+def jsonl(rows):
+    return "\n".join(json.dumps(row) for row in rows).encode("utf-8")
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_small_object_is_one_put(compress):
+    s3 = FakeS3()
+    rows = records(10)
+
+    with JsonlUploader(s3, "bucket", "key", compress=compress) as uploader:
+        uploader.write_all(rows)
+
+    body = s3.objects["key"]
+    assert (gzip.decompress(body) if compress else body) == jsonl(rows)
+    assert not s3.parts
+
+
+def test_large_object_is_uploaded_in_parts():
+    s3 = FakeS3()
+    rows = records(3000, size=4000)  # ~12 MB, so three parts
+
+    with JsonlUploader(s3, "bucket", "key", compress=False) as uploader:
+        uploader.write_all(rows)
+
+    (parts,) = s3.parts.values()
+    assert len(parts) == 3
+    assert all(len(parts[n]) == MIN_PART_SIZE for n in [1, 2])
+    assert s3.objects["key"] == jsonl(rows)
+
+
+def test_error_aborts_the_upload():
+    s3 = FakeS3()
+
+    with pytest.raises(RuntimeError):
+        with JsonlUploader(s3, "bucket", "key", compress=False) as uploader:
+            uploader.write_all(records(2000, size=4000))
+            raise RuntimeError("fetch failed")
+
+    assert s3.aborted == ["upload-0"]
+    assert "key" not in s3.objects
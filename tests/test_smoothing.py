@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis.utils import kalman_smooth, smooth_matrix, smooth_timeseries
+
+
+def filterpy_smooth(row, rts=False):
+    """The per-station filterpy smoother kalman_smooth replaced."""
+    filterpy = pytest.importorskip("filterpy.kalman")
+    kf = filterpy.KalmanFilter(dim_x=2, dim_z=1)
+    kf.F = np.array([[1.0, 1.0], [0.0, 1.0]])
+    kf.H = np.array([[1.0, 0.0]])
+    kf.R = 5
+    kf.Q = np.array([[0.1, 0.0], [0.0, 0.1]])
+    first = int(np.flatnonzero(~np.isnan(row))[0])
+    kf.x = np.array([[row[first]], [0.0]])
+    kf.P *= 100
+
+    xs, Ps = [], []
+    for measurement in row[first:]:
+        kf.predict()
+        kf.update(None if np.isnan(measurement) else measurement)
+        xs.append(kf.x.copy())
+        Ps.append(kf.P.copy())
+    xs, Ps = np.array(xs), np.array(Ps)
+    if rts:
+        xs = kf.rts_smoother(xs, Ps)[0]
+    return np.concatenate([np.full(first, np.nan), xs[:, 0, 0]])
+
+
+def rows_with_gaps():
+    rng = np.random.default_rng(0)
+    values = rng.uniform(0, 12, size=(6, 40))
+    values[1, :5] = np.nan
+    values[2, 10:14] = np.nan
+    values[3, rng.random(40) < 0.3] = np.nan
+    values[3, 0] = 4.0
+    values[4, 20:] = np.nan
+    return values
+
+
+@pytest.mark.parametrize("rts", [False, True])
+def test_kalman_smooth_matches_filterpy(rts):
+    values = rows_with_gaps()
+
+    smoothed = kalman_smooth(values, rts=rts)
+
+    expected = np.array([filterpy_smooth(row, rts) for row in values])
+    np.testing.assert_allclose(smoothed, expected, rtol=1e-9, atol=1e-9)
+
+
+def test_kalman_smooth_leaves_unobserved_rows_nan():
+    values = rows_with_gaps()
+    values[5] = np.nan
+
+    assert np.isnan(kalman_smooth(values)[5]).all()
+
+
+def per_location(values, method, **kwargs):
+    expected = np.full(values.shape, np.nan)
+    for i, row in enumerate(values):
+        seen = ~np.isnan(row)
+        if seen.any():
+            series = pd.Series(row[seen])
+            expected[i, seen] = smooth_timeseries(series, method, **kwargs)
+    return expected
+
+
+@pytest.mark.parametrize(
+    "method, kwargs",
+    [
+        ("sma", {"window": 5}),
+        ("savgol", {"window": 7, "polyorder": 2}),
+        ("lowess", {"n_records": 10}),
+        ("kalman", {}),
+        ("kalman", {"rts": True}),
+    ],
+)
+def test_smooth_matrix_matches_smooth_timeseries(method, kwargs):
+    values = rows_with_gaps()
+
+    smoothed = smooth_matrix(values, method=method, processes=1, **kwargs)
+
+    np.testing.assert_allclose(
+        smoothed, per_location(values, method, **kwargs), rtol=1e-9, atol=1e-12
+    )
+
+
+def test_smooth_matrix_lowess_in_worker_processes():
+    values = np.random.default_rng(1).uniform(0, 12, size=(8, 30))
+
+    smoothed = smooth_matrix(values, method="lowess", processes=2, n_records=10)
+
+    np.testing.assert_allclose(
+        smoothed, per_location(values, "lowess", n_records=10), rtol=1e-9
+    )
@@ -0,0 +1,117 @@
+import os
+from datetime import date
+
+from analysis.storage import (
+    LocalStorage,
+    S3Storage,
+    listing_prefixes,
+    select_archives,
+    select_daily,
+)
+
+
+class FakeS3:
+    """list_objects_v2 pagination over a fixed set of keys, counting calls."""
+
+    def __init__(self, keys):
+        self.keys = sorted(keys)
+        self.lists = []
+
+    def get_paginator(self, name):
+        return self
+
+    def paginate(self, Bucket, Prefix):
+        self.lists.append(Prefix)
+        contents = [
+            {"Key": k, "ETag": f'"{k}"'} for k in self.keys if k.startswith(Prefix)
+        ]
+        yield {"Contents": contents}
+
+
+KEYS = [
+    "20240531_current.jsonl.gz",
+    "20240601_current.jsonl.gz",
+    "20240601_historic.jsonl.gz",
+    "current/2024/06/20240602_current.jsonl.gz",
+    "current/2024/07/20240701_current.jsonl",
+    "current/2024/05/202405_current.npz",
+    "historic_manifest.json",
+]
+
+
+def test_select_daily_filters_period_and_range():
+    assert select_daily(KEYS, "current", "20240601", "20240630") == [
+        "20240601_current.jsonl.gz",
+        "current/2024/06/20240602_current.jsonl.gz",
+    ]
+    assert select_daily(KEYS, "historic") == ["20240601_historic.jsonl.gz"]
+
+
+def test_select_daily_prefers_uncompressed_copy():
+    keys = ["20240601_current.jsonl.gz", "20240601_current.jsonl"]
+    assert select_daily(keys, "current") == ["20240601_current.jsonl"]
+
+
+def test_select_archives_overlapping_months():
+    assert select_archives(KEYS, "current", "20240515", "20240605") == [
+        "current/2024/05/202405_current.npz"
+    ]
+    assert select_archives(KEYS, "current", "20240601", None) == []
+
+
+def test_listing_prefixes_cover_both_layouts():
+    assert listing_prefixes(["current"], "20240530", "20240602") == [
+        "202405",
+        "current/2024/05/",
+        "202406",
+        "current/2024/06/",
+    ]
+    assert listing_prefixes(["current"], None, None) == [""]
+
+
+def test_open_ended_s3_range_stops_at_today():
+    s3 = FakeS3(KEYS)
+    storage = S3Storage("bucket", cache_dir=None, s3_client=s3)
+
+    keys = storage.find("current", "2024-06-01")
+
+    assert keys == [
+        "20240601_current.jsonl.gz",
+        "current/2024/06/20240602_current.jsonl.gz",
+        "current/2024/07/20240701_current.jsonl",
+    ]
+    today = date.today()
+    months = (today.year - 2024) * 12 + today.month - 6 + 1
+    assert len(s3.lists) == 2 * months
+
+
+def test_s3_listing_is_reused():
+    s3 = FakeS3(KEYS)
+    storage = S3Storage("bucket", cache_dir=None, s3_client=s3)
+
+    storage.find("current")
+    storage.find_archives("current")
+    storage.find("current", "2024-06-01", "2024-06-30")
+
+    assert s3.lists == [""]
+
+
+def test_local_listing_is_reused_until_a_write(tmp_path, monkeypatch):
+    (tmp_path / "20240601_current.jsonl").write_text("")
+    storage = LocalStorage(tmp_path)
+    walks = []
+    walk = os.walk
+    monkeypatch.setattr(
+        "analysis.storage.os.walk", lambda root: walks.append(root) or walk(root)
+    )
+
+    assert storage.find("current") == ["20240601_current.jsonl"]
+    assert storage.find_archives("current") == []
+    assert len(walks) == 1
+
+    storage.write_bytes("20240602_current.jsonl", b"")
+    assert storage.find("current") == [
+        "20240601_current.jsonl",
+        "20240602_current.jsonl",
+    ]
+    assert len(walks) == 2
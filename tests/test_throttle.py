@@ -0,0 +1,26 @@
+import time
+
+from lambda_src.throttle import AdaptiveLimiter
+
+
+def test_reset_restores_initial_rate_and_concurrency():
+    limiter = AdaptiveLimiter(rate=10.0, concurrency=4)
+    for _ in range(3):
+        limiter.acquire()
+        limiter.release(congested=True)
+    limiter.pause(60)
+    assert limiter.rate < 10.0 and limiter.concurrency < 4
+
+    limiter.reset()
+
+    assert limiter.stats() == {
+        "requests": 0,
+        "congested": 0,
+        "rate": 10.0,
+        "concurrency": 4,
+    }
+    # The pause is lifted too, so the next run can start straight away
+    started = time.monotonic()
+    limiter.acquire()
+    limiter.release()
+    assert time.monotonic() - started < 1.0